@@ -6,23 +6,41 @@ Usage:
     (or via installed entry point: entry-checker)
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Optional
 
 from entry_checking.lib.parsing.csv_reader import read_entries
-from entry_checking.lib.parsing.multi_dance_resolver import resolve_dance_names
-from entry_checking.lib.parsing.row_parser import is_tba_row
+from entry_checking.lib.parsing.entry_table import EntryTable, build_entry_table
 from entry_checking.lib.report_view import build_report_view
 from entry_checking.lib.rules.eligibility_checker import EligibilityChecker
 from entry_checking.lib.rules.level_rules_checker import LevelRulesChecker
 from entry_checking.lib.rules.violations import EligibilityResult, LevelViolation
 from utils.lib import competition
+from utils.lib.api.cache import DancerRecordCache
+from utils.lib.api.client import DancerLookupClient, DancerRecord
 from utils.lib.constants import RookieVetLevel, SyllabusLevel
+from utils.lib.jobs import ProgressCallback
 from utils.lib.models.dance import Dance
 from utils.lib.models.dancer import Dancer
 from utils.lib.models.entry import Entry
 from utils.lib.models.partnership import Partnership
 
+_DANCER_CACHE_PATH = Path("data/cache/dancers.sqlite3")
+
+
+@dataclass
+class CheckTimings:
+    """Wall-clock seconds one EntryChecker.check() spent in each phase."""
+
+    parse: float  # preprocessing raw_data into an EntryTable
+    lookup: float  # resolving every dancer (see EntryChecker.prefetch_dancers())
+    rules: float  # registering and checking every entry
+
 
 class EntryChecker:
     """Runs eligibility and level-rule checks over a Competition's entries.
@@ -37,16 +55,44 @@ class EntryChecker:
     pair and are the building blocks check() is written in terms of — they're
     also what a future live-registration caller would call directly, one
     entry at a time. Such a caller needs to submit Rookie/Vet entries last,
-    for the same reason check() does — see check()'s docstring.
+    for the same reason check() does — see check()'s docstring. check()
+    itself looks every dancer up before registering anything (see
+    prefetch_dancers()), so its rule pass never waits on the network.
     """
 
-    def __init__(self, comp: "competition.Competition"):
+    def __init__(
+        self,
+        comp: "competition.Competition",
+        lookup: Optional[Callable[[str, str], DancerRecord]] = None,
+        max_lookup_workers: int = 8,
+    ):
+        """Create an EntryChecker.
+
+        Args:
+            comp: The Competition whose entries to check.
+            lookup: Fetches a DancerRecord for a first/last name, called
+                once for each dancer in comp's raw data not already in
+                comp.competitors (e.g. a DancerRecordCache). Defaults to
+                None, meaning Dancer.from_api() - the live CDA API,
+                uncached. Must be safe to call from several threads at once
+                (see prefetch_dancers()).
+            max_lookup_workers: The most lookups prefetch_dancers() keeps
+                in flight at once - bounded so a large entry sheet doesn't
+                flood the CDA points database with simultaneous requests.
+        """
+        if max_lookup_workers < 1:
+            raise ValueError(f"max_lookup_workers must be >= 1, got {max_lookup_workers}")
         self.comp = comp
+        self._lookup = lookup
+        self._max_lookup_workers = max_lookup_workers
+        # How long the most recent check() spent in each phase.
+        self.timings: Optional[CheckTimings] = None
         self.eligibility_checker = EligibilityChecker(comp.rv_ruleset, comp.rookie_max_level)
         # Level violations already surfaced for a dancer, keyed by
-        # (style, violation_type, levels) — lets register_entry() report each
-        # violation once, at the entry that first causes it, instead of again
-        # on every later entry that happens to still trigger it.
+        # (style, dance, violation_type, levels) — lets register_entry()
+        # report each violation once, at the entry that first causes it,
+        # instead of again on every later entry that happens to still
+        # trigger it.
         self._seen_level_violations: dict[str, set[tuple]] = {}
 
     def check_entry(
@@ -95,9 +141,14 @@ class EntryChecker:
         self.comp.entries.add(Entry(dance_obj, partnership_obj, heat))
 
         new_violations: list[LevelViolation] = []
+        # Only dance_obj's dance and style span can have changed, so only
+        # those are re-checked - checking a whole competition stays linear
+        # in its entries.
         for dancer_obj in (partnership_obj.lead, partnership_obj.follow):
             seen = self._seen_level_violations.setdefault(dancer_obj.name, set())
-            for violation in LevelRulesChecker.check(dancer_obj, self.comp.consecutive_level_limit):
+            for violation in LevelRulesChecker.check_entry(
+                dancer_obj, dance_obj, self.comp.consecutive_level_limit
+            ):
                 key = (
                     violation.style,
                     violation.dance,
@@ -110,9 +161,18 @@ class EntryChecker:
 
         return result, new_violations
 
-    def check(self) -> tuple[list[EligibilityResult], list[LevelViolation]]:
+    def check(
+        self, progress: Optional[ProgressCallback] = None
+    ) -> tuple[list[EligibilityResult], list[LevelViolation]]:
         """Check all of the competition's entries.
 
+        Runs in three phases, timed into self.timings: comp.raw_data is
+        preprocessed into an EntryTable (see
+        entry_checking.lib.parsing.entry_table), which drops TBA rows and
+        resolves each distinct event's dances once; every dancer in it is
+        looked up concurrently (see prefetch_dancers()); then every entry
+        is registered and checked, with no further lookups.
+
         Rookie/Vet entries are registered after every other entry,
         regardless of their row order in the source data - the "newcomer"
         ruleset's Rookie/Vet checks look at a dancer's *other* entries in
@@ -121,6 +181,12 @@ class EntryChecker:
         other entries need to already be registered for the check to see
         an accurate, order-independent picture.
 
+        Args:
+            progress: Called as progress(phase, detail) as the check moves
+                through its phases - ("parse", "N rows") once the rows are
+                preprocessed, ("lookup", "k/n dancers") as dancers resolve,
+                and ("rules", "k/n entries") as entries are checked (every
+                1% of them, not every one).
         Returns:
             A tuple of (eligibility_results, level_violations).
             eligibility_results includes every ineligible entry and every
@@ -134,22 +200,19 @@ class EntryChecker:
         regular_entries = []
         rookie_vet_entries = []
 
-        for _, row in comp.raw_data.iterrows():
-            if is_tba_row(row):
-                continue
-
-            lead_first, lead_last = row["Lead First"], row["Lead Last"]
-            follow_first, follow_last = row["Follow First"], row["Follow Last"]
-
-            partners = []
-            for first, last in [(lead_first, lead_last), (follow_first, follow_last)]:
-                full_name = first + " " + last
-                partners.append(full_name)
-                if full_name not in comp.competitors:
-                    comp.competitors[full_name] = Dancer.from_api(
-                        curr_comp_date=comp.comp_date, first=first, last=last
-                    )
-
+        started = time.perf_counter()
+        table = build_entry_table(comp.raw_data)
+        parsed = time.perf_counter()
+        if progress is not None:
+            progress("parse", f"{len(table)} rows")
+        self.prefetch_dancers(table, progress)
+        looked_up = time.perf_counter()
+
+        for i in range(len(table)):
+            partners = [
+                table.lead_first[i] + " " + table.lead_last[i],
+                table.follow_first[i] + " " + table.follow_last[i],
+            ]
             partnership_name = " & ".join(partners)
             lead_obj = comp.competitors[partners[0]]
             follow_obj = comp.competitors[partners[1]]
@@ -157,18 +220,19 @@ class EntryChecker:
                 comp.partnerships[partnership_name] = Partnership(lead_obj, follow_obj)
 
             partnership_obj = comp.partnerships[partnership_name]
-            level, style = row["Skill"], row["Style"]
-            heat = row["Heat"] if "Heat" in comp.raw_data.columns else None
-
-            dance_names = resolve_dance_names(row["Dance"], style)
-            event_dances = tuple(Dance(level, style, name) for name in dance_names)
+            heat = table.heats[i]
+            event_dances = table.events[table.event_codes[i]]
             for dance_obj in event_dances:
                 if dance_obj.level in (RookieVetLevel.ROOKIE_LEAD, RookieVetLevel.ROOKIE_FOLLOW):
                     rookie_vet_entries.append((partnership_obj, dance_obj, heat, event_dances))
                 else:
                     regular_entries.append((partnership_obj, dance_obj, heat, event_dances))
 
-        for partnership_obj, dance_obj, heat, event_dances in regular_entries + rookie_vet_entries:
+        ordered_entries = regular_entries + rookie_vet_entries
+        report_every = max(1, len(ordered_entries) // 100)
+        for checked, (partnership_obj, dance_obj, heat, event_dances) in enumerate(
+            ordered_entries, start=1
+        ):
             result, new_violations = self.register_entry(
                 partnership_obj, dance_obj, heat, event_dances
             )
@@ -176,9 +240,70 @@ class EntryChecker:
             if not result.eligible or result.is_split_level:
                 eligibility_results.append(result)
             level_violations.extend(new_violations)
-
+            if progress is not None and (
+                checked % report_every == 0 or checked == len(ordered_entries)
+            ):
+                progress("rules", f"{checked}/{len(ordered_entries)} entries")
+
+        self.timings = CheckTimings(
+            parse=parsed - started,
+            lookup=looked_up - parsed,
+            rules=time.perf_counter() - looked_up,
+        )
         return eligibility_results, level_violations
 
+    def prefetch_dancers(
+        self, table: EntryTable, progress: Optional[ProgressCallback] = None
+    ) -> None:
+        """Looks up every dancer in table not already in comp.competitors,
+        concurrently, and adds them.
+
+        Each dancer is fetched exactly once, however many entries they
+        have, and added to comp.competitors in order of first appearance -
+        the same competitors check() used to build one lookup at a time.
+        If given, progress is called as ("lookup", "k/n dancers") before the
+        first lookup and after each one, from the thread that made it.
+
+        Raises:
+            DancerLookupError: if any lookup fails (propagated from the
+                lookup function) - before any entry is registered.
+        """
+        names: dict[str, tuple[str, str]] = {}
+        for i in range(len(table)):
+            for first, last in (
+                (table.lead_first[i], table.lead_last[i]),
+                (table.follow_first[i], table.follow_last[i]),
+            ):
+                full_name = first + " " + last
+                if full_name not in self.comp.competitors:
+                    names.setdefault(full_name, (first, last))
+        if progress is not None:
+            progress("lookup", f"0/{len(names)} dancers")
+        if not names:
+            return
+
+        lock = threading.Lock()
+        resolved = 0
+
+        def fetch(name: tuple[str, str]) -> Dancer:
+            nonlocal resolved
+            dancer = self._fetch_dancer(*name)
+            if progress is not None:
+                with lock:
+                    resolved += 1
+                    progress("lookup", f"{resolved}/{len(names)} dancers")
+            return dancer
+
+        workers = min(self._max_lookup_workers, len(names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            dancers = executor.map(fetch, names.values())
+            self.comp.competitors.update(zip(names.keys(), dancers))
+
+    def _fetch_dancer(self, first: str, last: str) -> Dancer:
+        if self._lookup is None:
+            return Dancer.from_api(curr_comp_date=self.comp.comp_date, first=first, last=last)
+        return Dancer.from_data(self.comp.comp_date, self._lookup(first, last))
+
 
 def _report(
     eligibility_results: list[EligibilityResult], level_violations: list[LevelViolation]
@@ -252,8 +377,17 @@ def main():
     comp = competition.Competition(
         comp_name, comp_date, rv_ruleset, consecutive_level_limit, rookie_max_level, raw_data
     )
-    eligibility_results, level_violations = EntryChecker(comp).check()
+    checker = EntryChecker(
+        comp, lookup=DancerRecordCache(_DANCER_CACHE_PATH, lookup=DancerLookupClient())
+    )
+    eligibility_results, level_violations = checker.check()
     _report(eligibility_results, level_violations)
+    timings = checker.timings
+    assert timings is not None
+    print(
+        f"Timing: parse {timings.parse:.2f}s, {len(comp.competitors)} dancer lookup(s) "
+        f"{timings.lookup:.2f}s, rules {timings.rules:.2f}s"
+    )
 
 
 if __name__ == "__main__":
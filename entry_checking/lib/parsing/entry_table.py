@@ -0,0 +1,96 @@
+"""Columnar preprocessing of a competition's entry rows.
+
+Turns a read_entries() DataFrame into an EntryTable: TBA rows dropped,
+dancer names normalized, and each row's Skill/Style/Dance resolved into
+its event's Dance objects - all with whole-column pandas operations, and
+the per-event dance resolution done once per distinct (Skill, Style,
+Dance) rather than once per row. A large entry export repeats a few
+hundred distinct events across thousands of rows, so this is most of the
+cost of getting from a spreadsheet to checkable entries.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from entry_checking.lib.parsing.multi_dance_resolver import resolve_dance_names
+from utils.lib.models.dance import Dance
+
+_NAME_COLUMNS = ["Lead First", "Lead Last", "Follow First", "Follow Last"]
+_EVENT_COLUMNS = ["Skill", "Style", "Dance"]
+
+
+@dataclass(frozen=True)
+class EntryTable:
+    """A competition's non-TBA entry rows, one list position per row.
+
+    Events are stored once each: row i's event is events[event_codes[i]],
+    the tuple of every Dance in it (a single-item tuple for a single-dance
+    event).
+    """
+
+    lead_first: list[str]
+    lead_last: list[str]
+    follow_first: list[str]
+    follow_last: list[str]
+    heats: list[Any]  # the raw Heat values, or all None with no Heat column
+    event_codes: np.ndarray
+    events: list[tuple[Dance, ...]]
+
+    def __len__(self) -> int:
+        return len(self.event_codes)
+
+
+def tba_mask(raw_data: pd.DataFrame) -> pd.Series:
+    """Flags the TBA rows of an entry DataFrame - the columnar form of
+    row_parser.is_tba_row(): a row missing any lead or follow name, either
+    as an empty cell or the literal string "NULL".
+
+    Args:
+        raw_data: An entry DataFrame (see csv_reader.read_entries()).
+    Returns:
+        A boolean Series aligned with raw_data's index.
+    """
+    mask = pd.Series(False, index=raw_data.index)
+    for column in _NAME_COLUMNS:
+        values = raw_data[column]
+        is_null_string = values.astype("string").str.strip().str.upper().eq("NULL")
+        mask |= values.isna() | is_null_string.fillna(False).astype(bool)
+    return mask
+
+
+def build_entry_table(raw_data: pd.DataFrame) -> EntryTable:
+    """Preprocesses an entry DataFrame into an EntryTable.
+
+    Args:
+        raw_data: An entry DataFrame (see csv_reader.read_entries()).
+    Returns:
+        The EntryTable of raw_data's non-TBA rows, in their original order.
+    Raises:
+        ValueError: If a row's style, level, or dance isn't recognized (see
+            the convert_*() functions in utils.lib.models.dance).
+    """
+    rows = raw_data[~tba_mask(raw_data)]
+    names = {column: rows[column].astype(str).str.strip().tolist() for column in _NAME_COLUMNS}
+    heats = rows["Heat"].tolist() if "Heat" in rows.columns else [None] * len(rows)
+
+    # Number each distinct event in order of first appearance, then resolve
+    # each one's dances once.
+    event_keys = rows[_EVENT_COLUMNS]
+    event_codes = event_keys.groupby(_EVENT_COLUMNS, sort=False, dropna=False).ngroup().to_numpy()
+    events = [
+        tuple(Dance(level, style, name) for name in resolve_dance_names(dances, style))
+        for level, style, dances in event_keys.drop_duplicates().itertuples(index=False)
+    ]
+
+    return EntryTable(
+        lead_first=names["Lead First"],
+        lead_last=names["Lead Last"],
+        follow_first=names["Follow First"],
+        follow_last=names["Follow Last"],
+        heats=heats,
+        event_codes=event_codes,
+        events=events,
+    )
@@ -152,19 +152,16 @@ class EligibilityChecker:
         # one dance - otherwise this determination could arbitrarily
         # disagree depending on which of the combo's dances happened to be
         # checked.
-        lead_level = max(
-            ProficiencyCalculator.compute_proficiency_level(
-                partnership.lead, dance_obj.style, d.dance
-            )
-            for d in event_dances
-        )
-        follow_level = max(
-            ProficiencyCalculator.compute_proficiency_level(
-                partnership.follow, dance_obj.style, d.dance
-            )
-            for d in event_dances
+        event_dance_names = [d.dance for d in event_dances]
+        lead_level = ProficiencyCalculator.compute_proficiency_table(partnership.lead).max_level(
+            dance_obj.style, event_dance_names
         )
-        event_level = constants.LEVELS.index(dance_obj.level)
+        follow_level = ProficiencyCalculator.compute_proficiency_table(
+            partnership.follow
+        ).max_level(dance_obj.style, event_dance_names)
+        event_level = dance_obj.level_idx
+        # Nightclub and Rookie-Vet events were all decided above.
+        assert event_level is not None
 
         # Check for Split-Level Exception
         combined_level = ProficiencyCalculator.compute_split_level_combined_level(
@@ -258,7 +255,7 @@ class EligibilityChecker:
         are otherwise identical.
         """
         curr_style = dance_obj.style
-        disqualifying_level_idx = constants.SYLLABUS_LEVELS.index(self.rookie_max_level) + 1
+        disqualifying_level_idx = constants.SYLLABUS_LEVEL_INDEX[self.rookie_max_level] + 1
 
         rookie_is_newcomer = rookie.is_newcomer()
         rookie_pointed_out_of_newcomer = ProficiencyCalculator.has_pointed_out(
@@ -3,11 +3,16 @@
 Provides the LevelRulesChecker for validating that dancers don't register
 for too many or non-consecutive levels of any single dance, or too wide a
 range of levels overall within a style.
+
+check() evaluates a dancer's whole entry set; check_entry() re-evaluates
+only the style/dance one new entry touched, for registering entries one
+at a time.
 """
 
 from entry_checking.lib.rules.violations import LevelViolation, LevelViolationType
 from utils.lib import constants
 from utils.lib.constants import Style
+from utils.lib.models.dance import Dance
 from utils.lib.models.dancer import Dancer
 
 
@@ -46,84 +51,140 @@ class LevelRulesChecker:
 
         for entry_obj in dancer.entries:
             style = entry_obj.dance_data.style
-            level = entry_obj.dance_data.level
+            level_idx = entry_obj.dance_data.level_idx
             dance = entry_obj.dance_data.dance
-            if style in dance_levels and level in constants.LEVELS:
-                dance_levels[style].setdefault(dance, set()).add(constants.LEVELS.index(level))
+            if style in dance_levels and level_idx is not None:
+                dance_levels[style].setdefault(dance, set()).add(level_idx)
 
         for style, dances in dance_levels.items():
             if not dances:
                 continue
 
             all_levels = {level_idx for levels in dances.values() for level_idx in levels}
-            span = max(all_levels) - min(all_levels)
-            if span > consecutive_level_limit:
-                sorted_all = sorted(all_levels)
-                violations.append(
-                    LevelViolation(
-                        dancer_name=dancer.name,
-                        style=style,
-                        violation_type=LevelViolationType.SPAN_TOO_WIDE,
-                        levels=sorted_all,
-                        detail_message=(
-                            f"CONSECUTIVE LEVEL VIOLATION: {dancer.name} is registered "
-                            f"across too wide a range of {style} levels (at most "
-                            f"{consecutive_level_limit + 1} distinct levels allowed):\n"
-                            + "\n".join(
-                                f"\t{dancer.name} is registered for at least one dance "
-                                f"in '{constants.LEVELS[i]} {style}'."
-                                for i in sorted_all
-                            )
-                        ),
+            violations.extend(
+                _span_violations(dancer.name, style, sorted(all_levels), consecutive_level_limit)
+            )
+            for dance, level_set in dances.items():
+                violations.extend(
+                    _dance_violations(
+                        dancer.name, style, dance, sorted(level_set), consecutive_level_limit
                     )
                 )
 
-            for dance, level_set in dances.items():
-                sorted_levels = sorted(level_set)
-
-                if len(level_set) > consecutive_level_limit:
-                    violations.append(
-                        LevelViolation(
-                            dancer_name=dancer.name,
-                            style=style,
-                            violation_type=LevelViolationType.TOO_MANY_LEVELS,
-                            levels=sorted_levels,
-                            dance=dance,
-                            detail_message=(
-                                f"CONSECUTIVE LEVEL VIOLATION: {dancer.name} is registered "
-                                f"for more than {consecutive_level_limit} level(s) of "
-                                f"{style} {dance}:\n"
-                                + "\n".join(
-                                    f"\t{dancer.name} is registered for "
-                                    f"'{constants.LEVELS[i]} {style} {dance}'."
-                                    for i in sorted_levels
-                                )
-                            ),
-                        )
-                    )
+        return violations
 
-                else:
-                    curr_idx, next_idx = 0, 1
-                    while next_idx < len(sorted_levels):
-                        if sorted_levels[next_idx] - sorted_levels[curr_idx] != 1:
-                            level_name_1 = constants.LEVELS[sorted_levels[curr_idx]]
-                            level_name_2 = constants.LEVELS[sorted_levels[next_idx]]
-                            violations.append(
-                                LevelViolation(
-                                    dancer_name=dancer.name,
-                                    style=style,
-                                    violation_type=LevelViolationType.NON_CONSECUTIVE,
-                                    levels=[sorted_levels[curr_idx], sorted_levels[next_idx]],
-                                    dance=dance,
-                                    detail_message=(
-                                        f"CONSECUTIVE LEVEL VIOLATION: {dancer.name} is "
-                                        f"registered for at least one event in both "
-                                        f"'{level_name_1} {style} {dance}' and "
-                                        f"'{level_name_2} {style} {dance}'."
-                                    ),
-                                )
-                            )
-                        curr_idx += 1
-                        next_idx += 1
+    @staticmethod
+    def check_entry(
+        dancer: Dancer, dance_obj: Dance, consecutive_level_limit: int = 2
+    ) -> list[LevelViolation]:
+        """Re-checks only what registering dance_obj for dancer can have
+        changed: dance_obj's own dance, and its style's overall level range.
 
-        return violations
+        Every violation check() finds elsewhere is untouched by this entry,
+        so a caller registering entries one at a time (see
+        EntryChecker.register_entry()) gets every violation check() would
+        report for the touched style/dance, from the dancer's entry indexes
+        rather than a scan of all their entries.
+
+        Args:
+            dancer: The Dancer dance_obj was just registered for.
+            dance_obj: The newly registered dance.
+            consecutive_level_limit: Same as check()'s.
+        Returns:
+            check()'s violations for dance_obj's style span and dance, in
+            check()'s order (empty for a dance outside the points levels/
+            styles, which check() ignores too).
+        """
+        style = dance_obj.style
+        if dance_obj.level_idx is None or style not in Style.points_eligible_styles():
+            return []
+        return _span_violations(
+            dancer.name, style, dancer.entered_levels(style), consecutive_level_limit
+        ) + _dance_violations(
+            dancer.name,
+            style,
+            dance_obj.dance,
+            dancer.entered_levels(style, dance_obj.dance),
+            consecutive_level_limit,
+        )
+
+
+def _span_violations(
+    dancer_name: str, style: Style, sorted_all: list[int], consecutive_level_limit: int
+) -> list[LevelViolation]:
+    """The style-wide check: sorted_all (every level index registered in
+    style) may span at most consecutive_level_limit + 1 levels."""
+    if not sorted_all or sorted_all[-1] - sorted_all[0] <= consecutive_level_limit:
+        return []
+    return [
+        LevelViolation(
+            dancer_name=dancer_name,
+            style=style,
+            violation_type=LevelViolationType.SPAN_TOO_WIDE,
+            levels=sorted_all,
+            detail_message=(
+                f"CONSECUTIVE LEVEL VIOLATION: {dancer_name} is registered "
+                f"across too wide a range of {style} levels (at most "
+                f"{consecutive_level_limit + 1} distinct levels allowed):\n"
+                + "\n".join(
+                    f"\t{dancer_name} is registered for at least one dance "
+                    f"in '{constants.LEVELS[i]} {style}'."
+                    for i in sorted_all
+                )
+            ),
+        )
+    ]
+
+
+def _dance_violations(
+    dancer_name: str,
+    style: Style,
+    dance: str,
+    sorted_levels: list[int],
+    consecutive_level_limit: int,
+) -> list[LevelViolation]:
+    """The per-dance checks: sorted_levels (the level indices registered
+    for one dance) may number at most consecutive_level_limit, with no
+    level skipped between them."""
+    if len(sorted_levels) > consecutive_level_limit:
+        return [
+            LevelViolation(
+                dancer_name=dancer_name,
+                style=style,
+                violation_type=LevelViolationType.TOO_MANY_LEVELS,
+                levels=sorted_levels,
+                dance=dance,
+                detail_message=(
+                    f"CONSECUTIVE LEVEL VIOLATION: {dancer_name} is registered "
+                    f"for more than {consecutive_level_limit} level(s) of "
+                    f"{style} {dance}:\n"
+                    + "\n".join(
+                        f"\t{dancer_name} is registered for "
+                        f"'{constants.LEVELS[i]} {style} {dance}'."
+                        for i in sorted_levels
+                    )
+                ),
+            )
+        ]
+
+    violations = []
+    for lower, upper in zip(sorted_levels, sorted_levels[1:]):
+        if upper - lower != 1:
+            level_name_1 = constants.LEVELS[lower]
+            level_name_2 = constants.LEVELS[upper]
+            violations.append(
+                LevelViolation(
+                    dancer_name=dancer_name,
+                    style=style,
+                    violation_type=LevelViolationType.NON_CONSECUTIVE,
+                    levels=[lower, upper],
+                    dance=dance,
+                    detail_message=(
+                        f"CONSECUTIVE LEVEL VIOLATION: {dancer_name} is "
+                        f"registered for at least one event in both "
+                        f"'{level_name_1} {style} {dance}' and "
+                        f"'{level_name_2} {style} {dance}'."
+                    ),
+                )
+            )
+    return violations
@@ -37,9 +37,10 @@ class RecommendedLevelsCalculator:
             ValueError: if style is not eligible for points (e.g. Nightclub).
         """
         level_idx = max(
-            ProficiencyCalculator.compute_proficiency_level(dancer, style, dance_name)
+            ProficiencyCalculator.compute_proficiency_table(dancer).max_level(
+                style, constants.DANCE_NAMES[style]
+            )
             for dancer in (partnership.lead, partnership.follow)
-            for dance_name in constants.DANCE_NAMES[style]
         )
 
         if level_idx + 1 < len(constants.LEVELS):
@@ -8,30 +8,51 @@ Usage:
 
 import os
 import pathlib
+from typing import Callable, Optional
 
 from flask import Flask
 
 from entry_checking.lib.webapp import routes
+from utils.lib.api.cache import DancerRecordCache
+from utils.lib.api.client import DancerLookupClient, DancerRecord
+from utils.lib.jobs import JobManager
 
 # templates/ and static/ are siblings of this file within webapp/.
 _PACKAGE_ROOT = pathlib.Path(__file__).resolve().parent
 
+_DANCER_CACHE_PATH = pathlib.Path("data/cache/dancers.sqlite3")
 
-def create_app() -> Flask:
-    """Build and configure the entry-checker Flask app."""
+
+def create_app(
+    dancer_lookup: Optional[Callable[[str, str], DancerRecord]] = None,
+    job_manager: Optional[JobManager] = None,
+) -> Flask:
+    """Build and configure the entry-checker Flask app.
+
+    Args:
+        dancer_lookup: Forwarded to every check's EntryChecker (see
+            run_check()) - None means the live CDA API, uncached.
+        job_manager: Runs every check submitted through the form or
+            /api/jobs (see routes.py). Defaults to a new JobManager; tests
+            inject their own so they can wait for a job to finish.
+    """
     app = Flask(
         "entry_checking.lib.webapp",
         template_folder=str(_PACKAGE_ROOT / "templates"),
         static_folder=str(_PACKAGE_ROOT / "static"),
     )
     app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024  # 10 MB
+    app.config["DANCER_LOOKUP"] = dancer_lookup
+    app.config["JOB_MANAGER"] = job_manager if job_manager is not None else JobManager()
     app.register_blueprint(routes.bp)
     return app
 
 
 def main() -> None:
     """Run the entry-checker web UI locally."""
-    create_app().run(debug=os.environ.get("FLASK_DEBUG") == "1")
+    create_app(
+        dancer_lookup=DancerRecordCache(_DANCER_CACHE_PATH, lookup=DancerLookupClient())
+    ).run(debug=os.environ.get("FLASK_DEBUG") == "1")
 
 
 if __name__ == "__main__":
@@ -2,18 +2,25 @@
 
 Both routes.py's HTML form handler and its JSON API handler call run_check()
 so the parse -> Competition -> EntryChecker.check() -> error-normalization
-sequence exists in exactly one place.
+sequence exists in exactly one place. The HTML form (and /api/jobs) run it
+as a background job (see utils.lib.jobs), so run_check() reports which of
+PHASES it's in as it goes.
 """
 
 from dataclasses import dataclass
 from datetime import date
-from typing import IO, Union
+from typing import IO, Callable, Optional, Union
 
 from entry_checking.lib.entry_checker import EntryChecker
 from entry_checking.lib.parsing.csv_reader import read_entries
 from entry_checking.lib.report_view import ReportView, build_report_view
 from utils.lib import competition
-from utils.lib.api.client import DancerLookupError
+from utils.lib.api.client import DancerLookupError, DancerRecord
+from utils.lib.jobs import ProgressCallback
+
+# run_check()'s phases, in order: reading and preprocessing the rows,
+# resolving every dancer, then checking every entry.
+PHASES = ("parse", "lookup", "rules")
 
 
 @dataclass
@@ -38,6 +45,8 @@ def run_check(
     rookie_max_level: str,
     consecutive_level_limit_str: str,
     csv_source: Union[str, "IO[bytes]", "IO[str]"],
+    lookup: Optional[Callable[[str, str], DancerRecord]] = None,
+    progress: Optional[ProgressCallback] = None,
 ) -> CheckSuccess | CheckError:
     """Run a full entry check from raw form/request input.
 
@@ -49,10 +58,18 @@ def run_check(
         consecutive_level_limit_str: The consecutive-level limit, as a string.
         csv_source: The uploaded entry spreadsheet - a path or a file-like
                     object (e.g. a Werkzeug FileStorage's .stream).
+        lookup: Forwarded to EntryChecker - None means the live CDA API,
+                uncached.
+        progress: Called as progress(phase, detail) on entering each of
+                  PHASES, and again with an updated detail (rows parsed,
+                  dancers resolved, entries checked) as the check goes -
+                  see EntryChecker.check().
     Returns:
         A CheckSuccess with the report to display, or a CheckError describing
         what went wrong and what HTTP status to report it under.
     """
+    if progress is not None:
+        progress("parse")
     try:
         raw_data = read_entries(csv_source)
     except ValueError as e:
@@ -74,7 +91,7 @@ def run_check(
         comp = competition.Competition(
             comp_name, comp_date, rv_ruleset, consecutive_level_limit, rookie_max_level, raw_data
         )
-        eligibility_results, level_violations = EntryChecker(comp).check()
+        eligibility_results, level_violations = EntryChecker(comp, lookup=lookup).check(progress)
     except ValueError as e:
         # Covers an invalid rv_ruleset/rookie_max_level - unreachable via the
         # HTML form's constrained dropdowns, but reachable via /api/check.
@@ -1,8 +1,39 @@
-"""HTML and JSON routes for the entry-checker web UI."""
-
-from flask import Blueprint, jsonify, render_template, request
-
+"""HTML and JSON routes for the entry-checker web UI.
+
+Submitting the form starts the check as a background job (see
+utils.lib.jobs) and redirects to that job's page, which follows its
+progress via /jobs/<id>/events and shows the report once it's done -
+reloading the page shows the stored report rather than rerunning the check.
+/api/jobs does the same for scripts; /api/check still checks inline.
+"""
+
+import hashlib
+import io
+from typing import Any
+
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
+
+from entry_checking.lib.report_view import ReportView
 from entry_checking.lib.webapp.check_service import CheckError, run_check
+from utils.lib.jobs import (
+    DONE,
+    FAILED,
+    Job,
+    JobFailed,
+    JobManager,
+    ProgressCallback,
+    fingerprint,
+    job_events,
+)
 
 bp = Blueprint("entry_checker_web", __name__)
 
@@ -14,12 +45,30 @@ _DEFAULT_FORM_VALUES = {
     "consecutive_level_limit": "2",
 }
 
+_PHASE_LABELS = {
+    None: "Waiting to start",
+    "parse": "Reading entries",
+    "lookup": "Looking up dancers",
+    "rules": "Checking entries",
+}
+
+_MISSING_FILE_MESSAGE = "Please choose a CSV file to upload."
+
 
 def _form_values() -> dict[str, str]:
     """Extract the current request's form fields, falling back to defaults."""
     return {key: request.form.get(key, default) for key, default in _DEFAULT_FORM_VALUES.items()}
 
 
+def _api_form_values() -> dict[str, str]:
+    """Extract the current request's form fields the way the JSON API always
+    has - blank rather than the HTML form's defaults, except
+    rookie_max_level (unused under the "level" ruleset)."""
+    values = {key: request.form.get(key, "") for key in _DEFAULT_FORM_VALUES}
+    values["rookie_max_level"] = request.form.get("rookie_max_level", "Bronze")
+    return values
+
+
 @bp.route("/", methods=["GET", "POST"])
 def index():
     if request.method == "GET":
@@ -29,10 +78,52 @@ def index():
 
     csv_file = request.files.get("entries_csv")
     if csv_file is None or not csv_file.filename:
-        return render_template(
-            "index.html", form_values=form_values, error="Please choose a CSV file to upload."
+        return render_template("index.html", form_values=form_values, error=_MISSING_FILE_MESSAGE)
+
+    job = _submit_check(form_values, csv_file.read())
+    return redirect(url_for(".job_page", job_id=job.id), code=303)
+
+
+@bp.route("/jobs/<job_id>")
+def job_page(job_id: str):
+    job = _job_manager().get(job_id)
+    if job is None:
+        return (
+            render_template(
+                "index.html",
+                form_values=_DEFAULT_FORM_VALUES,
+                error="That check is no longer available - please run it again.",
+            ),
+            404,
         )
 
+    form_values = job.params["form_values"]
+    if not job.finished:
+        return render_template("index.html", form_values=form_values, job=_describe(job))
+    if job.status == FAILED:
+        return render_template("index.html", form_values=form_values, error=job.error)
+    return render_template("index.html", form_values=form_values, report_view=job.result)
+
+
+@bp.route("/jobs/<job_id>/events")
+def job_progress_events(job_id: str):
+    manager = _job_manager()
+    if manager.get(job_id) is None:
+        return Response("Unknown job.", status=404, mimetype="text/plain")
+    return Response(
+        job_events(manager, job_id, _describe),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@bp.route("/api/check", methods=["POST"])
+def api_check():
+    csv_file = request.files.get("entries_csv")
+    if csv_file is None or not csv_file.filename:
+        return jsonify({"error": _MISSING_FILE_MESSAGE}), 400
+
+    form_values = _api_form_values()
     result = run_check(
         form_values["comp_name"],
         form_values["comp_date"],
@@ -40,41 +131,100 @@ def index():
         form_values["rookie_max_level"],
         form_values["consecutive_level_limit"],
         csv_file.stream,
+        lookup=current_app.config["DANCER_LOOKUP"],
     )
 
     if isinstance(result, CheckError):
-        return render_template("index.html", form_values=form_values, error=result.message)
+        return jsonify({"error": result.message}), result.status_code
 
-    return render_template("index.html", form_values=form_values, report_view=result.report_view)
+    return jsonify(_report_json(result.report_view)), 200
 
 
-@bp.route("/api/check", methods=["POST"])
-def api_check():
+@bp.route("/api/jobs", methods=["POST"])
+def api_submit_job():
     csv_file = request.files.get("entries_csv")
     if csv_file is None or not csv_file.filename:
-        return jsonify({"error": "Please choose a CSV file to upload."}), 400
-
-    result = run_check(
-        request.form.get("comp_name", ""),
-        request.form.get("comp_date", ""),
-        request.form.get("rv_ruleset", ""),
-        request.form.get("rookie_max_level", "Bronze"),
-        request.form.get("consecutive_level_limit", ""),
-        csv_file.stream,
-    )
-
-    if isinstance(result, CheckError):
-        return jsonify({"error": result.message}), result.status_code
+        return jsonify({"error": _MISSING_FILE_MESSAGE}), 400
 
+    job = _submit_check(_api_form_values(), csv_file.read())
     return (
         jsonify(
-            {
-                "split_level_notes": result.report_view.split_level_notes,
-                "groups": [
-                    {"subject_name": subject_name, "messages": messages}
-                    for subject_name, messages in result.report_view.groups
-                ],
-            }
+            dict(
+                _describe(job),
+                status_url=url_for(".api_job_status", job_id=job.id),
+                events_url=url_for(".job_progress_events", job_id=job.id),
+            )
         ),
-        200,
+        202,
     )
+
+
+@bp.route("/api/jobs/<job_id>")
+def api_job_status(job_id: str):
+    job = _job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job."}), 404
+    body = _describe(job)
+    if job.status == DONE:
+        body["report"] = _report_json(job.result)
+    return jsonify(body), 200
+
+
+def _submit_check(form_values: dict[str, str], csv_bytes: bytes) -> Job:
+    """Starts (or reuses - see JobManager.submit()) a background check of an
+    uploaded entry spreadsheet.
+
+    The upload is read into memory first, since the request's file stream
+    is closed once the request ends and the job may not have started yet.
+    """
+    # Looked up now, not when the job runs, so the job uses whatever
+    # run_check and lookup this request saw.
+    runner = run_check
+    lookup = current_app.config["DANCER_LOOKUP"]
+
+    def task(progress: ProgressCallback) -> ReportView:
+        result = runner(
+            form_values["comp_name"],
+            form_values["comp_date"],
+            form_values["rv_ruleset"],
+            form_values["rookie_max_level"],
+            form_values["consecutive_level_limit"],
+            io.BytesIO(csv_bytes),
+            lookup=lookup,
+            progress=progress,
+        )
+        if isinstance(result, CheckError):
+            raise JobFailed(result.message)
+        return result.report_view
+
+    return _job_manager().submit(
+        fingerprint({"form": form_values, "csv": hashlib.sha256(csv_bytes).hexdigest()}),
+        task,
+        params={"form_values": form_values},
+    )
+
+
+def _job_manager() -> JobManager:
+    return current_app.config["JOB_MANAGER"]
+
+
+def _describe(job: Job) -> dict[str, Any]:
+    """A job's progress, as the job page's script (and /api/jobs) reads it."""
+    return {
+        "id": job.id,
+        "status": job.status,
+        "phase": job.phase,
+        "label": _PHASE_LABELS.get(job.phase, job.phase),
+        "detail": job.detail,
+        "error": job.error,
+    }
+
+
+def _report_json(report_view: ReportView) -> dict[str, Any]:
+    return {
+        "split_level_notes": report_view.split_level_notes,
+        "groups": [
+            {"subject_name": subject_name, "messages": messages}
+            for subject_name, messages in report_view.groups
+        ],
+    }
@@ -0,0 +1,91 @@
+"""Tests for entry_checking.lib.parsing.entry_table."""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from entry_checking.lib.parsing.entry_table import build_entry_table, tba_mask
+from entry_checking.lib.parsing.row_parser import is_tba_row
+from utils.lib.models.dance import Dance
+
+
+def _entries(**overrides):
+    columns = {
+        "Style": ["Smooth", "Smooth", "Standard", "Smooth"],
+        "Dance": ["Waltz", "WT", "Waltz", "Waltz"],
+        "Skill": ["Bronze", "Silver", "Gold", "Bronze"],
+        "Lead First": ["Ford", " Ford ", "Preston", "Ford"],
+        "Lead Last": ["Ashmun", "Ashmun", "Lowe", "Ashmun"],
+        "Follow First": ["Toby", "Toby", "Elena", "Toby"],
+        "Follow Last": ["Anderson", "Anderson", "Rossi", "Anderson"],
+    }
+    columns.update(overrides)
+    return pd.DataFrame(columns)
+
+
+class TestTbaMask(unittest.TestCase):
+    """Tests for tba_mask()."""
+
+    def test_matches_is_tba_row(self):
+        raw_data = _entries(
+            **{
+                "Lead First": ["Ford", np.nan, "Preston", " null "],
+                "Follow Last": ["Anderson", "Anderson", np.nan, "Anderson"],
+            }
+        )
+        expected = [is_tba_row(row) for _, row in raw_data.iterrows()]
+        self.assertEqual(tba_mask(raw_data).tolist(), expected)
+        self.assertEqual(expected, [False, True, True, True])
+
+    def test_all_blank_name_column(self):
+        raw_data = _entries(**{"Follow First": [np.nan] * 4})
+        self.assertTrue(tba_mask(raw_data).all())
+
+
+class TestBuildEntryTable(unittest.TestCase):
+    """Tests for build_entry_table()."""
+
+    def test_names_are_stripped(self):
+        table = build_entry_table(_entries())
+        self.assertEqual(table.lead_first, ["Ford", "Ford", "Preston", "Ford"])
+
+    def test_multi_dance_event_expanded(self):
+        table = build_entry_table(_entries())
+        self.assertEqual(
+            table.events[table.event_codes[1]],
+            (Dance("Silver", "Smooth", "Waltz"), Dance("Silver", "Smooth", "Tango")),
+        )
+
+    def test_repeated_event_resolved_once(self):
+        table = build_entry_table(_entries())
+        self.assertEqual(len(table.events), 3)
+        self.assertEqual(table.event_codes.tolist(), [0, 1, 2, 0])
+        self.assertEqual(table.events[0], (Dance("Bronze", "Smooth", "Waltz"),))
+
+    def test_tba_rows_dropped(self):
+        table = build_entry_table(_entries(**{"Follow First": ["Toby", np.nan, "Elena", "NULL"]}))
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.lead_first, ["Ford", "Preston"])
+        self.assertEqual(
+            [table.events[code] for code in table.event_codes],
+            [(Dance("Bronze", "Smooth", "Waltz"),), (Dance("Gold", "Standard", "Waltz"),)],
+        )
+
+    def test_heats(self):
+        self.assertEqual(build_entry_table(_entries()).heats, [None] * 4)
+        table = build_entry_table(_entries(Heat=["1", "2", "3", "4"]))
+        self.assertEqual(table.heats, ["1", "2", "3", "4"])
+
+    def test_all_rows_tba(self):
+        table = build_entry_table(_entries(**{"Lead Last": [np.nan] * 4}))
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.events, [])
+
+    def test_unrecognized_style_raises(self):
+        with self.assertRaises(ValueError):
+            build_entry_table(_entries(Style=["Smooth", "Smooth", "Freestyle", "Smooth"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
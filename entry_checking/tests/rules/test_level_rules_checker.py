@@ -1,8 +1,18 @@
 """Tests for entry_checking.lib.rules.level_rules_checker module."""
 
+import datetime
+import random
 import unittest
+
+import numpy as np
+
 from entry_checking.lib.rules.level_rules_checker import LevelRulesChecker
+from utils.lib import constants
+from utils.lib.api.client import DancerRecord
 from utils.lib.models.dance import Dance
+from utils.lib.models.dancer import Dancer
+from utils.lib.models.entry import Entry
+from utils.lib.models.partnership import Partnership
 
 
 class _FakeEntry:
@@ -108,5 +118,71 @@ class TestLevelRulesChecker(unittest.TestCase):
         self.assertEqual(LevelRulesChecker.check(dancer, consecutive_level_limit=3), [])
 
 
+def _make_dancer(cda_id, first, last):
+    record = DancerRecord(
+        cda_id=cda_id,
+        first=first,
+        last=last,
+        first_comp_date=datetime.date(2020, 1, 1),
+        created_date="2020-01-01",
+        syllabus_pts=np.zeros((4, 19), dtype=int),
+        open_pts=np.zeros((3, 4), dtype=int),
+    )
+    return Dancer.from_data(datetime.date(2026, 1, 1), record)
+
+
+def _violation_key(violation):
+    return (violation.style, violation.dance, violation.violation_type, tuple(violation.levels))
+
+
+class TestLevelRulesCheckerCheckEntry(unittest.TestCase):
+    """Tests for LevelRulesChecker.check_entry()."""
+
+    def setUp(self):
+        self.dancer = _make_dancer(1, "Test", "Dancer")
+        self.partnership = Partnership(self.dancer, _make_dancer(2, "Other", "Partner"))
+
+    def _register(self, dance_obj):
+        Entry(dance_obj, self.partnership)
+        return LevelRulesChecker.check_entry(self.dancer, dance_obj)
+
+    def test_only_touched_dance_is_reported(self):
+        self._register(Dance("Bronze", "Standard", "Tango"))
+        self._register(Dance("Gold", "Standard", "Tango"))  # Tango gap, already reported
+        violations = self._register(Dance("Silver", "Standard", "Waltz"))
+        self.assertEqual(violations, [])
+
+    def test_reports_dance_and_span_violations_in_check_order(self):
+        self._register(Dance("Newcomer", "Latin", "Rumba"))
+        violations = self._register(Dance("Gold", "Latin", "Rumba"))
+        self.assertEqual(
+            [v.violation_type for v in violations], ["span_too_wide", "non_consecutive"]
+        )
+        self.assertEqual(violations[0].levels, [0, 3])
+        self.assertEqual(violations[1].levels, [0, 3])
+
+    def test_dance_outside_points_layout_is_ignored(self):
+        self.assertEqual(self._register(Dance("Beginner", "Nightclub", "Salsa")), [])
+        self.assertEqual(self._register(Dance("Rookie Lead", "Smooth", "Waltz")), [])
+
+    def test_matches_full_check_entry_by_entry(self):
+        """Registering entries one at a time, the set of check_entry()
+        violations seen so far always covers check()'s full re-evaluation."""
+        rng = random.Random(0)
+        seen = set()
+        for _ in range(60):
+            style = rng.choice(["Smooth", "Latin"])
+            dance_obj = Dance(
+                rng.choice(constants.LEVELS),
+                style,
+                rng.choice(constants.DANCE_NAMES[style][:3]),
+            )
+            Entry(dance_obj, self.partnership)
+            for violation in LevelRulesChecker.check_entry(self.dancer, dance_obj):
+                seen.add(_violation_key(violation))
+            full = {_violation_key(v) for v in LevelRulesChecker.check(self.dancer)}
+            self.assertLessEqual(full, seen)
+
+
 if __name__ == "__main__":
     unittest.main()
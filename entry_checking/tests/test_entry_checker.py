@@ -6,6 +6,7 @@ each rules/parsing module in isolation.
 
 import contextlib
 import io
+import threading
 import unittest
 import datetime
 import numpy as np
@@ -14,7 +15,7 @@ import pandas as pd
 from entry_checking.lib.entry_checker import EntryChecker, _report
 from entry_checking.lib.rules.violations import EligibilityResult, LevelViolation, ViolationType
 from utils.lib import competition
-from utils.lib.api.client import DancerRecord
+from utils.lib.api.client import DancerLookupError, DancerRecord
 from utils.lib.models.dance import Dance
 from utils.lib.models.dancer import Dancer
 from utils.lib.models.partnership import Partnership
@@ -96,6 +97,179 @@ class TestEntryCheckerPipeline(unittest.TestCase):
             self.assertEqual(violation.levels, [1, 2, 3])  # Bronze, Silver, Gold indices
 
 
+class TestInjectedLookup(unittest.TestCase):
+    """Tests for EntryChecker's optional injected dancer lookup."""
+
+    def test_each_new_dancer_fetched_once_via_lookup(self):
+        comp_date = datetime.date(2026, 6, 1)
+        raw_data = pd.DataFrame(
+            {
+                "Style": ["Smooth", "Smooth"],
+                "Dance": ["Waltz", "Tango"],
+                "Skill": ["Bronze", "Bronze"],
+                "Lead First": ["Baris", "Baris"],
+                "Lead Last": ["Varol", "Varol"],
+                "Follow First": ["Denise", "Denise"],
+                "Follow Last": ["Machin", "Machin"],
+            }
+        )
+        comp = competition.Competition(
+            comp_name="test",
+            comp_date=comp_date,
+            rv_ruleset="newcomer",
+            consecutive_level_limit=2,
+            rookie_max_level="Bronze",
+            raw_data=raw_data,
+        )
+        calls = []
+
+        def record_lookup(first, last):
+            calls.append((first, last))
+            return DancerRecord(
+                cda_id=1,
+                first=first,
+                last=last,
+                first_comp_date=datetime.date(2020, 1, 1),
+                created_date="2020-01-01",
+                syllabus_pts=np.zeros((4, 19), dtype=int),
+                open_pts=np.zeros((3, 4), dtype=int),
+            )
+
+        EntryChecker(comp, lookup=record_lookup).check()
+
+        # Lookups run concurrently (see prefetch_dancers()), so only the set
+        # of calls is fixed, not their order.
+        self.assertCountEqual(calls, [("Baris", "Varol"), ("Denise", "Machin")])
+        self.assertEqual(len(comp.entries), 2)
+        self.assertEqual(list(comp.competitors), ["Baris Varol", "Denise Machin"])
+
+
+def _comp_with_rows(rows):
+    """A Competition whose entries are rows of (lead first, lead last,
+    follow first, follow last), each a Bronze Smooth Waltz."""
+    names = list(zip(*rows))
+    raw_data = pd.DataFrame(
+        {
+            "Style": ["Smooth"] * len(rows),
+            "Dance": ["Waltz"] * len(rows),
+            "Skill": ["Bronze"] * len(rows),
+            "Lead First": names[0],
+            "Lead Last": names[1],
+            "Follow First": names[2],
+            "Follow Last": names[3],
+        }
+    )
+    return competition.Competition(
+        comp_name="test",
+        comp_date=datetime.date(2026, 6, 1),
+        rv_ruleset="newcomer",
+        consecutive_level_limit=2,
+        rookie_max_level="Bronze",
+        raw_data=raw_data,
+    )
+
+
+def _record(first, last):
+    return DancerRecord(
+        cda_id=1,
+        first=first,
+        last=last,
+        first_comp_date=datetime.date(2020, 1, 1),
+        created_date="2020-01-01",
+        syllabus_pts=np.zeros((4, 19), dtype=int),
+        open_pts=np.zeros((3, 4), dtype=int),
+    )
+
+
+class TestPrefetchDancers(unittest.TestCase):
+    """Tests for EntryChecker.prefetch_dancers() and check()'s phases."""
+
+    def test_lookups_overlap_up_to_max_workers(self):
+        comp = _comp_with_rows([(f"Lead{i}", "X", f"Follow{i}", "Y") for i in range(6)])
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        all_started = threading.Barrier(4, timeout=5)
+
+        def slow_lookup(first, last):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                all_started.wait()
+            except threading.BrokenBarrierError:
+                pass  # fewer than 4 lookups left to run
+            with lock:
+                in_flight -= 1
+            return _record(first, last)
+
+        EntryChecker(comp, lookup=slow_lookup, max_lookup_workers=4).check()
+
+        self.assertEqual(peak, 4)
+        self.assertEqual(len(comp.competitors), 12)
+
+    def test_lookup_failure_registers_nothing(self):
+        comp = _comp_with_rows([("Baris", "Varol", "Denise", "Machin")])
+
+        def failing_lookup(first, last):
+            if first == "Denise":
+                raise DancerLookupError("boom")
+            return _record(first, last)
+
+        with self.assertRaises(DancerLookupError):
+            EntryChecker(comp, lookup=failing_lookup).check()
+        self.assertEqual(comp.entries, set())
+
+    def test_known_competitors_not_looked_up(self):
+        comp = _comp_with_rows([("Baris", "Varol", "Denise", "Machin")])
+        comp.competitors["Baris Varol"] = _mock_dancer(comp.comp_date, "Baris", "Varol")
+        calls = []
+
+        def record_lookup(first, last):
+            calls.append((first, last))
+            return _record(first, last)
+
+        EntryChecker(comp, lookup=record_lookup).check()
+
+        self.assertEqual(calls, [("Denise", "Machin")])
+
+    def test_check_records_phase_timings(self):
+        comp = _comp_with_rows([("Baris", "Varol", "Denise", "Machin")])
+        checker = EntryChecker(comp, lookup=_record)
+        self.assertIsNone(checker.timings)
+
+        checker.check()
+
+        timings = checker.timings
+        self.assertIsNotNone(timings)
+        for seconds in (timings.parse, timings.lookup, timings.rules):
+            self.assertGreaterEqual(seconds, 0)
+
+    def test_check_reports_progress_per_phase(self):
+        comp = _comp_with_rows(
+            [("Baris", "Varol", "Denise", "Machin"), ("Baris", "Varol", "Ana", "Ruiz")]
+        )
+        reports = []
+
+        EntryChecker(comp, lookup=_record).check(
+            lambda phase, detail="": reports.append((phase, detail))
+        )
+
+        self.assertEqual(reports[0], ("parse", "2 rows"))
+        lookups = [detail for phase, detail in reports if phase == "lookup"]
+        self.assertEqual(lookups, ["0/3 dancers", "1/3 dancers", "2/3 dancers", "3/3 dancers"])
+        self.assertEqual(
+            [detail for phase, detail in reports if phase == "rules"],
+            ["1/2 entries", "2/2 entries"],
+        )
+
+    def test_invalid_max_lookup_workers_raises(self):
+        comp = _comp_with_rows([("Baris", "Varol", "Denise", "Machin")])
+        with self.assertRaises(ValueError):
+            EntryChecker(comp, max_lookup_workers=0)
+
+
 class TestRookieVetProcessedLast(unittest.TestCase):
     """Confirms check() registers Rookie/Vet rows after every other row,
     regardless of their order in the source data."""
@@ -3,18 +3,26 @@
 Uses Flask's test client and patches Dancer.from_api so no real network call
 happens - the same mocking approach entry_checking/tests/test_entry_checker.py
 uses via Dancer.from_data(), just applied at the from_api() call site since
-these routes build their own Competition internally.
+these routes build their own Competition internally. A check submitted
+through the form runs as a background job, so those tests wait for the job
+inside the patch.
 """
 
 import datetime
 import io
+import json
+import threading
 import unittest
 from unittest import mock
 
 import numpy as np
 
+from entry_checking.lib.report_view import ReportView
+from entry_checking.lib.webapp import routes
 from entry_checking.lib.webapp.app import create_app
+from entry_checking.lib.webapp.check_service import CheckSuccess
 from utils.lib.api.client import DancerLookupError, DancerRecord
+from utils.lib.jobs import JobManager
 from utils.lib.models.dancer import Dancer
 
 _VALID_CSV = (
@@ -56,9 +64,23 @@ def _post_form(client, path, fields, csv_bytes, filename="entries.csv"):
     return client.post(path, data=data, content_type="multipart/form-data")
 
 
+def _job_id(job_url):
+    return job_url.rsplit("/", 1)[1]
+
+
 class TestIndexRoute(unittest.TestCase):
     def setUp(self):
-        self.client = create_app().test_client()
+        self.jobs = JobManager()
+        self.addCleanup(self.jobs.shutdown)
+        self.client = create_app(job_manager=self.jobs).test_client()
+
+    def _post(self, fields, csv_bytes):
+        """Submits the form, waits for the check job it started, and returns
+        the job's page."""
+        response = _post_form(self.client, "/", fields, csv_bytes)
+        self.assertEqual(response.status_code, 303)
+        self.jobs.wait(_job_id(response.headers["Location"]), timeout=5)
+        return self.client.get(response.headers["Location"])
 
     def test_get_index_returns_form(self):
         response = self.client.get("/")
@@ -70,7 +92,7 @@ class TestIndexRoute(unittest.TestCase):
 
     def test_post_valid_csv_returns_report(self):
         with mock.patch.object(Dancer, "from_api", side_effect=_mock_dancer):
-            response = _post_form(self.client, "/", _VALID_FORM_FIELDS, _VALID_CSV)
+            response = self._post(_VALID_FORM_FIELDS, _VALID_CSV)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"NEWCOMER VIOLATION", response.data)
@@ -79,7 +101,7 @@ class TestIndexRoute(unittest.TestCase):
 
     def test_post_missing_columns_shows_friendly_error(self):
         with mock.patch.object(Dancer, "from_api", side_effect=_mock_dancer):
-            response = _post_form(self.client, "/", _VALID_FORM_FIELDS, _MISSING_COLUMN_CSV)
+            response = self._post(_VALID_FORM_FIELDS, _MISSING_COLUMN_CSV)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"Missing required columns", response.data)
@@ -87,11 +109,17 @@ class TestIndexRoute(unittest.TestCase):
 
     def test_dancer_lookup_error_shows_friendly_message(self):
         with mock.patch.object(Dancer, "from_api", side_effect=DancerLookupError("boom")):
-            response = _post_form(self.client, "/", _VALID_FORM_FIELDS, _VALID_CSV)
+            response = self._post(_VALID_FORM_FIELDS, _VALID_CSV)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"boom", response.data)
 
+    def test_post_without_file_shows_friendly_error(self):
+        response = self.client.post("/", data=_VALID_FORM_FIELDS)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Please choose a CSV file", response.data)
+
 
 class TestApiCheckRoute(unittest.TestCase):
     def setUp(self):
@@ -123,5 +151,127 @@ class TestApiCheckRoute(unittest.TestCase):
         self.assertIn("boom", response.get_json()["error"])
 
 
+_REPORT = ReportView(split_level_notes=[], groups=[("Baris Varol", ["Some violation"])])
+
+
+class TestCheckJobs(unittest.TestCase):
+    """Tests for running checks as background jobs."""
+
+    def setUp(self):
+        self.jobs = JobManager()
+        self.addCleanup(self.jobs.shutdown)
+        self.client = create_app(job_manager=self.jobs).test_client()
+
+    def _submit(self, csv_bytes=_VALID_CSV):
+        response = _post_form(self.client, "/", _VALID_FORM_FIELDS, csv_bytes)
+        self.assertEqual(response.status_code, 303)
+        return response.headers["Location"]
+
+    def test_post_returns_job_page_immediately(self):
+        release = threading.Event()
+
+        def slow_check(*args, lookup, progress):
+            progress("lookup", "0/2 dancers")
+            release.wait(5)
+            return CheckSuccess(_REPORT)
+
+        with mock.patch.object(routes, "run_check", side_effect=slow_check):
+            job_url = self._submit()
+            page = self.client.get(job_url)
+            release.set()
+            self.jobs.wait(_job_id(job_url), timeout=5)
+
+        self.assertEqual(page.status_code, 200)
+        self.assertIn(b'id="job-progress"', page.data)
+        self.assertNotIn(b"Some violation", page.data)
+        # The form keeps what was submitted, and still posts back to "/".
+        self.assertIn(b'value="Test Comp"', page.data)
+        self.assertIn(b'action="/"', page.data)
+        self.assertIn(b"Some violation", self.client.get(job_url).data)
+
+    def test_events_stream_phases_until_done(self):
+        def check(*args, lookup, progress):
+            progress("parse")
+            progress("parse", "1 rows")
+            progress("lookup", "2/2 dancers")
+            progress("rules", "1/1 entries")
+            return CheckSuccess(_REPORT)
+
+        with mock.patch.object(routes, "run_check", side_effect=check):
+            job_url = self._submit()
+            response = self.client.get(job_url + "/events")
+
+        self.assertEqual(response.mimetype, "text/event-stream")
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in response.get_data(as_text=True).splitlines()
+            if line.startswith("data: ")
+        ]
+        self.assertEqual(events[-1]["status"], "done")
+        for event in events:
+            self.assertIn(event["phase"], (None, "parse", "lookup", "rules"))
+
+    def test_reload_and_resubmit_reuse_finished_report(self):
+        with mock.patch.object(routes, "run_check", return_value=CheckSuccess(_REPORT)) as mock_run:
+            first = self._submit()
+            self.jobs.wait(_job_id(first), timeout=5)
+            self.client.get(first)
+            self.client.get(first)
+            second = self._submit()
+
+        self.assertEqual(first, second)
+        mock_run.assert_called_once()
+
+    def test_different_file_runs_new_check(self):
+        with mock.patch.object(routes, "run_check", return_value=CheckSuccess(_REPORT)) as mock_run:
+            first = self._submit()
+            self.jobs.wait(_job_id(first), timeout=5)
+            second = self._submit(_VALID_CSV + b"Smooth,Tango,Bronze,Baris,Varol,Denise,Machin\n")
+            self.jobs.wait(_job_id(second), timeout=5)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_unknown_job_is_404(self):
+        self.assertEqual(self.client.get("/jobs/missing").status_code, 404)
+        self.assertEqual(self.client.get("/jobs/missing/events").status_code, 404)
+
+
+class TestApiJobsRoute(unittest.TestCase):
+    def setUp(self):
+        self.jobs = JobManager()
+        self.addCleanup(self.jobs.shutdown)
+        self.client = create_app(job_manager=self.jobs).test_client()
+
+    def test_submit_then_poll_for_report(self):
+        with mock.patch.object(Dancer, "from_api", side_effect=_mock_dancer):
+            response = _post_form(self.client, "/api/jobs", _VALID_FORM_FIELDS, _VALID_CSV)
+            self.assertEqual(response.status_code, 202)
+            submitted = response.get_json()
+            self.jobs.wait(submitted["id"], timeout=5)
+
+        self.assertEqual(submitted["events_url"], f"/jobs/{submitted['id']}/events")
+        body = self.client.get(submitted["status_url"]).get_json()
+        self.assertEqual(body["status"], "done")
+        self.assertEqual(body["report"]["groups"][0]["subject_name"], "Baris Varol & Denise Machin")
+
+    def test_failed_check_reports_error(self):
+        fields = dict(_VALID_FORM_FIELDS, rv_ruleset="bogus")
+        job_id = _post_form(self.client, "/api/jobs", fields, _VALID_CSV).get_json()["id"]
+        self.jobs.wait(job_id, timeout=5)
+
+        body = self.client.get(f"/api/jobs/{job_id}").get_json()
+        self.assertEqual(body["status"], "failed")
+        self.assertNotIn("report", body)
+        self.assertTrue(body["error"])
+
+    def test_missing_file_returns_400(self):
+        response = self.client.post("/api/jobs", data=_VALID_FORM_FIELDS)
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_job_is_404(self):
+        self.assertEqual(self.client.get("/api/jobs/missing").status_code, 404)
+
+
 if __name__ == "__main__":
     unittest.main()
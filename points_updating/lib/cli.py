@@ -15,14 +15,27 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
-from points_updating.lib.parsing.http_client import ThrottledClient
-from points_updating.lib.parsing.routing import parse_results_url
+from points_updating.lib.ledger_store import LedgerStore, run_incremental
+from points_updating.lib.parsing.http_client import (
+    DEFAULT_BURST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    ThrottledClient,
+)
+from points_updating.lib.parsing.results_cache import ParsedResultsCache
+from points_updating.lib.parsing.routing import parse_results_urls
 from points_updating.lib.report import build_report, render_report
 from points_updating.lib.update_engine import UpdateEngine
+from utils.lib.api.cache import DEFAULT_TTL_SECONDS, DancerRecordCache
+from utils.lib.api.client import DancerLookupClient
+from utils.lib.models.dance import conversion_stats
 
 _CACHE_DIR = Path("data/cache")
+_DANCER_CACHE_PATH = _CACHE_DIR / "dancers.sqlite3"
+_PARSED_RESULTS_CACHE_PATH = _CACHE_DIR / "parsed_results.sqlite3"
 _OUTPUT_DIR = Path("data/outputs")
-_MIN_DELAY_SECONDS = 1.0
+# Event pages of one competition fetched in parallel; each host still sees
+# at most --requests-per-second request starts per second on average.
+_MAX_CONCURRENCY_PER_HOST = 4
 
 
 def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
@@ -44,7 +57,8 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         dest="cache",
         action="store_true",
         default=True,
-        help=f"Cache raw competition results data to {_CACHE_DIR}/ (default: enabled).",
+        help=f"Cache raw and parsed competition results data to {_CACHE_DIR}/ "
+        "(default: enabled).",
     )
     parser.add_argument(
         "--no-cache",
@@ -52,22 +66,104 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         action="store_false",
         help="Don't cache raw competition results data.",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=None,
+        metavar="HOURS",
+        help="Revalidate cached results older than this with the source site (a cheap "
+        "conditional request, re-downloading only pages that changed) - for a competition "
+        "whose results are still being posted. Default: cached results never expire.",
+    )
+    parser.add_argument(
+        "--refresh-dancers",
+        action="store_true",
+        help=f"Re-fetch every dancer from the CDA points database instead of reusing "
+        f"records cached in {_DANCER_CACHE_PATH} (the fresh records are still cached).",
+    )
+    parser.add_argument(
+        "--dancer-cache-ttl",
+        type=float,
+        default=DEFAULT_TTL_SECONDS / 3600,
+        metavar="HOURS",
+        help="How long a cached dancer record stays valid (default: %(default)g hours).",
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        metavar="RATE",
+        help="Average number of requests started per second against any one results site "
+        "(default: %(default)g).",
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=DEFAULT_BURST,
+        metavar="N",
+        help="How many requests to one results site may start back-to-back before "
+        "--requests-per-second pacing applies (default: %(default)d).",
+    )
+    parser.add_argument(
+        "--ledger",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Resume from (and checkpoint to) the points ledger stored in PATH, scoring only "
+        "competitions it hasn't processed yet - plus any processed ones dated after a newly "
+        "inserted earlier competition. Default: score every --result from scratch.",
+    )
+    args = parser.parse_args(argv)
+    if args.requests_per_second <= 0:
+        parser.error("--requests-per-second must be > 0")
+    if args.burst < 1:
+        parser.error("--burst must be >= 1")
+    return args
 
 
 def main(argv: Optional[list[str]] = None) -> None:
     args = _parse_args(argv)
+    cache_max_age_seconds = args.cache_max_age * 3600 if args.cache_max_age is not None else None
     client = ThrottledClient(
-        min_delay_seconds=_MIN_DELAY_SECONDS, cache_dir=_CACHE_DIR if args.cache else None
+        min_delay_seconds=1 / args.requests_per_second,
+        burst=args.burst,
+        max_concurrency_per_host=_MAX_CONCURRENCY_PER_HOST,
+        cache_dir=_CACHE_DIR if args.cache else None,
+        cache_max_age_seconds=cache_max_age_seconds,
+    )
+    results_cache = (
+        ParsedResultsCache(_PARSED_RESULTS_CACHE_PATH, max_age_seconds=cache_max_age_seconds)
+        if args.cache
+        else None
     )
 
-    competitions = [
-        parse_results_url(url, date.fromisoformat(date_str), client)
-        for url, date_str in args.results
-    ]
-
-    engine = UpdateEngine()
-    awards_per_competition = engine.run_backfill(competitions)
+    requested = [(url, date.fromisoformat(date_str)) for url, date_str in args.results]
+    dancer_cache = DancerRecordCache(
+        _DANCER_CACHE_PATH,
+        lookup=DancerLookupClient(),
+        ttl_seconds=args.dancer_cache_ttl * 3600,
+        refresh=args.refresh_dancers,
+    )
+    if args.ledger is None:
+        competitions = parse_results_urls(requested, client, results_cache=results_cache)
+        engine = UpdateEngine(lookup=dancer_cache)
+        awards_per_competition = engine.run_backfill(competitions)
+    else:
+        store = LedgerStore(args.ledger)
+        plan = store.plan(requested)
+        to_score = plan.to_score()
+        parsed = parse_results_urls(to_score, client, results_cache=results_cache)
+        engine, awards_per_competition = run_incremental(
+            store,
+            plan,
+            {competition_id: results for (competition_id, _), results in zip(to_score, parsed)},
+            lookup=dancer_cache,
+        )
+        store.close()
+        print(
+            f"Ledger: resumed after {plan.resume_after or 'an empty ledger'}, "
+            f"{len(plan.new)} new competition(s), {len(plan.replay)} replayed"
+        )
     all_awards = [award for comp_awards in awards_per_competition for award in comp_awards]
 
     starting_totals = engine.starting_totals()
@@ -80,6 +176,25 @@ def main(argv: Optional[list[str]] = None) -> None:
     output_path = _OUTPUT_DIR / f"{timestamp}-report.txt"
     output_path.write_text(text, encoding="utf-8")
     print(f"Report written to {output_path}")
+    print(f"Dancer cache: {dancer_cache.hits} hit(s), {dancer_cache.misses} miss(es)")
+    response_stats = client.cache_stats()
+    if response_stats is not None:
+        print(
+            f"Response cache: {response_stats.hits} hit(s), {response_stats.misses} miss(es), "
+            f"{response_stats.revalidations} revalidated unchanged, "
+            f"{response_stats.entries} entries ({response_stats.total_bytes / 1e6:.1f} MB)"
+        )
+    if results_cache is not None:
+        print(f"Parsed-results cache: {results_cache.hits} hit(s), {results_cache.misses} miss(es)")
+        results_cache.close()
+    print(
+        "Name conversion: "
+        + ", ".join(
+            f"{kind} {stats.misses} distinct/{stats.hits} repeat(s) ({stats.fuzzy_matches} fuzzy)"
+            for kind, stats in conversion_stats().items()
+        )
+    )
+    client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,164 @@
+"""Columnar points ledger for points_updating.
+
+Provides PointsLedger, which holds every ledgered dancer's running point
+totals as rows of two stacked arrays - one (N, 4, 19) syllabus block and
+one (N, 3, 4) open block - indexed by full name, so one competition's
+deltas (sparse PointDelta cells) can be applied in a single vectorized
+scatter-add instead of one Points.add() reallocation per award per
+partner.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from points_updating.lib.rules.cascade import OPEN_CELLS, SYLLABUS_CELLS
+from utils.lib.api.client import DancerRecord
+from utils.lib.points import Points
+
+_INITIAL_CAPACITY = 64
+
+
+@dataclass
+class LedgerSnapshot:
+    """A copy of UpdateEngine's full ledger state, from which it can resume
+    (see UpdateEngine.snapshot()/from_snapshot()).
+
+    Attributes:
+        names: Every ledgered dancer's full name, in row order.
+        records: Each dancer's DancerRecord as first looked up, by name -
+            the baseline their Dancer was built from.
+        first_seen: The competition date each dancer was first ledgered
+            at, by name.
+        syllabus: Nx4x19 running syllabus totals, in row order.
+        open: Nx3x4 running open totals, in row order.
+    """
+
+    names: list[str]
+    records: dict[str, DancerRecord]
+    first_seen: dict[str, date]
+    syllabus: np.ndarray
+    open: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "LedgerSnapshot":
+        """A snapshot of an empty ledger - a run with nothing to resume from."""
+        return cls([], {}, {}, np.zeros((0, 4, 19), dtype=int), np.zeros((0, 3, 4), dtype=int))
+
+
+class PointsLedger:
+    """Every ledgered dancer's running point totals, one row per dancer.
+
+    Each dancer's Points (see points()) is a view onto their row, so it
+    always reflects the ledger's current totals and can be handed to
+    Dancer/ProficiencyCalculator exactly like any other Points.
+    """
+
+    def __init__(self):
+        self._rows: dict[str, int] = {}
+        self._views: list[Points] = []
+        self._syllabus = np.zeros((_INITIAL_CAPACITY, 4, 19), dtype=int)
+        self._open = np.zeros((_INITIAL_CAPACITY, 3, 4), dtype=int)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row(self, name: str) -> int:
+        """Returns name's row index.
+
+        Raises:
+            KeyError: if name isn't ledgered.
+        """
+        return self._rows[name]
+
+    def add(self, name: str, points: Points) -> Points:
+        """Ledgers a new dancer, copying points in as their starting row.
+
+        Args:
+            name: The dancer's full name.
+            points: Their starting totals - copied, never modified.
+        Returns:
+            The ledger-backed Points view of the new row.
+        Raises:
+            ValueError: if name is already ledgered.
+        """
+        if name in self._rows:
+            raise ValueError(f"'{name}' is already in the ledger.")
+        row = len(self._rows)
+        if row == len(self._syllabus):
+            self._grow()
+        self._syllabus[row] = points.syllabus_data
+        self._open[row] = points.open_data
+        self._rows[name] = row
+        view = Points(self._syllabus[row], self._open[row])
+        self._views.append(view)
+        return view
+
+    def points(self, name: str) -> Points:
+        """Returns name's ledger-backed Points view.
+
+        Raises:
+            KeyError: if name isn't ledgered.
+        """
+        return self._views[self._rows[name]]
+
+    def names(self) -> list[str]:
+        """Every ledgered name, in row order."""
+        return list(self._rows)
+
+    def gather(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns copies of the given rows' totals as (Kx4x19 syllabus,
+        Kx3x4 open) arrays - the batch form of points()."""
+        return self._syllabus[rows], self._open[rows]
+
+    def apply(self, rows: np.ndarray, cells: np.ndarray, pts: np.ndarray) -> None:
+        """Adds a batch of sparse per-dancer deltas to the ledger in one
+        pass.
+
+        Deltas for the same row are summed first, so a dancer appearing in
+        several results gets one combined update. Same marker rule as
+        Points.add(): a negative cell means "already pointed out via
+        cross-style pairing" and is left untouched.
+
+        Args:
+            rows: Row index (see row()) of each touched cell, repeats
+                allowed.
+            cells: Each touched cell, as a PointDelta cell index.
+            pts: Points added to each touched cell.
+        """
+        if len(rows) == 0:
+            return
+        touched, inverse = np.unique(rows, return_inverse=True)
+        sums = np.zeros((len(touched), SYLLABUS_CELLS + OPEN_CELLS), dtype=self._syllabus.dtype)
+        np.add.at(sums, (inverse.reshape(-1), cells), pts)
+
+        totals = np.concatenate(
+            [
+                self._syllabus[touched].reshape(len(touched), SYLLABUS_CELLS),
+                self._open[touched].reshape(len(touched), OPEN_CELLS),
+            ],
+            axis=1,
+        )
+        np.add(totals, sums, out=totals, where=totals >= 0)
+        self._syllabus[touched] = totals[:, :SYLLABUS_CELLS].reshape(-1, 4, 19)
+        self._open[touched] = totals[:, SYLLABUS_CELLS:].reshape(-1, 3, 4)
+
+        for row in touched:
+            self._views[row].mark_changed()
+
+    def _grow(self) -> None:
+        """Doubles capacity and repoints every existing view at the new
+        arrays (same values, so memoized proficiency stays valid)."""
+        capacity = 2 * len(self._syllabus)
+        syllabus = np.zeros((capacity, 4, 19), dtype=self._syllabus.dtype)
+        open_ = np.zeros((capacity, 3, 4), dtype=self._open.dtype)
+        syllabus[: len(self._syllabus)] = self._syllabus
+        open_[: len(self._open)] = self._open
+        self._syllabus, self._open = syllabus, open_
+        for row, view in enumerate(self._views):
+            view.syllabus_data = self._syllabus[row]
+            view.open_data = self._open[row]
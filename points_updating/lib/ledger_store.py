@@ -0,0 +1,283 @@
+"""Persistent points ledger, so a run can resume where the last one ended.
+
+Provides LedgerStore, a local SQLite file holding a checkpoint of
+UpdateEngine's ledger after every competition it has processed, plus each
+dancer's baseline DancerRecord, and run_incremental(), which scores a run's
+competitions on top of the right checkpoint.
+
+Adding one new weekend's competition then scores only that competition.
+A competition dated before ones already processed (an out-of-order insert)
+can't simply be appended - every later competition was scored against a
+ledger that didn't include it - so plan() resumes from the last checkpoint
+before it and replays only the competitions from there forward.
+"""
+
+import io
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from points_updating.lib.ledger import LedgerSnapshot
+from points_updating.lib.models.result import CompetitionResult
+from points_updating.lib.points_calculator import ResultAward
+from points_updating.lib.update_engine import UpdateEngine
+from utils.lib.api.cache import record_from_json, record_to_json
+from utils.lib.api.client import DancerRecord, lookup_dancer
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dancers (
+    name TEXT PRIMARY KEY,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    seq INTEGER PRIMARY KEY,
+    competition_id TEXT NOT NULL UNIQUE,
+    competition_date TEXT NOT NULL,
+    names TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    totals BLOB NOT NULL
+);
+"""
+
+
+@dataclass
+class ResumePlan:
+    """What a run has to score, as decided by LedgerStore.plan().
+
+    Attributes:
+        resume_after: The checkpoint (competition id) to resume the ledger
+            from, or None to start from an empty ledger.
+        replay: Already-processed competitions after resume_after that
+            must be scored again, as (id, date) in chronological order -
+            non-empty only for an out-of-order insert.
+        new: Competitions never processed before, as (id, date).
+    """
+
+    resume_after: Optional[str]
+    replay: list[tuple[str, date]]
+    new: list[tuple[str, date]]
+
+    def to_score(self) -> list[tuple[str, date]]:
+        """Every competition this run scores - replayed and new alike - in
+        chronological order (replayed first on a tie, as originally run)."""
+        return sorted(self.replay + self.new, key=lambda c: c[1])
+
+
+class LedgerStore:
+    """UpdateEngine ledger checkpoints stored in a local SQLite file.
+
+    Competitions are identified by an id the caller chooses (the CLI uses
+    the results URL). Checkpoints are kept in chronological order; a
+    checkpoint holds the full ledger as of just after its competition.
+    """
+
+    def __init__(self, path: Path):
+        """Create a LedgerStore.
+
+        Args:
+            path: The SQLite file to store checkpoints in - created (along
+                with its parent directory) if it doesn't exist yet.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def processed(self) -> list[tuple[str, date]]:
+        """Every checkpointed competition as (id, date), chronologically."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT competition_id, competition_date FROM checkpoints ORDER BY seq"
+            ).fetchall()
+        return [(competition_id, date.fromisoformat(day)) for competition_id, day in rows]
+
+    def plan(self, competitions: list[tuple[str, date]]) -> ResumePlan:
+        """Decides where a run over competitions resumes from.
+
+        Competitions already processed are skipped. If every new one is
+        dated on or after the last processed competition, the run resumes
+        from the latest checkpoint; otherwise it resumes from the last
+        checkpoint dated on or before the earliest new competition, and
+        every processed competition after that is replayed.
+
+        Args:
+            competitions: The run's competitions as (id, date), in any order.
+        """
+        processed = self.processed()
+        processed_ids = {competition_id for competition_id, _ in processed}
+        new = sorted(
+            {c for c in competitions if c[0] not in processed_ids}, key=lambda c: (c[1], c[0])
+        )
+        if not new:
+            return ResumePlan(processed[-1][0] if processed else None, [], [])
+
+        earliest = new[0][1]
+        keep = 0
+        while keep < len(processed) and processed[keep][1] <= earliest:
+            keep += 1
+        resume_after = processed[keep - 1][0] if keep else None
+        return ResumePlan(resume_after, processed[keep:], new)
+
+    def load(self, competition_id: str) -> LedgerSnapshot:
+        """Returns the ledger as checkpointed just after competition_id.
+
+        Raises:
+            KeyError: if competition_id has no checkpoint.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT names, first_seen, totals FROM checkpoints WHERE competition_id = ?",
+                (competition_id,),
+            ).fetchone()
+        if row is None:
+            raise KeyError(competition_id)
+        names_json, first_seen_json, totals = row
+        names = json.loads(names_json)
+        records = self.known_records()
+        with np.load(io.BytesIO(totals)) as arrays:
+            syllabus, open_ = arrays["syllabus"], arrays["open"]
+        return LedgerSnapshot(
+            names=names,
+            records={name: records[name] for name in names},
+            first_seen={
+                name: date.fromisoformat(day) for name, day in json.loads(first_seen_json).items()
+            },
+            syllabus=syllabus,
+            open=open_,
+        )
+
+    def known_records(self) -> dict[str, DancerRecord]:
+        """Every stored dancer's baseline DancerRecord, by full name."""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, record FROM dancers").fetchall()
+        return {name: record_from_json(record) for name, record in rows}
+
+    def save(self, competition_id: str, competition_date: date, snapshot: LedgerSnapshot) -> None:
+        """Checkpoints the ledger just after competition_id, replacing any
+        existing checkpoint for it.
+
+        Raises:
+            ValueError: if competition_date is before the latest checkpoint's
+                - checkpoints must stay chronological (see replace_after()).
+        """
+        with self._lock, self._conn:
+            self._insert(competition_id, competition_date, snapshot)
+
+    def replace_after(
+        self,
+        competition_id: Optional[str],
+        checkpoints: list[tuple[str, date, LedgerSnapshot]],
+    ) -> None:
+        """Replaces every checkpoint after competition_id's (every
+        checkpoint, if None) with checkpoints, in one transaction - so a
+        replay that fails part way leaves the store as it was.
+
+        Args:
+            competition_id: The checkpoint the new ones follow.
+            checkpoints: (id, date, snapshot) for each competition scored
+                after competition_id, in chronological order.
+        Raises:
+            ValueError: if checkpoints aren't chronological; nothing is
+                changed.
+        """
+        with self._lock, self._conn:
+            if competition_id is None:
+                self._conn.execute("DELETE FROM checkpoints")
+            else:
+                self._conn.execute(
+                    "DELETE FROM checkpoints WHERE seq > "
+                    "(SELECT seq FROM checkpoints WHERE competition_id = ?)",
+                    (competition_id,),
+                )
+            for checkpoint in checkpoints:
+                self._insert(*checkpoint)
+
+    def _insert(
+        self, competition_id: str, competition_date: date, snapshot: LedgerSnapshot
+    ) -> None:
+        """save()'s write, for a caller already holding the lock inside a
+        transaction."""
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, syllabus=snapshot.syllabus, open=snapshot.open)
+        first_seen = {name: day.isoformat() for name, day in snapshot.first_seen.items()}
+        self._conn.execute("DELETE FROM checkpoints WHERE competition_id = ?", (competition_id,))
+        latest = self._conn.execute("SELECT MAX(competition_date) FROM checkpoints").fetchone()
+        if latest[0] is not None and competition_date.isoformat() < latest[0]:
+            raise ValueError(
+                f"Cannot checkpoint {competition_id} ({competition_date}) after a "
+                f"competition dated {latest[0]}."
+            )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO dancers VALUES (?, ?)",
+            [(name, record_to_json(record)) for name, record in snapshot.records.items()],
+        )
+        self._conn.execute(
+            "INSERT INTO checkpoints (competition_id, competition_date, names, first_seen, "
+            "totals) VALUES (?, ?, ?, ?, ?)",
+            (
+                competition_id,
+                competition_date.isoformat(),
+                json.dumps(snapshot.names),
+                json.dumps(first_seen),
+                buffer.getvalue(),
+            ),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def run_incremental(
+    store: LedgerStore,
+    plan: ResumePlan,
+    competitions: dict[str, list[CompetitionResult]],
+    lookup: Callable[[str, str], DancerRecord] = lookup_dancer,
+    max_lookup_workers: int = 8,
+) -> tuple[UpdateEngine, list[list[ResultAward]]]:
+    """Scores plan's competitions on top of its resume checkpoint, then
+    checkpoints the ledger after each one.
+
+    Args:
+        store: Where plan came from.
+        plan: From store.plan().
+        competitions: Parsed results for every competition in
+            plan.to_score(), by id.
+        lookup: Same as UpdateEngine's - only called for dancers the store
+            has no baseline record for.
+        max_lookup_workers: Same as UpdateEngine's.
+    Returns:
+        The engine holding the updated ledger - its starting_totals() are
+        as of the resume checkpoint - and one list of ResultAwards per
+        scored competition, in chronological order.
+    """
+    snapshot = (
+        store.load(plan.resume_after) if plan.resume_after is not None else LedgerSnapshot.empty()
+    )
+    engine = UpdateEngine.from_snapshot(
+        snapshot,
+        lookup=lookup,
+        max_lookup_workers=max_lookup_workers,
+        known_records=store.known_records(),
+    )
+
+    to_score = plan.to_score()
+    engine.prefetch_dancers([competitions[competition_id] for competition_id, _ in to_score])
+    awards = []
+    checkpoints = []
+    for competition_id, competition_date in to_score:
+        awards.append(engine.process_competition(competitions[competition_id]))
+        checkpoints.append((competition_id, competition_date, engine.snapshot()))
+    # Only now, with every competition scored, are the replayed ones'
+    # checkpoints swapped out - a failed lookup or result above leaves the
+    # store untouched, so the next plan() still knows about them.
+    if checkpoints:
+        store.replace_after(plan.resume_after, checkpoints)
+    return engine, awards
@@ -11,7 +11,7 @@ from datetime import date
 from utils.lib.models.dance import Dance
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DancerRef:
     """Identifies a dancer within a CompetitionResult by name alone.
 
@@ -46,7 +46,7 @@ def _capitalize_first_letter(name: str) -> str:
     return name[0].upper() + name[1:]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompetitionResult:
     """A single couple/placement result from one competition event.
 
@@ -58,6 +58,9 @@ class CompetitionResult:
     dance is the combo's first dance, a convenient single-dance handle for
     callers that don't need the full combo (e.g. event_dances == (dance,)
     for a single-dance event).
+
+    Slotted and frozen, like DancerRef: a large competition parses into
+    tens of thousands of these, and nothing modifies one once parsed.
     """
 
     dance: Dance
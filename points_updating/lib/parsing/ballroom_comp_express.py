@@ -14,9 +14,12 @@ from typing import Optional
 
 from points_updating.lib.models.result import CompetitionResult, DancerRef
 from points_updating.lib.parsing.http_client import ThrottledClient
+from points_updating.lib.parsing.results_cache import parser_version
 from utils.lib.constants import OpenLevel, Style, SyllabusLevel
 from utils.lib.models.dance import Dance
 
+PARSER_VERSION = parser_version(__file__)  # see o2cm.PARSER_VERSION
+
 _BASE_URL = "https://ballroomcompexpress.com"
 
 # Ballroom Comp Express doesn't mark Rookie/Veteran events with a reliable
@@ -154,17 +157,20 @@ def parse_competition(
             (`results.php?cid=<cid>`).
         competition_name: The competition's name.
         competition_date: The date the competition was held.
-        client: The HTTP client to fetch with.
+        client: The HTTP client to fetch with. Event pages are fetched
+            through client.fetch_concurrently(), so up to its
+            max_concurrency_per_host pages are in flight while earlier ones
+            are parsed.
     Returns:
         One CompetitionResult per (couple, event) across every couple event
-        in the competition. Non-couple events (e.g. Formation Team) and
+        in the competition, in event-list order. Non-couple events (e.g. Formation Team) and
         listed events with no recorded results are skipped here, not raised on.
         See _parse_event for the single-event contract, which does raise for
         an actually-malformed page.
     """
+    eids = [eid for eid, _ in fetch_event_list(cid, client)]
     results = []
-    for eid, _ in fetch_event_list(cid, client):
-        html = fetch_event_page(cid, eid, client)
+    for html in client.fetch_concurrently(lambda eid: fetch_event_page(cid, eid, client), eids):
         if not _EMBEDDED_JSON_RE.search(html):
             continue
         event = extract_embedded_json(html)
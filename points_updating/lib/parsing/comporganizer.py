@@ -23,9 +23,12 @@ from datetime import date
 
 from points_updating.lib.models.result import CompetitionResult, DancerRef
 from points_updating.lib.parsing.http_client import ThrottledClient
+from points_updating.lib.parsing.results_cache import parser_version
 from utils.lib.constants import SYLLABUS_LEVELS, Style
 from utils.lib.models.dance import Dance, convert_dance, convert_level
 
+PARSER_VERSION = parser_version(__file__)  # see o2cm.PARSER_VERSION
+
 _CALLBACK_COMPS_URL = "https://comporganizer.com/feed/callback-comps/"
 _RESULTS_URL = "https://ndcapremier.com/feed/results/"
 _COMP_PHP_PATH = "/shared/comp.php"
@@ -115,16 +118,22 @@ def parse_competition(
             template family the results page uses).
         competition_name: The competition's name.
         competition_date: The date the competition was held.
-        client: The HTTP client to fetch with.
+        client: The HTTP client to fetch with. Event results are fetched
+            through client.fetch_concurrently(), so up to its
+            max_concurrency_per_host events are in flight while earlier
+            ones are parsed.
     Returns:
         One CompetitionResult per (couple, event) across every couple event
-        in the competition. Non-couple events (Jack & Jill, team matches,
+        in the competition, in event-list order. Non-couple events (Jack & Jill, team matches,
         etc.) are skipped here, not raised on - see _parse_event for the
         single-event contract, which does raise for those.
     """
+    event_ids = [event_id for event_id, _ in fetch_event_list(comp_year_id, client)]
     results = []
-    for event_id, _ in fetch_event_list(comp_year_id, client):
-        event = fetch_event_results(comp_year_id, event_id, client)["Result"]["Event"]
+    for payload in client.fetch_concurrently(
+        lambda event_id: fetch_event_results(comp_year_id, event_id, client), event_ids
+    ):
+        event = payload["Result"]["Event"]
         if event["Type"] != "Couple":
             continue
         results.extend(_parse_event(event, competition_name, competition_date))
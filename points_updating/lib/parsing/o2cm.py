@@ -4,21 +4,33 @@ A single POST to event3.asp with every filter left blank returns a
 consolidated results page listing every event in the competition, each
 with its Final-round placements and every earlier round's eliminated
 couples, with a literal "----" row separating each round's group.
+
+For a big competition that page runs to several MB, so parse_competition()
+reads it with iter_results_page(), which walks the rows as lxml decodes
+them instead of first building the whole document tree (as
+_parse_results_page() does). Both feed the same row-by-row logic in
+_walk_rows(), so they produce identical results.
 """
 
 import re
 from datetime import date
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from points_updating.lib.models.result import CompetitionResult, DancerRef
 from points_updating.lib.parsing.http_client import ThrottledClient
+from points_updating.lib.parsing.results_cache import parser_version
 from utils.lib import constants
 from utils.lib.constants import OpenLevel, Style
 from utils.lib.models.dance import Dance, convert_dance, convert_level
 from utils.lib.multi_dance import expand_abbreviation
 
+# Changes whenever this module or a shared module it depends on does, so
+# ParsedResultsCache entries written by an older parser are ignored.
+PARSER_VERSION = parser_version(__file__)
+
 _EVENT_URL = "https://results.o2cm.com/event3.asp"
 
 _EVENT_LINK_HREF_RE = re.compile(r"scoresheet3\.asp\?event=")
@@ -49,6 +61,9 @@ _MAX_NIGHTCLUB_DANCE_WORDS = max(
     len(name.split()) for name in constants.DANCE_NAMES[Style.NIGHTCLUB]
 )
 
+# How much of the page iter_results_page() hands lxml at a time.
+_STREAM_CHUNK_CHARS = 64 * 1024
+
 
 def fetch_results_page(comp_id: str, client: ThrottledClient) -> str:
     """Returns a competition's full consolidated results page as raw HTML.
@@ -101,7 +116,22 @@ def parse_competition(
         Final round in the competition.
     """
     html = fetch_results_page(comp_id, client)
-    return _parse_results_page(html, competition_name, competition_date)
+    return list(iter_results_page(_chunked(html), competition_name, competition_date))
+
+
+def iter_results_page(
+    html_chunks: Iterable[str], competition_name: str, competition_date: date
+) -> Iterator[CompetitionResult]:
+    """Streaming equivalent of _parse_results_page(): parses a
+    competition's consolidated results page, given as consecutive chunks
+    of its HTML, yielding each event's CompetitionResults as soon as that
+    event's rows have been read.
+
+    Each <tr> is read once lxml has finished decoding it, then discarded,
+    so memory use stays flat however big the page is - no document tree is
+    ever built for the whole page.
+    """
+    return _walk_rows(_streamed_rows(html_chunks), competition_name, competition_date)
 
 
 def _parse_results_page(
@@ -111,45 +141,95 @@ def _parse_results_page(
     CompetitionResults, one per (couple, event) danced in each event's
     Final round.
     """
+    return list(_walk_rows(_soup_rows(html), competition_name, competition_date))
+
+
+def _soup_rows(html: str) -> Iterator[tuple[Optional[str], str]]:
+    """Yields (event link text or None, row text) for every <tr> in html,
+    via a full BeautifulSoup tree."""
     soup = BeautifulSoup(html, "lxml")
-    results: list[CompetitionResult] = []
+    for row in soup.find_all("tr"):
+        link = row.find("a", href=_EVENT_LINK_HREF_RE)
+        # A nested tag (e.g. the <b> O2CM wraps a "TBA" placeholder
+        # partner in) splits a row's text into separate fragments -
+        # get_text()'s default separator ("") would silently glue them
+        # together with no space, so use " " and re-normalize instead.
+        yield (
+            link.get_text(strip=True) if link is not None else None,
+            " ".join(row.get_text(" ", strip=True).split()),
+        )
+
+
+def _streamed_rows(html_chunks: Iterable[str]) -> Iterator[tuple[Optional[str], str]]:
+    """Yields the same (event link text or None, row text) pairs as
+    _soup_rows(), each as soon as its </tr> has been parsed.
+
+    Assumes rows aren't nested inside other rows (true of every O2CM page
+    seen so far) - a row is yielded when it closes, so a nested row would
+    come out before its parent rather than after.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="tr")
+    for chunk in html_chunks:
+        parser.feed(chunk)
+        yield from _drain_rows(parser)
+    parser.close()
+    yield from _drain_rows(parser)
+
+
+def _drain_rows(parser: etree.HTMLPullParser) -> Iterator[tuple[Optional[str], str]]:
+    for _, row in parser.read_events():
+        link = next(
+            (a for a in row.iter("a") if _EVENT_LINK_HREF_RE.search(a.get("href", ""))), None
+        )
+        link_text = "".join(text.strip() for text in link.itertext()) if link is not None else None
+        text = " ".join(" ".join(row.itertext()).split())
+        # Already read - free it, and every earlier row, so the partial tree
+        # lxml keeps doesn't grow with the page.
+        row.clear()
+        while row.getprevious() is not None:
+            del row.getparent()[0]
+        yield link_text, text
+
+
+def _walk_rows(
+    rows: Iterable[tuple[Optional[str], str]], competition_name: str, competition_date: date
+) -> Iterator[CompetitionResult]:
+    """Turns a results page's rows, in document order, into
+    CompetitionResults - one per (couple, event) danced in each event's
+    Final round, yielded event by event."""
     heat_name: Optional[str] = None
     in_final_group = False
     final_rows: list[str] = []
     num_rounds = 1
 
-    def flush() -> None:
-        if heat_name is not None:
-            results.extend(
-                _build_results(
+    for link_text, text in rows:
+        if link_text is not None:
+            if heat_name is not None:
+                yield from _build_results(
                     heat_name, final_rows, num_rounds, competition_name, competition_date
                 )
-            )
-
-    for row in soup.find_all("tr"):
-        link = row.find("a", href=_EVENT_LINK_HREF_RE)
-        if link is not None:
-            flush()
-            heat_name = " ".join(link.get_text(strip=True).split())
+            heat_name = " ".join(link_text.split())
             in_final_group = True
             final_rows = []
             num_rounds = 1
             continue
         if heat_name is None:
             continue
-        # A nested tag (e.g. the <b> O2CM wraps a "TBA" placeholder
-        # partner in) splits a row's text into separate fragments -
-        # get_text()'s default separator ("") would silently glue them
-        # together with no space, so use " " and re-normalize instead.
-        text = " ".join(row.get_text(" ", strip=True).split())
         if text == _SEPARATOR_TEXT:
             in_final_group = False
             num_rounds += 1
             continue
         if in_final_group and _PLACEMENT_ROW_RE.match(text) and _TBA_RE.search(text) is None:
             final_rows.append(text)
-    flush()
-    return results
+    if heat_name is not None:
+        yield from _build_results(
+            heat_name, final_rows, num_rounds, competition_name, competition_date
+        )
+
+
+def _chunked(text: str) -> Iterator[str]:
+    for start in range(0, len(text), _STREAM_CHUNK_CHARS):
+        yield text[start : start + _STREAM_CHUNK_CHARS]
 
 
 def _build_results(
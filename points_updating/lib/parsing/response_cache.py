@@ -0,0 +1,309 @@
+"""On-disk store for ThrottledClient's cached HTTP responses.
+
+Keeps only what a parser reads back from a response - status, a handful of
+headers, the encoding, and the body, zlib-compressed - in one SQLite file,
+rather than a pickled requests.Response per request. Entries are evicted
+least-recently-used first once the store outgrows its size limit.
+
+Each entry keeps the max-age its server sent, and a reader passes its own
+max-age to get(): once either has passed, the entry is stale, and
+ThrottledClient revalidates it with a conditional request
+(If-None-Match/If-Modified-Since, from the entry's ETag/Last-Modified)
+instead of trusting it or re-downloading it outright. Freshness is decided
+when an entry is read, so a run with a shorter max-age than the one that
+cached a page still revalidates it.
+"""
+
+import json
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Generous for scraped results pages (a compressed event page is a few KB),
+# while keeping a long-lived data/cache from growing without bound.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# The only headers worth keeping: what decoding a body needs, plus the
+# validators a later revalidation request would send back.
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Date")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    url TEXT,
+    status_code INTEGER NOT NULL,
+    encoding TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    max_age REAL
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+
+
+@dataclass
+class CachedResponse:
+    """A response read back from a ResponseCache, with whether it's still
+    within both its own max-age and the reader's."""
+
+    response: requests.Response
+    is_fresh: bool
+
+    def conditional_headers(self) -> dict[str, str]:
+        """The request headers that ask the server to reply 304 Not Modified
+        if this response is still current - empty if the server sent no
+        validators to revalidate against."""
+        headers = {}
+        if "ETag" in self.response.headers:
+            headers["If-None-Match"] = self.response.headers["ETag"]
+        if "Last-Modified" in self.response.headers:
+            headers["If-Modified-Since"] = self.response.headers["Last-Modified"]
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """A snapshot of a ResponseCache's contents and this process's use of it."""
+
+    entries: int
+    total_bytes: int  # compressed body plus stored headers, across every entry
+    hits: int  # including stale entries, whether or not they then revalidated
+    misses: int
+    evictions: int
+    revalidations: int  # stale entries a 304 Not Modified confirmed still current
+
+
+class ResponseCache:
+    """A size-bounded, thread-safe store of HTTP responses keyed by an
+    opaque cache key (see ThrottledClient._cache_key()).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create a ResponseCache.
+
+        Args:
+            path: The SQLite file to store responses in - created (along
+                with its parent directory) if it doesn't exist yet.
+            max_bytes: Once entries' total size exceeds this, the least
+                recently used are evicted until it doesn't.
+            clock: Injectable wall clock, for recency ordering and max-age
+                expiry - tests supply a fake so both are deterministic.
+                Wall-clock rather than monotonic, since entries outlive the
+                process that wrote them.
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(_INDEX)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "max_age" not in columns:
+                # A store written before entries had a max-age - existing
+                # entries are limited only by the reader's max-age.
+                self._conn.execute("ALTER TABLE responses ADD COLUMN max_age REAL")
+
+    def get(
+        self, cache_key: str, max_age_seconds: Optional[float] = None
+    ) -> Optional[CachedResponse]:
+        """Returns the cached response for cache_key - fresh or stale - or
+        None on a miss.
+
+        Args:
+            cache_key: The key to look up.
+            max_age_seconds: The reader's own limit on how old a fresh
+                entry may be, on top of the entry's max-age. None means no
+                limit beyond the entry's.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT url, status_code, encoding, headers, body, stored_at, max_age "
+                "FROM responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            now = self._clock()
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE cache_key = ?", (now, cache_key)
+            )
+            self.hits += 1
+        url, status_code, encoding, headers, body, stored_at, max_age = row
+        return CachedResponse(
+            response=_build_response(url, status_code, encoding, json.loads(headers), body),
+            is_fresh=all(
+                limit is None or now - stored_at < limit for limit in (max_age, max_age_seconds)
+            ),
+        )
+
+    def put(
+        self,
+        cache_key: str,
+        response: requests.Response,
+        max_age_seconds: Optional[float] = None,
+    ) -> None:
+        """Stores response under cache_key, replacing any existing entry,
+        then evicts least-recently-used entries if that put the store over
+        max_bytes.
+
+        Args:
+            cache_key: The key to store under.
+            response: The response to store.
+            max_age_seconds: How long the entry stays fresh, whatever the
+                reader's max-age - the server's Cache-Control max-age. None
+                leaves it to the reader.
+        """
+        headers = _kept_headers_json(response.headers)
+        body = zlib.compress(response.content or b"")
+        size = len(body) + len(headers)
+        now = self._clock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    response.url,
+                    response.status_code,
+                    response.encoding,
+                    headers,
+                    body,
+                    size,
+                    now,
+                    now,
+                    max_age_seconds,
+                ),
+            )
+            self._evict_over_limit()
+
+    def revalidated(
+        self,
+        cache_key: str,
+        not_modified: requests.Response,
+        max_age_seconds: Optional[float] = None,
+    ) -> None:
+        """Marks cache_key's entry fresh again after the server answered a
+        conditional request with 304 Not Modified - restarting its max-age
+        and taking any updated validators from the 304's headers, while
+        keeping the stored body."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT headers FROM responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return  # evicted while the request was in flight
+            headers = json.loads(row[0])
+            headers.update(json.loads(_kept_headers_json(not_modified.headers)))
+            now = self._clock()
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, last_used = ?, max_age = ? "
+                "WHERE cache_key = ?",
+                (json.dumps(headers), now, now, max_age_seconds, cache_key),
+            )
+            self.revalidations += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return CacheStats(
+                entries, total_bytes, self.hits, self.misses, self.evictions, self.revalidations
+            )
+
+    def migrate_pickles(self, directory: Path) -> int:
+        """Moves every legacy `<cache_key>.pickle` response in directory
+        (the format ThrottledClient used to cache in) into this store,
+        deleting each file once stored.
+
+        Only ever pointed at our own cache directory - unpickling runs
+        arbitrary code, so it must never read a file someone else wrote.
+
+        Returns:
+            How many entries were migrated. Files that fail to unpickle are
+            left in place and not counted.
+        """
+        migrated = 0
+        for pickle_path in sorted(directory.glob("*.pickle")):
+            try:
+                with open(pickle_path, "rb") as f:
+                    response = pickle.load(f)
+            except Exception:
+                continue
+            if not isinstance(response, requests.Response):
+                continue
+            self.put(pickle_path.stem, response)
+            pickle_path.unlink()
+            migrated += 1
+        return migrated
+
+    def clear(self) -> None:
+        """Drops every cached response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict_over_limit(self) -> None:
+        # Caller holds self._lock, inside a transaction.
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM responses ORDER BY last_used, stored_at"
+        )
+        evicted = []
+        for cache_key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((cache_key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE cache_key = ?", evicted)
+        self.evictions += len(evicted)
+
+
+def _kept_headers_json(headers) -> str:
+    return json.dumps({name: headers[name] for name in _KEPT_HEADERS if name in headers})
+
+
+def _build_response(
+    url: Optional[str],
+    status_code: int,
+    encoding: Optional[str],
+    headers: dict[str, str],
+    body: bytes,
+) -> requests.Response:
+    response = requests.Response()
+    response.url = url or ""
+    response.status_code = status_code
+    response.encoding = encoding
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = zlib.decompress(body)
+    return response
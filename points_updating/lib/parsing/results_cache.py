@@ -0,0 +1,277 @@
+"""On-disk cache of parsed competition results.
+
+ThrottledClient's ResponseCache saves re-downloading a competition, but
+every run still re-parses its HTML/JSON into CompetitionResults. This
+second-level cache stores the parsed list[CompetitionResult] itself, keyed
+by the competition's identity and the parser version that produced it, so
+routing.parse_results_url() skips both fetching and parsing on a repeat
+run.
+
+A parser's version is a digest of its own source plus the shared modules
+every parser's output depends on (see parser_version()), so editing any of
+them - a parser, the dance/level alias tables, multi-dance splitting, the
+result model - invalidates what was parsed before without anyone having to
+remember to bump a constant.
+
+Results are stored columnar: each distinct Dance, name and competition
+name is written once in a lookup table and every result is a row of
+integer indices into them, JSON-encoded and zlib-compressed.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Optional
+
+from points_updating.lib.models import result as result_model
+from points_updating.lib.models.result import CompetitionResult, DancerRef
+from utils.lib import constants, multi_dance
+from utils.lib.models import dance as dance_model
+from utils.lib.models.dance import Dance
+
+# Source files outside the parser modules that shape what a parser returns:
+# name/alias conversion, multi-dance splitting, the result model, routing's
+# choice of parser and name override, and this module's own encoding.
+_SHARED_SOURCES = (
+    Path(dance_model.__file__),
+    Path(constants.__file__),
+    Path(multi_dance.__file__),
+    Path(result_model.__file__),
+    Path(__file__).with_name("routing.py"),
+    Path(__file__),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsed_results (
+    source TEXT NOT NULL,
+    competition_id TEXT NOT NULL,
+    competition_date TEXT NOT NULL,
+    name_override TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (source, competition_id, competition_date, name_override)
+)
+"""
+
+
+def parser_version(parser_file: str) -> str:
+    """A parser module's version for ResultsKey: a digest of its source
+    file and every shared source in _SHARED_SOURCES.
+
+    Parser modules compute theirs once, at import, as
+    PARSER_VERSION = parser_version(__file__).
+    """
+    digest = hashlib.sha256()
+    for path in (Path(parser_file), *_SHARED_SOURCES):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class ResultsKey:
+    """Identifies one competition's parsed results.
+
+    Attributes:
+        source: Which parser produced them, e.g. "o2cm".
+        competition_id: The source's own id for the competition (or, where
+            the id isn't known without fetching, its results URL).
+        parser_version: The parser module's PARSER_VERSION (see
+            parser_version()).
+        competition_date: Stamped onto every result, so part of the key.
+        competition_name: The caller's name override, or None if the name
+            was recovered from the source.
+    """
+
+    source: str
+    competition_id: str
+    parser_version: str
+    competition_date: date
+    competition_name: Optional[str] = None
+
+    def _columns(self) -> tuple[str, str, str, str]:
+        return (
+            self.source,
+            self.competition_id,
+            self.competition_date.isoformat(),
+            self.competition_name or "",
+        )
+
+
+class ParsedResultsCache:
+    """A thread-safe store of parsed competition results, keyed by
+    ResultsKey.
+
+    An entry written by a different parser_version than the one asked for
+    is a miss, and is replaced when the fresh parse is stored.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_age_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create a ParsedResultsCache.
+
+        Args:
+            path: The SQLite file to store results in - created (along
+                with its parent directory) if it doesn't exist yet.
+            max_age_seconds: Entries older than this are misses, so a
+                competition whose results are still being posted is
+                re-parsed (see ThrottledClient's cache_max_age_seconds).
+                None means entries never expire.
+            clock: Injectable wall clock - tests supply a fake so expiry is
+                deterministic.
+        """
+        if max_age_seconds is not None and max_age_seconds < 0:
+            raise ValueError(f"max_age_seconds must be >= 0, got {max_age_seconds}")
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            columns = self._conn.execute("PRAGMA table_info(parsed_results)").fetchall()
+            if any(name == "parser_version" and kind != "TEXT" for _, name, kind, *_ in columns):
+                # Written before parser versions were source digests - it's
+                # only a cache, so start it over.
+                self._conn.execute("DROP TABLE parsed_results")
+            self._conn.execute(_SCHEMA)
+
+    def get(self, key: ResultsKey) -> Optional[list[CompetitionResult]]:
+        """Returns the cached results for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT parser_version, stored_at, payload FROM parsed_results "
+                "WHERE source = ? AND competition_id = ? AND competition_date = ? "
+                "AND name_override = ?",
+                key._columns(),
+            ).fetchone()
+            fresh = (
+                row is not None
+                and row[0] == key.parser_version
+                and (self.max_age_seconds is None or self._clock() - row[1] < self.max_age_seconds)
+            )
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if not fresh:
+            return None
+        return _decode(row[2])
+
+    def put(self, key: ResultsKey, results: list[CompetitionResult]) -> None:
+        """Stores results under key, replacing any older entry for the same
+        competition (including one from an older parser version)."""
+        payload = _encode(results)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parsed_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key._columns(), key.parser_version, self._clock(), payload),
+            )
+
+    def get_or_parse(
+        self, key: ResultsKey, parse: Callable[[], list[CompetitionResult]]
+    ) -> list[CompetitionResult]:
+        """Returns the cached results for key, or calls parse() and caches
+        what it returns."""
+        results = self.get(key)
+        if results is None:
+            results = parse()
+            self.put(key, results)
+        return results
+
+    def clear(self) -> None:
+        """Drops every cached entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM parsed_results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _encode(results: list[CompetitionResult]) -> bytes:
+    dances: dict[Dance, int] = {}
+    strings: dict[str, int] = {}
+
+    def dance_idx(dance: Dance) -> int:
+        return dances.setdefault(dance, len(dances))
+
+    def string_idx(value: str) -> int:
+        return strings.setdefault(value, len(strings))
+
+    rows = [
+        [
+            dance_idx(result.dance),
+            string_idx(result.lead.first),
+            string_idx(result.lead.last),
+            string_idx(result.follow.first),
+            string_idx(result.follow.last),
+            result.place,
+            result.num_rounds,
+            string_idx(result.competition_name),
+            string_idx(result.competition_date.isoformat()),
+            [dance_idx(dance) for dance in result.event_dances],
+        ]
+        for result in results
+    ]
+    columns = {
+        "dances": [[dance.level, dance.style, dance.dance] for dance in dances],
+        "strings": list(strings),
+        "rows": rows,
+    }
+    return zlib.compress(json.dumps(columns, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode(payload: bytes) -> list[CompetitionResult]:
+    columns = json.loads(zlib.decompress(payload))
+    dances = [Dance(level, style, name) for level, style, name in columns["dances"]]
+    strings = columns["strings"]
+    refs: dict[tuple[int, int], DancerRef] = {}
+    dates: dict[int, date] = {}
+
+    def ref(first: int, last: int) -> DancerRef:
+        if (first, last) not in refs:
+            refs[first, last] = DancerRef(first=strings[first], last=strings[last])
+        return refs[first, last]
+
+    def day(idx: int) -> date:
+        if idx not in dates:
+            dates[idx] = date.fromisoformat(strings[idx])
+        return dates[idx]
+
+    return [
+        CompetitionResult(
+            dance=dances[dance],
+            lead=ref(lead_first, lead_last),
+            follow=ref(follow_first, follow_last),
+            place=place,
+            num_rounds=num_rounds,
+            competition_name=strings[name],
+            competition_date=day(comp_date),
+            event_dances=tuple(dances[idx] for idx in event_dances),
+        )
+        for (
+            dance,
+            lead_first,
+            lead_last,
+            follow_first,
+            follow_last,
+            place,
+            num_rounds,
+            name,
+            comp_date,
+            event_dances,
+        ) in columns["rows"]
+    ]
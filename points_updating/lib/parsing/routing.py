@@ -14,11 +14,18 @@ results through (at least) two distinct front-end templates:
 
 See points_updating/lib/parsing/comporganizer.py's module docstring for
 how each is confirmed against real competition data.
+
+Given a ParsedResultsCache, a competition parsed before (by the same
+parser version) is returned from it without fetching anything. A dance.am
+competition's id is only known after fetching its page, so those are
+cached under the URL instead.
 """
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Optional
+from typing import Callable, Optional
 from urllib.parse import parse_qs, urlparse
 
 import requests
@@ -26,18 +33,35 @@ import requests
 from points_updating.lib.models.result import CompetitionResult
 from points_updating.lib.parsing import ballroom_comp_express, comporganizer, o2cm
 from points_updating.lib.parsing.http_client import ThrottledClient
+from points_updating.lib.parsing.results_cache import ParsedResultsCache, ResultsKey
 
 _O2CM_HOST = "results.o2cm.com"
 _BALLROOM_COMP_EXPRESS_HOST = "ballroomcompexpress.com"
 
 _CBID_RE = re.compile(r'var cbid = "([^"]+)"')
 
+# How many competitions parse_results_urls() fetches at once. Requests to
+# any one host are still paced by the shared ThrottledClient, so this mostly
+# decides how many different hosts are being fetched from in parallel.
+_MAX_CONCURRENT_COMPETITIONS = 4
+
+
+class ResultsParseError(Exception):
+    """Raised by parse_results_urls() when one competition's results can't
+    be fetched or parsed, naming which URL failed."""
+
+    def __init__(self, url: str, cause: Exception):
+        super().__init__(f"Failed to fetch/parse {url!r}: {cause}")
+        self.url = url
+        self.cause = cause
+
 
 def parse_results_url(
     url: str,
     competition_date: date,
     client: ThrottledClient,
     competition_name: Optional[str] = None,
+    results_cache: Optional[ParsedResultsCache] = None,
 ) -> list[CompetitionResult]:
     """Fetches and parses a competition's results from whichever of the
     three supported sources the URL points to.
@@ -51,6 +75,8 @@ def parse_results_url(
         client: The HTTP client to fetch with.
         competition_name: Overrides the name recovered from the source
             itself, if given.
+        results_cache: Where to look up (and store) the parsed results,
+            if given.
     Returns:
         One CompetitionResult per (couple, dance) across the competition.
     Raises:
@@ -60,14 +86,47 @@ def parse_results_url(
 
     if host == _O2CM_HOST:
         comp_id = _query_param(url, "event")
-        name = competition_name or o2cm.fetch_competition_name(comp_id, client)
-        return o2cm.parse_competition(comp_id, name, competition_date, client)
+
+        def parse_o2cm() -> list[CompetitionResult]:
+            name = competition_name or o2cm.fetch_competition_name(comp_id, client)
+            return o2cm.parse_competition(comp_id, name, competition_date, client)
+
+        key = ResultsKey("o2cm", comp_id, o2cm.PARSER_VERSION, competition_date, competition_name)
+        return _cached(results_cache, key, parse_o2cm)
 
     if host == _BALLROOM_COMP_EXPRESS_HOST:
         cid = int(_query_param(url, "cid"))
-        name = competition_name or ballroom_comp_express.fetch_competition_name(cid, client)
-        return ballroom_comp_express.parse_competition(cid, name, competition_date, client)
 
+        def parse_bce() -> list[CompetitionResult]:
+            name = competition_name or ballroom_comp_express.fetch_competition_name(cid, client)
+            return ballroom_comp_express.parse_competition(cid, name, competition_date, client)
+
+        key = ResultsKey(
+            "ballroom_comp_express",
+            str(cid),
+            ballroom_comp_express.PARSER_VERSION,
+            competition_date,
+            competition_name,
+        )
+        return _cached(results_cache, key, parse_bce)
+
+    key = ResultsKey(
+        "comporganizer", url, comporganizer.PARSER_VERSION, competition_date, competition_name
+    )
+    return _cached(
+        results_cache,
+        key,
+        lambda: _parse_dance_am(url, host, competition_date, client, competition_name),
+    )
+
+
+def _parse_dance_am(
+    url: str,
+    host: str,
+    competition_date: date,
+    client: ThrottledClient,
+    competition_name: Optional[str],
+) -> list[CompetitionResult]:
     response = client.get(url)
     response.raise_for_status()
     cbid_match = _CBID_RE.search(response.text)
@@ -92,6 +151,81 @@ def parse_results_url(
     return comporganizer.parse_competition(comp_year_id, name, competition_date, client)
 
 
+def _cached(
+    results_cache: Optional[ParsedResultsCache],
+    key: ResultsKey,
+    parse: Callable[[], list[CompetitionResult]],
+) -> list[CompetitionResult]:
+    if results_cache is None:
+        return parse()
+    return results_cache.get_or_parse(key, parse)
+
+
+def parse_results_urls(
+    competitions: list[tuple[str, date]],
+    client: ThrottledClient,
+    max_workers: int = _MAX_CONCURRENT_COMPETITIONS,
+    results_cache: Optional[ParsedResultsCache] = None,
+    on_finished: Optional[Callable[[int], None]] = None,
+) -> list[list[CompetitionResult]]:
+    """Fetches and parses several competitions at once, via
+    parse_results_url().
+
+    Competitions on different hosts download in parallel rather than one
+    after another; competitions on the same host share that host's rate
+    and concurrency limits in client, so running them together never
+    fetches from one site any faster than parsing them sequentially would.
+
+    Args:
+        competitions: (results-page URL, competition date) pairs.
+        client: The HTTP client every competition fetches with.
+        max_workers: The most competitions being fetched at once.
+        results_cache: Passed through to parse_results_url().
+        on_finished: Called with how many competitions have finished so
+            far (successfully or not) each time another one does, from the
+            thread that finished it - e.g. to report progress.
+    Returns:
+        Each competition's results, in the same order as competitions -
+        ready for UpdateEngine.run_backfill(), which puts them in date
+        order itself.
+    Raises:
+        ResultsParseError: for the first competition (in input order) that
+            failed. Competitions not yet started when it's raised are
+            cancelled.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(
+                parse_results_url, url, competition_date, client, results_cache=results_cache
+            )
+            for url, competition_date in competitions
+        ]
+        if on_finished is not None:
+            lock = threading.Lock()
+            finished = 0
+
+            def count_finished(_future) -> None:
+                nonlocal finished
+                with lock:
+                    finished += 1
+                    on_finished(finished)
+
+            for future in futures:
+                future.add_done_callback(count_finished)
+        parsed = []
+        for (url, _), future in zip(competitions, futures):
+            try:
+                parsed.append(future.result())
+            except Exception as e:
+                raise ResultsParseError(url, e) from e
+        return parsed
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _query_param(url: str, name: str) -> str:
     values = parse_qs(urlparse(url).query).get(name)
     if not values:
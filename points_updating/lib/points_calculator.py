@@ -4,17 +4,26 @@ Provides PointsCalculator, which scores one CompetitionResult against a
 couple's current proficiency levels: detecting the Split-Level Exception
 (which triples the award) and cascading the resulting award down through
 lower levels via utils's award table and cascade logic.
+
+compute_batch() applies the same rules to a whole competition at once,
+reading both partners' points straight from a PointsLedger and scoring
+every award and split-level check as array operations, then cascading
+each award through cascade's interned templates.
 """
 
+from collections.abc import Collection
 from dataclasses import dataclass
 
+import numpy as np
+
+from points_updating.lib.ledger import PointsLedger
 from points_updating.lib.models.result import CompetitionResult
 from points_updating.lib.rules import award_table, cascade
 from points_updating.lib.rules.cascade import PointDelta
-from utils.lib import constants
 from utils.lib.constants import Style
 from utils.lib.models.dancer import Dancer
 from utils.lib.proficiency_calculator import ProficiencyCalculator
+from utils.lib.proficiency_table import compute_proficiency_levels
 
 
 @dataclass
@@ -60,25 +69,99 @@ class PointsCalculator:
         # its docstring): the higher of each partner's proficiency across
         # every dance in the combo, falling back to a single dance's level
         # for a single-dance event.
-        lead_level = max(
-            ProficiencyCalculator.compute_proficiency_level(lead, dance.style, d.dance)
-            for d in result.event_dances
+        event_dance_names = [d.dance for d in result.event_dances]
+        lead_level = ProficiencyCalculator.compute_proficiency_table(lead).max_level(
+            dance.style, event_dance_names
         )
-        follow_level = max(
-            ProficiencyCalculator.compute_proficiency_level(follow, dance.style, d.dance)
-            for d in result.event_dances
+        follow_level = ProficiencyCalculator.compute_proficiency_table(follow).max_level(
+            dance.style, event_dance_names
         )
         # None if the couple doesn't qualify for the Split-Level Exception.
         combined_level = ProficiencyCalculator.compute_split_level_combined_level(
             lead_level, follow_level
         )
-        event_level = constants.LEVELS.index(dance.level)
+        event_level = dance.level_idx
         # Only applies if they also danced at the exception's designated level.
         is_split_level = combined_level is not None and combined_level == event_level
-        if is_split_level:
-            danced, one_below, two_plus_below = danced * 3, one_below * 3, two_plus_below * 3
 
         delta = cascade.build_cascade_delta(
-            result.event_dances, (danced, one_below, two_plus_below)
+            result.event_dances,
+            (danced, one_below, two_plus_below),
+            scale=3 if is_split_level else 1,
         )
         return ResultAward(result=result, is_split_level=is_split_level, delta=delta)
+
+    @staticmethod
+    def compute_batch(
+        results: list[CompetitionResult], ledger: PointsLedger, newcomers: Collection[str]
+    ) -> list[ResultAward]:
+        """Scores every result of one competition in one vectorized pass -
+        for each result, exactly what compute() returns for it.
+
+        Args:
+            results: The competition's results. Every partner must already
+                be in ledger.
+            ledger: Both partners' current totals - proficiency is read
+                from their rows as of immediately before this competition.
+            newcomers: Full names of the dancers who are newcomers at this
+                competition (see Dancer.is_newcomer()).
+        Returns:
+            One ResultAward per result, in the same order.
+        Raises:
+            ValueError: if any result's style isn't eligible for points
+                (e.g. Nightclub).
+        """
+        if not results:
+            return []
+        num_results = len(results)
+        level_idx = np.empty(num_results, dtype=int)
+        num_rounds = np.empty(num_results, dtype=int)
+        places = np.empty(num_results, dtype=int)
+        # [result, column]: how many of the event's dances fall in that
+        # syllabus column (the combo's dances, or the one danced).
+        dance_counts = np.zeros((num_results, 19), dtype=int)
+        partner_rows = np.empty((num_results, 2), dtype=int)
+        for i, result in enumerate(results):
+            dance = result.dance
+            if dance.column is None or dance.level_idx is None:
+                raise ValueError(f"'{dance}' is not eligible for points.")
+            level_idx[i] = dance.level_idx
+            num_rounds[i] = result.num_rounds
+            places[i] = result.place
+            for event_dance in result.event_dances:
+                dance_counts[i, event_dance.column] += 1
+            partner_rows[i] = (
+                ledger.row(result.lead.full_name),
+                ledger.row(result.follow.full_name),
+            )
+
+        awards = award_table.compute_awards(num_rounds, places)
+
+        # Proficiency for every dancer involved, then each partner's
+        # combo-wide level (see compute()).
+        dancer_rows, inverse = np.unique(partner_rows, return_inverse=True)
+        is_newcomer = np.isin(dancer_rows, [ledger.row(name) for name in newcomers])
+        syllabus_pts, open_pts = ledger.gather(dancer_rows)
+        levels = compute_proficiency_levels(syllabus_pts, open_pts, is_newcomer)
+        partner_levels = levels[inverse.reshape(num_results, 2)]
+        partner_levels = np.where(dance_counts[:, None, :] > 0, partner_levels, -1).max(axis=-1)
+        lead_level, follow_level = partner_levels[:, 0], partner_levels[:, 1]
+
+        # Split-Level Exception - see compute_split_level_combined_level().
+        combined_level = np.maximum(lead_level, follow_level) - 1
+        is_split_level = (np.abs(lead_level - follow_level) >= 2) & (combined_level == level_idx)
+
+        # Cascade each award through its interned template - see
+        # cascade.build_cascade_delta(). Results share a few hundred
+        # distinct cascades, so looking each up beats building every delta
+        # as arrays.
+        deltas = [
+            cascade.build_cascade_delta(result.event_dances, award, scale=3 if split else 1)
+            for result, award, split in zip(
+                results, map(tuple, awards.tolist()), is_split_level.tolist()
+            )
+        ]
+        return [
+            ResultAward(result=result, is_split_level=bool(is_split_level[i]), delta=deltas[i])
+            for i, result in enumerate(results)
+        ]
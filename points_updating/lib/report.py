@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from itertools import groupby
 
 from points_updating.lib.points_calculator import ResultAward
-from points_updating.lib.rules.cascade import PointDelta
+from points_updating.lib.rules.cascade import SYLLABUS_CELLS, PointDelta
 from utils.lib import constants
 from utils.lib.points import Points
 
@@ -144,23 +144,24 @@ def _level_breakdown(delta: PointDelta) -> list[tuple[str, int]]:
     level below it - what a dancer actually cares about, rather than one
     opaque combined total.
 
-    Each affected row's cells share one point value (either a single
+    Each affected level's cells share one point value (either a single
     (style, dance) cell for a syllabus event, or every cell in that style
     for an open event's cascade into syllabus levels) - max() reads that
     shared value directly, where sum() would overcount an open cascade's
-    multi-cell row.
+    multi-cell level.
     """
-    breakdown = [
-        (level, int(row.max()))
-        for level, row in zip(constants.SYLLABUS_LEVELS, delta.syllabus)
-        if row.max()
+    by_level: dict[int, int] = {}
+    for cell, pts in zip(delta.cells.tolist(), delta.pts.tolist()):
+        if cell < SYLLABUS_CELLS:
+            level_idx = cell // 19
+        else:
+            level_idx = len(constants.SYLLABUS_LEVELS) + (cell - SYLLABUS_CELLS) // 4
+        by_level[level_idx] = max(by_level.get(level_idx, 0), pts)
+    return [
+        (constants.LEVELS[level_idx], pts)
+        for level_idx, pts in sorted(by_level.items(), reverse=True)
+        if pts
     ]
-    breakdown += [
-        (level, int(row.max()))
-        for level, row in zip(constants.OPEN_LEVELS, delta.open)
-        if row.max()
-    ]
-    return list(reversed(breakdown))
 
 
 def _ordinal(n: int) -> str:
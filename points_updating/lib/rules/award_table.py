@@ -5,6 +5,8 @@ what place a couple earned in it. Events with only one round ("Final
 Only") always award zero points, regardless of placement.
 """
 
+import numpy as np
+
 # Each value is (danced level, one level below, two-or-more levels below).
 _SEMI_FINAL: dict[int, tuple[int, int, int]] = {
     1: (3, 6, 7),
@@ -46,3 +48,37 @@ def compute_award(num_rounds: int, place: int) -> tuple[int, int, int]:
         return (0, 0, 0)
     table = _SEMI_FINAL if num_rounds == 2 else _QUARTER_OR_MORE
     return table.get(place, (0, 0, 0))
+
+
+def _award_array(table: dict[int, tuple[int, int, int]]) -> np.ndarray:
+    """A table as a (7, 3) array indexed by place, with row 0 (and so any
+    unlisted place mapped onto it) scoring (0, 0, 0)."""
+    awards = np.zeros((max(table) + 1, 3), dtype=int)
+    for place, award in table.items():
+        awards[place] = award
+    return awards
+
+
+# [rounds class, place]: rounds class 0 = Final Only, 1 = Semi-Final,
+# 2 = Quarter Final or more.
+_AWARDS = np.stack(
+    [np.zeros((7, 3), dtype=int), _award_array(_SEMI_FINAL), _award_array(_QUARTER_OR_MORE)]
+)
+
+
+def compute_awards(num_rounds: np.ndarray, places: np.ndarray) -> np.ndarray:
+    """compute_award() for many placements at once.
+
+    Args:
+        num_rounds: Length-K array of rounds each event ran.
+        places: Length-K array of 1-based placements.
+    Returns:
+        A Kx3 int array, one compute_award() tuple per row.
+    Raises:
+        ValueError: if any num_rounds < 1.
+    """
+    if (num_rounds < 1).any():
+        raise ValueError(f"num_rounds must be >= 1, got {num_rounds.min()}")
+    rounds_class = np.minimum(num_rounds, 3) - 1
+    place_idx = np.where((places >= 1) & (places < _AWARDS.shape[1]), places, 0)
+    return _AWARDS[rounds_class, place_idx]
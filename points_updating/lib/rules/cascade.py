@@ -4,26 +4,88 @@ style.
 See build_cascade_delta() below for the syllabus/open mechanics, and
 award_table.compute_award for the per-placement point values being
 cascaded.
+
+The space of distinct cascades - (level, style, dance set, award) - is
+tiny next to the number of results scored, so each is built once and
+interned as a read-only template (see _cascade_template()).
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Iterator
 
 import numpy as np
 
 from utils.lib import constants
+from utils.lib.constants import Style
 from utils.lib.models.dance import Dance
 
+# A PointDelta's cells index Points.linear_data()'s layout: the 4x19
+# syllabus cells row by row, then the 3x4 open cells.
+SYLLABUS_CELLS = 4 * 19
+OPEN_CELLS = 3 * 4
+
 
 @dataclass
 class PointDelta:
-    """Per-cell point deltas, same shape/layout as Points.syllabus_data/open_data."""
+    """Per-cell point deltas, stored sparsely - an award touches a handful
+    of cells out of a dancer's 88.
+
+    Attributes:
+        cells: int8 indices of the touched cells, in Points.linear_data()
+            order (syllabus row * 19 + column, then SYLLABUS_CELLS + open
+            row * 4 + column).
+        pts: int16 points added to each of cells.
+    """
+
+    cells: np.ndarray
+    pts: np.ndarray
+
+    @classmethod
+    def from_dense(cls, syllabus: np.ndarray, open_: np.ndarray) -> "PointDelta":
+        """Builds a PointDelta from arrays shaped like
+        Points.syllabus_data/open_data, keeping only non-zero cells."""
+        dense = np.concatenate([syllabus.reshape(-1), open_.reshape(-1)])
+        cells = np.flatnonzero(dense)
+        return cls(cells.astype(np.int8), dense[cells].astype(np.int16))
+
+    @classmethod
+    def batch_from_dense(cls, syllabus: np.ndarray, open_: np.ndarray) -> list["PointDelta"]:
+        """from_dense() for a stack of Kx4x19/Kx3x4 deltas at once."""
+        num_deltas = len(syllabus)
+        dense = np.concatenate(
+            [syllabus.reshape(num_deltas, -1), open_.reshape(num_deltas, -1)], axis=1
+        )
+        delta_idx, cells = np.nonzero(dense)
+        pts = dense[delta_idx, cells].astype(np.int16)
+        bounds = np.cumsum(np.bincount(delta_idx, minlength=num_deltas))[:-1]
+        return [
+            cls(delta_cells, delta_pts)
+            for delta_cells, delta_pts in zip(
+                np.split(cells.astype(np.int8), bounds), np.split(pts, bounds)
+            )
+        ]
+
+    @property
+    def syllabus(self) -> np.ndarray:
+        """Dense 4x19 view, same shape/layout as Points.syllabus_data."""
+        return self._dense(0, SYLLABUS_CELLS).reshape(4, 19)
+
+    @property
+    def open(self) -> np.ndarray:
+        """Dense 3x4 view, same shape/layout as Points.open_data."""
+        return self._dense(SYLLABUS_CELLS, OPEN_CELLS).reshape(3, 4)
 
-    syllabus: np.ndarray
-    open: np.ndarray
+    def _dense(self, start: int, size: int) -> np.ndarray:
+        dense = np.zeros(size, dtype=int)
+        in_range = (self.cells >= start) & (self.cells < start + size)
+        np.add.at(dense, self.cells[in_range] - start, self.pts[in_range])
+        return dense
 
 
-def build_cascade_delta(dances: tuple[Dance, ...], award: tuple[int, int, int]) -> PointDelta:
+def build_cascade_delta(
+    dances: tuple[Dance, ...], award: tuple[int, int, int], scale: int = 1
+) -> PointDelta:
     """Builds the full syllabus/open point delta for one placement's award.
 
     Syllabus event points cascade down each dance's own (style, dance)
@@ -42,34 +104,65 @@ def build_cascade_delta(dances: tuple[Dance, ...], award: tuple[int, int, int])
             share the same (level, style); only the specific dance name
             varies.
         award: The (danced level, one level below, two-or-more levels below)
-            point values from award_table.compute_award (or that tuple
-            scaled up for the Split-Level Exception).
+            point values from award_table.compute_award.
+        scale: Multiplies every cell - 3 for the Split-Level Exception.
     Returns:
-        A PointDelta with award cascaded into every affected cell.
+        A PointDelta with award cascaded into every affected cell. Its
+        arrays are read-only, and shared between calls when scale is 1.
     """
+    representative = dances[0]
+    template = _cascade_template(
+        representative.level,
+        representative.style,
+        tuple(sorted(dance.dance for dance in dances)),
+        award,
+    )
+    if scale == 1:
+        return template
+    return _read_only(template.cells, template.pts * scale)
+
+
+@functools.lru_cache(maxsize=None)
+def _cascade_template(
+    level: str, style: Style, dance_names: tuple[str, ...], award: tuple[int, int, int]
+) -> PointDelta:
+    """The interned delta for one (level, style, dance set, award) - see
+    _compute_cascade_delta()."""
+    delta = _compute_cascade_delta(level, style, dance_names, award)
+    return _read_only(delta.cells, delta.pts)
+
+
+def _read_only(cells: np.ndarray, pts: np.ndarray) -> PointDelta:
+    cells.flags.writeable = False
+    pts.flags.writeable = False
+    return PointDelta(cells, pts)
+
+
+def _compute_cascade_delta(
+    level: str, style: Style, dance_names: tuple[str, ...], award: tuple[int, int, int]
+) -> PointDelta:
+    """Builds build_cascade_delta()'s delta from scratch, with no interning."""
     danced, one_below, two_plus_below = award
     syllabus = np.zeros((4, 19), dtype=int)
     open_ = np.zeros((3, 4), dtype=int)
 
-    representative = dances[0]
-    if representative.level in constants.SYLLABUS_LEVELS:
-        row = constants.SYLLABUS_LEVELS.index(representative.level)
-        style_offset = constants.SYLLABUS_COLUMN_OFFSETS[representative.style]
-        for dance in dances:
-            col = style_offset + constants.DANCE_NAMES[dance.style].index(dance.dance)
+    if level in constants.SYLLABUS_LEVEL_INDEX:
+        row = constants.SYLLABUS_LEVEL_INDEX[level]
+        for dance_name in dance_names:
+            col = constants.SYLLABUS_COLUMNS[style, dance_name]
             for r, pts in _levels_below(row, danced, one_below, two_plus_below):
                 syllabus[r][col] += pts
     else:
-        unified_idx = constants.LEVELS.index(representative.level)
+        unified_idx = constants.LEVEL_INDEX[level]
         for r, pts in _levels_below(unified_idx, danced, one_below, two_plus_below):
             if r < 4:
-                start = constants.SYLLABUS_COLUMN_OFFSETS[representative.style]
-                end = start + len(constants.DANCE_NAMES[representative.style])
+                start = constants.SYLLABUS_COLUMN_OFFSETS[style]
+                end = start + len(constants.DANCE_NAMES[style])
                 syllabus[r][start:end] += pts
             else:
-                open_[r - 4][constants.STYLES.index(representative.style)] += pts
+                open_[r - 4][constants.STYLE_INDEX[style]] += pts
 
-    return PointDelta(syllabus, open_)
+    return PointDelta.from_dense(syllabus, open_)
 
 
 def _levels_below(
@@ -5,11 +5,24 @@ against a running ledger of Dancers, and run_backfill(), which repeats that
 across every competition needed to catch the CDA points database up to the
 present. See process_competition() for the ledger-ordering guarantee this
 relies on.
+
+run_backfill() resolves every dancer it will need up front, concurrently,
+before any scoring starts (see prefetch_dancers()) - each lookup is a
+blocking round-trip to the CDA points database, and a large backfill
+otherwise spends most of its wall time waiting on them one at a time.
+
+Running totals live in a columnar PointsLedger (see
+points_updating.lib.ledger): each competition's deltas are gathered into
+one batch and scatter-added in a single pass once every result is scored.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Callable
+from typing import Callable, Optional
+
+import numpy as np
 
+from points_updating.lib.ledger import LedgerSnapshot, PointsLedger
 from points_updating.lib.models.result import CompetitionResult, DancerRef
 from points_updating.lib.points_calculator import PointsCalculator, ResultAward
 from points_updating.lib.rules.eligibility_filter import filter_points_eligible
@@ -24,30 +37,144 @@ class UpdateEngine:
     competition at a time.
     """
 
-    def __init__(self, lookup: Callable[[str, str], DancerRecord] = lookup_dancer):
+    def __init__(
+        self,
+        lookup: Callable[[str, str], DancerRecord] = lookup_dancer,
+        max_lookup_workers: int = 8,
+    ):
         """Create an UpdateEngine.
 
         Args:
             lookup: Fetches a DancerRecord for a first/last name, called the
                 first time a dancer appears in the ledger. Defaults to the
-                real CDA API; tests inject a fake instead.
+                real CDA API; tests inject a fake instead. Must be safe to
+                call from several threads at once (see prefetch_dancers()).
+            max_lookup_workers: The most lookups prefetch_dancers() keeps
+                in flight at once - bounded so a large backfill doesn't
+                flood the CDA points database with simultaneous requests.
         """
+        if max_lookup_workers < 1:
+            raise ValueError(f"max_lookup_workers must be >= 1, got {max_lookup_workers}")
         self._lookup = lookup
+        self._max_lookup_workers = max_lookup_workers
         self._ledger: dict[str, Dancer] = {}
+        # Every ledgered Dancer's .points is a view onto its row here.
+        self._points = PointsLedger()
         self._starting_points: dict[str, Points] = {}
+        # Records already fetched by prefetch_dancers() but not yet
+        # ledgered - consumed by _get_or_create() on each dancer's first
+        # appearance, so the Dancer is still built with that competition's
+        # date, exactly as if it had been looked up right then.
+        self._prefetched: dict[str, DancerRecord] = {}
+        # Kept so snapshot() can hand back everything needed to rebuild
+        # each Dancer exactly as it was first ledgered.
+        self._records: dict[str, DancerRecord] = {}
+        self._first_seen: dict[str, date] = {}
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: LedgerSnapshot,
+        lookup: Callable[[str, str], DancerRecord] = lookup_dancer,
+        max_lookup_workers: int = 8,
+        known_records: Optional[dict[str, DancerRecord]] = None,
+    ) -> "UpdateEngine":
+        """Rebuilds an UpdateEngine whose ledger resumes from snapshot.
+
+        starting_totals() then reports each resumed dancer's totals as of
+        the snapshot, so a report built afterward explains only what was
+        processed since.
+
+        Args:
+            snapshot: A state previously returned by snapshot().
+            lookup: Same as __init__().
+            max_lookup_workers: Same as __init__().
+            known_records: Baseline records of dancers not in snapshot
+                (e.g. ones a replayed competition will ledger again) -
+                used instead of looking them up, so a replay starts from
+                the same baseline as the original run.
+        """
+        engine = cls(lookup=lookup, max_lookup_workers=max_lookup_workers)
+        for row, name in enumerate(snapshot.names):
+            record = snapshot.records[name]
+            dancer = Dancer.from_data(snapshot.first_seen[name], record)
+            points = Points(snapshot.syllabus[row].copy(), snapshot.open[row].copy())
+            engine._starting_points[name] = points
+            dancer.points = engine._points.add(name, points)
+            engine._ledger[name] = dancer
+            engine._records[name] = record
+            engine._first_seen[name] = snapshot.first_seen[name]
+        for name, record in (known_records or {}).items():
+            if name not in engine._ledger:
+                engine._prefetched[name] = record
+        return engine
+
+    def snapshot(self) -> LedgerSnapshot:
+        """Returns a copy of the ledger's current state, for
+        from_snapshot() to resume from later."""
+        names = self._points.names()
+        rows = np.array([self._points.row(name) for name in names], dtype=int)
+        syllabus, open_ = self._points.gather(rows)
+        return LedgerSnapshot(
+            names=names,
+            records={name: self._records[name] for name in names},
+            first_seen={name: self._first_seen[name] for name in names},
+            syllabus=syllabus,
+            open=open_,
+        )
+
+    def prefetch_dancers(self, competitions: list[list[CompetitionResult]]) -> None:
+        """Looks up every not-yet-ledgered dancer across competitions
+        concurrently, ahead of scoring.
+
+        Only dancers in results that survive the same filtering/event
+        selection process_competition() applies are fetched, each exactly
+        once (deduplicated by full name) no matter how many results or
+        competitions they appear in. Nothing is ledgered here - the
+        fetched records are held until process_competition() first needs
+        each dancer, so the ledger is built in the same chronological
+        order, with the same first-appearance dates, as without a
+        prefetch.
+
+        Args:
+            competitions: Each competition's results, in any order.
+        Raises:
+            DancerLookupError: if any lookup fails (propagated from
+                self._lookup).
+        """
+        refs: dict[str, DancerRef] = {}
+        for results in competitions:
+            for result in _scorable(results):
+                for ref in (result.lead, result.follow):
+                    if ref.full_name not in self._ledger and ref.full_name not in self._prefetched:
+                        refs.setdefault(ref.full_name, ref)
+        if not refs:
+            return
+
+        workers = min(self._max_lookup_workers, len(refs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            records = executor.map(lambda ref: self._lookup(ref.first, ref.last), refs.values())
+            self._prefetched.update(zip(refs.keys(), records))
 
     def _get_or_create(self, ref: DancerRef, comp_date: date) -> Dancer:
-        """Returns the ledgered Dancer for ref, fetching and ledgering one
-        via self._lookup on its first appearance.
+        """Returns the ledgered Dancer for ref, ledgering one on its first
+        appearance - from prefetch_dancers()'s record if there is one,
+        otherwise fetched via self._lookup right now.
         """
         dancer = self._ledger.get(ref.full_name)
         if dancer is None:
-            dancer = Dancer.from_data(comp_date, self._lookup(ref.first, ref.last))
-            self._ledger[ref.full_name] = dancer
+            record = self._prefetched.pop(ref.full_name, None)
+            if record is None:
+                record = self._lookup(ref.first, ref.last)
+            dancer = Dancer.from_data(comp_date, record)
             # Take starting snapshot for comparison
             self._starting_points[ref.full_name] = Points(
                 dancer.points.syllabus_data.copy(), dancer.points.open_data.copy()
             )
+            dancer.points = self._points.add(ref.full_name, dancer.points)
+            self._ledger[ref.full_name] = dancer
+            self._records[ref.full_name] = record
+            self._first_seen[ref.full_name] = comp_date
         else:
             dancer.curr_comp_date = comp_date
         return dancer
@@ -68,8 +195,7 @@ class UpdateEngine:
             event selection (in the same order), i.e., every result that
             was actually scored.
         """
-        results = filter_points_eligible(results)
-        results = select_points_event_results(results)
+        results = _scorable(results)
         if not results:
             return []
 
@@ -80,13 +206,20 @@ class UpdateEngine:
             for ref in (result.lead, result.follow)
         }
 
-        awards = [
-            PointsCalculator.compute(result, dancers[result.lead], dancers[result.follow])
-            for result in results
-        ]
-        for result, award in zip(results, awards):
-            dancers[result.lead].points.add(award.delta.syllabus, award.delta.open)
-            dancers[result.follow].points.add(award.delta.syllabus, award.delta.open)
+        newcomers = {ref.full_name for ref, dancer in dancers.items() if dancer.is_newcomer()}
+        awards = PointsCalculator.compute_batch(results, self._points, newcomers)
+
+        # Each award is owed identically to both partners: every touched
+        # cell is applied once to the lead's row and once to the follow's.
+        cells = np.concatenate([award.delta.cells for award in awards])
+        pts = np.concatenate([award.delta.pts for award in awards])
+        cells_per_award = [len(award.delta.cells) for award in awards]
+        lead_rows = [self._points.row(result.lead.full_name) for result in results]
+        follow_rows = [self._points.row(result.follow.full_name) for result in results]
+        rows = np.concatenate(
+            [np.repeat(lead_rows, cells_per_award), np.repeat(follow_rows, cells_per_award)]
+        )
+        self._points.apply(rows, np.tile(cells, 2), np.tile(pts, 2))
 
         return awards
 
@@ -94,6 +227,9 @@ class UpdateEngine:
         """Processes every competition in chronological order, each
         building on the ledger state left by the last.
 
+        Every dancer is looked up first, concurrently (see
+        prefetch_dancers()), so scoring itself does no network I/O.
+
         Args:
             competitions: Each competition's results - order doesn't
                 matter, this sorts by competition_date before processing.
@@ -105,6 +241,7 @@ class UpdateEngine:
                 competition_date to sort it by.
         """
         comps_chronological = sorted(competitions, key=_competition_date)
+        self.prefetch_dancers(comps_chronological)
         return [self.process_competition(results) for results in comps_chronological]
 
     def final_totals(self) -> dict[str, Dancer]:
@@ -124,6 +261,14 @@ class UpdateEngine:
         return dict(self._starting_points)
 
 
+def _scorable(results: list[CompetitionResult]) -> list[CompetitionResult]:
+    """The subset of one competition's results that actually get scored -
+    shared by process_competition() and prefetch_dancers() so the two can
+    never disagree about which dancers need looking up.
+    """
+    return select_points_event_results(filter_points_eligible(results))
+
+
 def _competition_date(results: list[CompetitionResult]) -> date:
     """Sort key for run_backfill.
 
@@ -1,36 +1,114 @@
 """Flask app factory and console-script entry point for the points-updater web UI.
 
 Usage:
-    points-updater-web
+    points-updater-web [--requests-per-second RATE] [--burst N]
 
     (or via -m: python -m points_updating.lib.webapp.app)
 """
 
+import argparse
 import os
 import pathlib
+from typing import Callable, Optional
 
 from flask import Flask
 
+from points_updating.lib.parsing.http_client import (
+    DEFAULT_BURST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    ThrottledClient,
+)
+from points_updating.lib.parsing.results_cache import ParsedResultsCache
 from points_updating.lib.webapp import routes
+from points_updating.lib.webapp.update_service import build_results_client
+from utils.lib.api.cache import DancerRecordCache
+from utils.lib.api.client import DancerLookupClient, DancerRecord
+from utils.lib.jobs import JobManager
 
 # templates/ and static/ are siblings of this file within webapp/.
 _PACKAGE_ROOT = pathlib.Path(__file__).resolve().parent
 
+_DANCER_CACHE_PATH = pathlib.Path("data/cache/dancers.sqlite3")
+_PARSED_RESULTS_CACHE_PATH = pathlib.Path("data/cache/parsed_results.sqlite3")
 
-def create_app() -> Flask:
-    """Build and configure the points-updater Flask app."""
+
+def create_app(
+    job_manager: Optional[JobManager] = None,
+    results_client: Optional[ThrottledClient] = None,
+    dancer_lookup: Optional[Callable[[str, str], DancerRecord]] = None,
+    results_cache: Optional[ParsedResultsCache] = None,
+) -> Flask:
+    """Build and configure the points-updater Flask app.
+
+    Args:
+        job_manager: Runs every update submitted through the app (see
+            routes.py). Defaults to a new JobManager; tests inject their
+            own so they can wait for a job to finish.
+        results_client: Forwarded to every update's run_update(), so
+            concurrent jobs share one set of per-host rate limits - None
+            means each update opens (and closes) its own.
+        dancer_lookup: Forwarded to every update's run_update() - None
+            means each update opens (and closes) its own cached CDA API
+            lookup.
+        results_cache: Forwarded to every update's run_update(), so a
+            competition parsed by one update is reused by the next - None
+            means every update parses afresh.
+    """
     app = Flask(
         "points_updating.lib.webapp",
         template_folder=str(_PACKAGE_ROOT / "templates"),
         static_folder=str(_PACKAGE_ROOT / "static"),
     )
+    app.config["JOB_MANAGER"] = job_manager if job_manager is not None else JobManager()
+    app.config["RESULTS_CLIENT"] = results_client
+    app.config["DANCER_LOOKUP"] = dancer_lookup
+    app.config["RESULTS_CACHE"] = results_cache
     app.register_blueprint(routes.bp)
     return app
 
 
-def main() -> None:
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the points-updater web UI locally.")
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        metavar="RATE",
+        help="Average number of requests started per second against any one results site, "
+        "across every running update (default: %(default)g).",
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=DEFAULT_BURST,
+        metavar="N",
+        help="How many requests to one results site may start back-to-back before "
+        "--requests-per-second pacing applies (default: %(default)d).",
+    )
+    args = parser.parse_args(argv)
+    if args.requests_per_second <= 0:
+        parser.error("--requests-per-second must be > 0")
+    if args.burst < 1:
+        parser.error("--burst must be >= 1")
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> None:
     """Run the points-updater web UI locally."""
-    create_app().run(debug=os.environ.get("FLASK_DEBUG") == "1")
+    args = _parse_args(argv)
+    results_client = build_results_client(args.requests_per_second, args.burst)
+    results_cache = ParsedResultsCache(_PARSED_RESULTS_CACHE_PATH)
+    api_client = DancerLookupClient()
+    dancer_cache = DancerRecordCache(_DANCER_CACHE_PATH, lookup=api_client)
+    try:
+        create_app(
+            results_client=results_client, dancer_lookup=dancer_cache, results_cache=results_cache
+        ).run(debug=os.environ.get("FLASK_DEBUG") == "1")
+    finally:
+        dancer_cache.close()
+        api_client.close()
+        results_cache.close()
+        results_client.close()
 
 
 if __name__ == "__main__":
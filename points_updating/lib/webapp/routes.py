@@ -1,11 +1,35 @@
-"""HTML routes for the points-updater web UI."""
+"""HTML routes for the points-updater web UI.
 
-from flask import Blueprint, render_template, request
+Submitting the form starts the update as a background job (see
+utils.lib.jobs) and redirects to that job's page, which follows its
+progress via /jobs/<id>/events and shows the report once it's done.
+"""
+
+from typing import Any
+
+from flask import Blueprint, Response, current_app, redirect, render_template, request, url_for
 
 from points_updating.lib.webapp.update_service import UpdateError, run_update
+from utils.lib.jobs import (
+    FAILED,
+    Job,
+    JobFailed,
+    JobManager,
+    ProgressCallback,
+    fingerprint,
+    job_events,
+)
 
 bp = Blueprint("points_updater_web", __name__)
 
+_PHASE_LABELS = {
+    None: "Waiting to start",
+    "fetch": "Fetching results",
+    "lookup": "Looking up dancers",
+    "score": "Scoring",
+    "render": "Rendering report",
+}
+
 
 @bp.route("/", methods=["GET", "POST"])
 def index():
@@ -28,13 +52,64 @@ def index():
             error="At least one results link is required.",
         )
 
-    result = run_update([url for url, _ in pairs], [d for _, d in pairs], dry_run=dry_run)
+    # Looked up now, not when the job runs, so the job uses whatever
+    # run_update, results client, results cache and dancer lookup this
+    # request saw.
+    runner = run_update
+    client = current_app.config["RESULTS_CLIENT"]
+    results_cache = current_app.config["RESULTS_CACHE"]
+    lookup = current_app.config["DANCER_LOOKUP"]
+    pair_urls = [url for url, _ in pairs]
+    pair_dates = [d for _, d in pairs]
+
+    def task(progress: ProgressCallback):
+        result = runner(
+            pair_urls,
+            pair_dates,
+            lookup=lookup,
+            dry_run=dry_run,
+            progress=progress,
+            client=client,
+            results_cache=results_cache,
+        )
+        if isinstance(result, UpdateError):
+            raise JobFailed(result.message)
+        return result
+
+    job = _job_manager().submit(
+        fingerprint({"pairs": pairs, "dry_run": dry_run}),
+        task,
+        params={"submitted_pairs": submitted_pairs, "dry_run": dry_run},
+    )
+    return redirect(url_for(".job_page", job_id=job.id), code=303)
+
+
+@bp.route("/jobs/<job_id>")
+def job_page(job_id: str):
+    job = _job_manager().get(job_id)
+    if job is None:
+        return (
+            render_template(
+                "index.html",
+                submitted_pairs=[("", "")],
+                dry_run=True,
+                error="That update is no longer available - please run it again.",
+            ),
+            404,
+        )
 
-    if isinstance(result, UpdateError):
+    submitted_pairs = job.params["submitted_pairs"]
+    dry_run = job.params["dry_run"]
+    if not job.finished:
+        return render_template(
+            "index.html", submitted_pairs=submitted_pairs, dry_run=dry_run, job=_describe(job)
+        )
+    if job.status == FAILED:
         return render_template(
-            "index.html", submitted_pairs=submitted_pairs, dry_run=dry_run, error=result.message
+            "index.html", submitted_pairs=submitted_pairs, dry_run=dry_run, error=job.error
         )
 
+    result = job.result
     return render_template(
         "index.html",
         submitted_pairs=submitted_pairs,
@@ -44,3 +119,31 @@ def index():
         results_data={"__all__": result.all_text, **result.dancer_text},
         new_dancer_count=result.new_dancer_count,
     )
+
+
+@bp.route("/jobs/<job_id>/events")
+def job_progress_events(job_id: str):
+    manager = _job_manager()
+    if manager.get(job_id) is None:
+        return Response("Unknown job.", status=404, mimetype="text/plain")
+    return Response(
+        job_events(manager, job_id, _describe),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _job_manager() -> JobManager:
+    return current_app.config["JOB_MANAGER"]
+
+
+def _describe(job: Job) -> dict[str, Any]:
+    """A job's progress, as the job page's script reads it."""
+    return {
+        "id": job.id,
+        "status": job.status,
+        "phase": job.phase,
+        "label": _PHASE_LABELS.get(job.phase, job.phase),
+        "detail": job.detail,
+        "error": job.error,
+    }
@@ -2,22 +2,42 @@
 
 routes.py calls run_update() so the parse -> UpdateEngine -> report
 sequence exists in exactly one place, mirroring
-entry_checking/lib/webapp/check_service.py's run_check().
+entry_checking/lib/webapp/check_service.py's run_check(). routes.py runs it
+as a background job (see utils.lib.jobs), so run_update() reports which of
+PHASES it's in as it goes. A long-running server builds one results client
+(build_results_client()), one parsed-results cache and one dancer lookup
+and passes them to every run_update(), so concurrent jobs share one set of
+per-host rate limits, caches and pooled connections.
 """
 
+import contextlib
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Callable
-
-from points_updating.lib.parsing.http_client import ThrottledClient
-from points_updating.lib.parsing.routing import parse_results_url
+from typing import Callable, Optional
+
+from points_updating.lib.parsing.http_client import (
+    DEFAULT_BURST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    ThrottledClient,
+)
+from points_updating.lib.parsing.results_cache import ParsedResultsCache
+from points_updating.lib.parsing.routing import ResultsParseError, parse_results_urls
 from points_updating.lib.report import UpdateReport, build_report, render_report
 from points_updating.lib.update_engine import UpdateEngine
-from utils.lib.api.client import DancerRecord, lookup_dancer
+from utils.lib.api.cache import DancerRecordCache
+from utils.lib.api.client import DancerLookupClient, DancerRecord
+from utils.lib.jobs import ProgressCallback
 
 _CACHE_DIR = Path("data/cache")
-_MIN_DELAY_SECONDS = 1.0
+_DANCER_CACHE_PATH = _CACHE_DIR / "dancers.sqlite3"
+# Event pages of one competition fetched in parallel; each host still sees
+# at most build_results_client()'s requests_per_second on average.
+_MAX_CONCURRENCY_PER_HOST = 4
+
+# run_update()'s phases, in order. The parsers read each results page as it
+# downloads, so fetching and parsing are one phase.
+PHASES = ("fetch", "lookup", "score", "render")
 
 
 @dataclass
@@ -46,8 +66,11 @@ class UpdateSuccess:
 def run_update(
     urls: list[str],
     date_strs: list[str],
-    lookup: Callable[[str, str], DancerRecord] = lookup_dancer,
+    lookup: Optional[Callable[[str, str], DancerRecord]] = None,
     dry_run: bool = True,
+    progress: Optional[ProgressCallback] = None,
+    client: Optional[ThrottledClient] = None,
+    results_cache: Optional[ParsedResultsCache] = None,
 ) -> UpdateSuccess | UpdateError:
     """Runs a full points update from raw form input.
 
@@ -57,9 +80,20 @@ def run_update(
             paired by position with urls.
         lookup: Fetches a DancerRecord for a first/last name - forwarded to
             UpdateEngine; tests inject a fake so no real API call happens.
+            None means the real CDA API behind the on-disk DancerRecordCache,
+            opened for this call alone and closed before it returns.
         dry_run: If False, a real (write-to-the-database) update was
             requested. There is no write step yet, so this returns an
             UpdateError rather than silently behaving like a dry run.
+        progress: Called as progress(phase, detail) on entering each of
+            PHASES, and again with an updated detail as each competition
+            finishes fetching.
+        client: The HTTP client to fetch results with. None means a
+            build_results_client() made for this call alone, and closed
+            before it returns.
+        results_cache: Where already-parsed competitions are reused from
+            and newly parsed ones stored - left open. None means every
+            competition is parsed afresh.
     Returns:
         An UpdateSuccess with the rendered report(s) to display, or an
         UpdateError describing what went wrong and what HTTP status to
@@ -80,39 +114,89 @@ def run_update(
         except ValueError:
             return UpdateError(f"'{date_str}' is not a valid date (expected YYYY-MM-DD).")
 
-    client = ThrottledClient(min_delay_seconds=_MIN_DELAY_SECONDS, cache_dir=_CACHE_DIR)
-    competitions = []
-    for url, comp_date in zip(urls, parsed_dates):
+    if progress is None:
+        progress = _ignore_progress
+
+    with contextlib.ExitStack() as owned:
+        if client is None:
+            client = build_results_client()
+            owned.callback(client.close)
+
+        def competitions_fetched(count: int) -> None:
+            progress("fetch", f"{count}/{len(urls)} competitions")
+
+        competitions_fetched(0)
         try:
-            competitions.append(parse_results_url(url, comp_date, client))
-        except Exception as e:
-            # Deliberately broad: fetching/parsing a live third-party page
-            # can fail in many ways (network errors, unrecognized host,
-            # unsupported event shapes) - all become one clean message
-            # rather than a 500 page.
-            return UpdateError(f"Failed to fetch/parse {url!r}: {e}", 502)
-
-    engine = UpdateEngine(lookup=lookup)
-    awards_per_competition = engine.run_backfill(competitions)
-    all_awards = [award for comp_awards in awards_per_competition for award in comp_awards]
-    starting_totals = engine.starting_totals()
-    ledger = engine.final_totals()
-    final_totals = {name: dancer.points for name, dancer in ledger.items()}
-    report = build_report(all_awards, starting_totals, final_totals)
-
-    dancer_names = sorted((d.dancer_name for d in report.dancer_reports), key=_last_name_key)
-    dancer_text = {
-        d.dancer_name: render_report(UpdateReport(dancer_reports=[d]))
-        for d in report.dancer_reports
-    }
-    new_dancer_count = sum(1 for dancer in ledger.values() if dancer.cda_id is None)
-    return UpdateSuccess(
-        dancer_names=dancer_names,
-        all_text=render_report(report),
-        dancer_text=dancer_text,
-        new_dancer_count=new_dancer_count,
+            competitions = parse_results_urls(
+                list(zip(urls, parsed_dates)),
+                client,
+                results_cache=results_cache,
+                on_finished=competitions_fetched,
+            )
+        except ResultsParseError as e:
+            # Deliberately broad (parse_results_urls() wraps any exception):
+            # fetching/parsing a live third-party page can fail in many ways
+            # (network errors, unrecognized host, unsupported event shapes) -
+            # all become one clean message rather than a 500 page.
+            return UpdateError(str(e), 502)
+
+        if lookup is None:
+            api_client = DancerLookupClient()
+            owned.callback(api_client.close)
+            dancer_cache = DancerRecordCache(_DANCER_CACHE_PATH, lookup=api_client)
+            owned.callback(dancer_cache.close)
+            lookup = dancer_cache
+        engine = UpdateEngine(lookup=lookup)
+        progress("lookup", f"{sum(len(results) for results in competitions)} results")
+        engine.prefetch_dancers(competitions)
+        progress("score")
+        awards_per_competition = engine.run_backfill(competitions)
+        all_awards = [award for comp_awards in awards_per_competition for award in comp_awards]
+        starting_totals = engine.starting_totals()
+        ledger = engine.final_totals()
+        final_totals = {name: dancer.points for name, dancer in ledger.items()}
+        report = build_report(all_awards, starting_totals, final_totals)
+
+        progress("render", f"{len(report.dancer_reports)} dancers")
+        dancer_names = sorted((d.dancer_name for d in report.dancer_reports), key=_last_name_key)
+        dancer_text = {
+            d.dancer_name: render_report(UpdateReport(dancer_reports=[d]))
+            for d in report.dancer_reports
+        }
+        new_dancer_count = sum(1 for dancer in ledger.values() if dancer.cda_id is None)
+        return UpdateSuccess(
+            dancer_names=dancer_names,
+            all_text=render_report(report),
+            dancer_text=dancer_text,
+            new_dancer_count=new_dancer_count,
+        )
+
+
+def build_results_client(
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND, burst: int = DEFAULT_BURST
+) -> ThrottledClient:
+    """The ThrottledClient run_update() fetches results with by default -
+    paced per host, with responses cached under _CACHE_DIR.
+
+    Args:
+        requests_per_second: Average requests started per second against
+            any one results site.
+        burst: How many requests to one site may start back-to-back before
+            that pacing applies.
+    """
+    if requests_per_second <= 0:
+        raise ValueError(f"requests_per_second must be > 0, got {requests_per_second}")
+    return ThrottledClient(
+        min_delay_seconds=1 / requests_per_second,
+        burst=burst,
+        max_concurrency_per_host=_MAX_CONCURRENCY_PER_HOST,
+        cache_dir=_CACHE_DIR,
     )
 
 
+def _ignore_progress(phase: str, detail: str = "") -> None:
+    pass
+
+
 def _last_name_key(full_name: str) -> str:
     return full_name.strip().rpartition(" ")[2] or full_name
@@ -1,5 +1,6 @@
 """Tests for points_updating.lib.models.result module."""
 
+import dataclasses
 import unittest
 from datetime import date
 
@@ -83,6 +84,22 @@ class TestCompetitionResult(unittest.TestCase):
         self.assertEqual(result.event_dances, event_dances)
         self.assertEqual(result.num_rounds, 3)
 
+    def test_is_frozen_and_slotted(self):
+        result = CompetitionResult(
+            dance=Dance("Gold", "Smooth", "Tango"),
+            lead=DancerRef(first="Jane", last="Doe"),
+            follow=DancerRef(first="John", last="Smith"),
+            place=2,
+            num_rounds=2,
+            competition_name="Test Classic",
+            competition_date=date(2025, 10, 4),
+            event_dances=(Dance("Gold", "Smooth", "Tango"),),
+        )
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            setattr(result, "place", 1)
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertFalse(hasattr(result.lead, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
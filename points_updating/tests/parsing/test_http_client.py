@@ -1,12 +1,20 @@
 """Tests for points_updating.lib.parsing.http_client module."""
 
+import pickle
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import requests
 
-from points_updating.lib.parsing.http_client import _DEFAULT_USER_AGENT, ThrottledClient
+from points_updating.lib.parsing.http_client import (
+    _DEFAULT_USER_AGENT,
+    ThrottledClient,
+    _cache_control_max_age,
+)
 
 
 class _FakeSession:
@@ -62,6 +70,16 @@ class TestThrottledClientDefaultSession(unittest.TestCase):
 
         self.assertFalse(hasattr(session, "headers"))
 
+    def test_close_closes_default_session_only(self):
+        client = ThrottledClient()
+        with mock.patch.object(client._session, "close") as close:
+            client.close()
+        close.assert_called_once()
+
+        session = mock.Mock()
+        ThrottledClient(session=session).close()
+        session.close.assert_not_called()
+
 
 class TestThrottledClientDelay(unittest.TestCase):
     """Tests for the minimum-delay-between-requests behavior."""
@@ -144,6 +162,125 @@ class TestThrottledClientBackoff(unittest.TestCase):
         self.assertEqual(len(session.calls), 1)
 
 
+class TestThrottledClientPerHost(unittest.TestCase):
+    """Tests for per-host pacing: token-bucket bursts, independent hosts,
+    and throttle backoff shared by every request to the throttled host."""
+
+    def test_hosts_are_paced_independently(self):
+        clock = _FakeClock()
+        session = _FakeSession([_make_response(200)] * 3)
+        client = ThrottledClient(
+            min_delay_seconds=2.0, session=session, sleep=clock.sleep, clock=clock.clock
+        )
+
+        client.get("http://a.example.com/1")
+        client.get("http://b.example.com/1")  # a different host - no wait
+        client.get("http://a.example.com/2")
+
+        self.assertEqual(clock.sleeps, [2.0])
+
+    def test_burst_allows_back_to_back_requests_before_pacing(self):
+        clock = _FakeClock()
+        session = _FakeSession([_make_response(200)] * 4)
+        client = ThrottledClient(
+            min_delay_seconds=2.0, burst=3, session=session, sleep=clock.sleep, clock=clock.clock
+        )
+
+        for i in range(4):
+            client.get(f"http://example.com/{i}")
+
+        self.assertEqual(clock.sleeps, [2.0])
+
+    def test_throttle_backoff_holds_back_later_requests_to_that_host_only(self):
+        clock = _FakeClock()
+        session = _FakeSession(
+            [_make_response(429), _make_response(200), _make_response(200), _make_response(200)]
+        )
+        client = ThrottledClient(
+            min_delay_seconds=0,
+            backoff_base_seconds=4.0,
+            session=session,
+            sleep=clock.sleep,
+            clock=clock.clock,
+        )
+
+        client.get("http://a.example.com/1")  # 429, backs off 4s, retries
+        client.get("http://b.example.com/1")
+        clock.now -= 3.0  # as if a second worker had reserved right after the 429
+        client.get("http://a.example.com/2")
+
+        self.assertEqual(clock.sleeps, [4.0, 3.0])
+
+    def test_rejects_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            ThrottledClient(burst=0)
+        with self.assertRaises(ValueError):
+            ThrottledClient(max_concurrency_per_host=0)
+
+
+class _SlowSession:
+    """Thread-safe fake whose responses take a moment, tracking the peak
+    number of requests in flight at once."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        response = _make_response(200)
+        response.url = url
+        return response
+
+
+class TestThrottledClientFetchConcurrently(unittest.TestCase):
+    """Tests for ThrottledClient.fetch_concurrently()."""
+
+    def test_yields_results_in_input_order(self):
+        client = ThrottledClient(
+            min_delay_seconds=0, max_concurrency_per_host=4, session=_SlowSession()
+        )
+        urls = [f"http://example.com/{i}" for i in range(10)]
+
+        fetched = [response.url for response in client.fetch_concurrently(client.get, urls)]
+
+        self.assertEqual(fetched, urls)
+
+    def test_caps_requests_in_flight_per_host(self):
+        session = _SlowSession()
+        client = ThrottledClient(min_delay_seconds=0, max_concurrency_per_host=3, session=session)
+
+        list(client.fetch_concurrently(client.get, [f"http://example.com/{i}" for i in range(12)]))
+
+        self.assertGreater(session.peak, 1)
+        self.assertLessEqual(session.peak, 3)
+
+    def test_default_is_sequential(self):
+        session = _SlowSession()
+        client = ThrottledClient(min_delay_seconds=0, session=session)
+
+        list(client.fetch_concurrently(client.get, [f"http://example.com/{i}" for i in range(4)]))
+
+        self.assertEqual(session.peak, 1)
+
+    def test_propagates_fetch_errors(self):
+        client = ThrottledClient(min_delay_seconds=0, max_concurrency_per_host=2)
+
+        def fetch(item):
+            if item == 2:
+                raise ValueError("bad page")
+            return item
+
+        with self.assertRaises(ValueError):
+            list(client.fetch_concurrently(fetch, range(5)))
+
+
 class TestThrottledClientCaching(unittest.TestCase):
     """Tests for optional on-disk response caching."""
 
@@ -238,6 +375,179 @@ class TestThrottledClientCaching(unittest.TestCase):
 
         self.assertEqual(len(session.calls), 2)
 
+    def test_legacy_pickle_cache_is_migrated_and_served(self):
+        legacy_client = ThrottledClient(min_delay_seconds=0, session=_FakeSession([]))
+        cache_key = legacy_client._cache_key("GET", "http://example.com/a", {})
+        legacy = _make_response(200)
+        legacy._content = b"cached before the migration"
+        with open(self.cache_dir / f"{cache_key}.pickle", "wb") as f:
+            pickle.dump(legacy, f)
+        session = _FakeSession([])
+
+        client = ThrottledClient(min_delay_seconds=0, session=session, cache_dir=self.cache_dir)
+        self.addCleanup(client.close)
+        response = client.get("http://example.com/a")
+
+        self.assertEqual(session.calls, [])
+        self.assertEqual(response.content, b"cached before the migration")
+        self.assertEqual(list(self.cache_dir.glob("*.pickle")), [])
+
+    def test_cache_stats(self):
+        session = _FakeSession([_make_response(200)])
+        client = ThrottledClient(min_delay_seconds=0, session=session, cache_dir=self.cache_dir)
+        self.addCleanup(client.close)
+
+        client.get("http://example.com/a")
+        client.get("http://example.com/a")
+
+        stats = client.cache_stats()
+        assert stats is not None
+        self.assertEqual((stats.entries, stats.hits, stats.misses), (1, 1, 1))
+        self.assertIsNone(ThrottledClient(session=session).cache_stats())
+
+
+def _make_page(status_code: int, body: bytes = b"", **headers) -> requests.Response:
+    response = _make_response(status_code)
+    response._content = body
+    response.headers.update({name.replace("_", "-"): value for name, value in headers.items()})
+    return response
+
+
+class TestThrottledClientRevalidation(unittest.TestCase):
+    """Tests for per-entry max-age and conditional revalidation of cached
+    responses."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _make_client(self, session, **kwargs) -> ThrottledClient:
+        client = ThrottledClient(
+            min_delay_seconds=0, session=session, cache_dir=self.cache_dir, **kwargs
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_fresh_entry_is_served_without_a_request(self):
+        session = _FakeSession([_make_page(200, b"v1", ETag='"v1"')])
+        client = self._make_client(session, cache_max_age_seconds=3600)
+
+        client.get("http://example.com/a")
+        response = client.get("http://example.com/a")
+
+        self.assertEqual(len(session.calls), 1)
+        self.assertEqual(response.content, b"v1")
+
+    def test_stale_entry_revalidates_and_304_reuses_cached_body(self):
+        session = _FakeSession([_make_page(200, b"v1", ETag='"v1"'), _make_page(304)])
+        client = self._make_client(session, cache_max_age_seconds=0)
+
+        client.get("http://example.com/a", params={"event": 1})
+        response = client.get("http://example.com/a", params={"event": 1})
+
+        _, _, revalidation_kwargs = session.calls[1]
+        self.assertEqual(revalidation_kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(revalidation_kwargs["params"], {"event": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"v1")
+        stats = client.cache_stats()
+        assert stats is not None
+        self.assertEqual(stats.revalidations, 1)
+
+    def test_stale_entry_that_changed_is_replaced(self):
+        session = _FakeSession(
+            [
+                _make_page(200, b"v1", Last_Modified="Sat, 07 Feb 2026 10:00:00 GMT"),
+                _make_page(200, b"v2", Last_Modified="Sat, 07 Feb 2026 11:00:00 GMT"),
+                _make_page(304),
+            ]
+        )
+        client = self._make_client(session, cache_max_age_seconds=0)
+
+        client.get("http://example.com/a")
+        changed = client.get("http://example.com/a")
+        client.get("http://example.com/a")
+
+        self.assertEqual(changed.content, b"v2")
+        _, _, last_kwargs = session.calls[2]
+        self.assertEqual(
+            last_kwargs["headers"], {"If-Modified-Since": "Sat, 07 Feb 2026 11:00:00 GMT"}
+        )
+
+    def test_stale_entry_without_validators_is_refetched_unconditionally(self):
+        session = _FakeSession([_make_page(200, b"v1"), _make_page(200, b"v2")])
+        client = self._make_client(session, cache_max_age_seconds=0)
+
+        client.get("http://example.com/a")
+        response = client.get("http://example.com/a")
+
+        self.assertNotIn("headers", session.calls[1][2])
+        self.assertEqual(response.content, b"v2")
+
+    def test_caller_headers_are_kept_alongside_conditional_ones(self):
+        session = _FakeSession([_make_page(200, b"v1", ETag='"v1"'), _make_page(304)])
+        client = self._make_client(session, cache_max_age_seconds=0)
+
+        client.get("http://example.com/a", headers={"Accept": "application/json"})
+        client.get("http://example.com/a", headers={"Accept": "application/json"})
+
+        self.assertEqual(
+            session.calls[1][2]["headers"],
+            {"Accept": "application/json", "If-None-Match": '"v1"'},
+        )
+
+    def test_server_no_cache_shortens_configured_max_age(self):
+        session = _FakeSession(
+            [_make_page(200, b"v1", ETag='"v1"', Cache_Control="no-cache"), _make_page(304)]
+        )
+        client = self._make_client(session, cache_max_age_seconds=3600)
+
+        client.get("http://example.com/a")
+        client.get("http://example.com/a")
+
+        self.assertEqual(len(session.calls), 2)
+
+    def test_default_keeps_entries_forever_despite_server_max_age(self):
+        session = _FakeSession([_make_page(200, b"v1", ETag='"v1"', Cache_Control="max-age=0")])
+        client = self._make_client(session)
+
+        client.get("http://example.com/a")
+        client.get("http://example.com/a")
+
+        self.assertEqual(len(session.calls), 1)
+
+    def test_max_age_applies_to_entries_cached_without_one(self):
+        session = _FakeSession([_make_page(200, b"v1", ETag='"v1"'), _make_page(304)])
+        self._make_client(session).get("http://example.com/a")
+
+        self._make_client(session, cache_max_age_seconds=0.0).get("http://example.com/a")
+
+        self.assertEqual(len(session.calls), 2)
+        self.assertEqual(session.calls[1][2]["headers"], {"If-None-Match": '"v1"'})
+
+    def test_server_max_age_caps_a_later_clients_max_age(self):
+        session = _FakeSession(
+            [_make_page(200, b"v1", ETag='"v1"', Cache_Control="no-cache"), _make_page(304)]
+        )
+        self._make_client(session).get("http://example.com/a")
+
+        self._make_client(session, cache_max_age_seconds=3600).get("http://example.com/a")
+
+        self.assertEqual(len(session.calls), 2)
+
+
+class TestCacheControlMaxAge(unittest.TestCase):
+    def test_parses_directives(self):
+        self.assertEqual(_cache_control_max_age("public, max-age=300"), 300)
+        self.assertEqual(_cache_control_max_age("no-cache"), 0)
+        self.assertEqual(_cache_control_max_age("private, no-store"), 0)
+        self.assertIsNone(_cache_control_max_age("public"))
+        self.assertIsNone(_cache_control_max_age(""))
+        self.assertIsNone(_cache_control_max_age("max-age=soon"))
+
 
 if __name__ == "__main__":
     unittest.main()
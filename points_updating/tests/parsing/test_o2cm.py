@@ -22,6 +22,7 @@ from points_updating.lib.parsing.o2cm import (
     _split_name,
     fetch_competition_name,
     fetch_results_page,
+    iter_results_page,
     parse_competition,
 )
 from utils.lib.constants import Style
@@ -342,6 +343,43 @@ class TestParseResultsPage(unittest.TestCase):
         self.assertNotIn("Trinity Yu", [r.lead.full_name for r in matches])
 
 
+class TestIterResultsPage(unittest.TestCase):
+    """Tests the streaming parser against _parse_results_page(), the
+    whole-tree parser every other test here exercises."""
+
+    def setUp(self):
+        self.html = _load_fixture("results_page.html")
+
+    def _chunks(self, size: int) -> list[str]:
+        return [self.html[i : i + size] for i in range(0, len(self.html), size)]
+
+    def test_matches_whole_tree_parser(self):
+        expected = _parse_results_page(self.html, "Showdown", date(2025, 11, 14))
+
+        # Odd chunk sizes, so chunk boundaries land mid-tag and mid-row.
+        for size in (97, 4096, len(self.html)):
+            with self.subTest(chunk_size=size):
+                streamed = list(
+                    iter_results_page(self._chunks(size), "Showdown", date(2025, 11, 14))
+                )
+                self.assertEqual(streamed, expected)
+
+    def test_yields_before_the_whole_page_is_read(self):
+        chunks = self._chunks(4096)
+        consumed = 0
+
+        def feed():
+            nonlocal consumed
+            for chunk in chunks:
+                consumed += 1
+                yield chunk
+
+        first = next(iter_results_page(feed(), "Showdown", date(2025, 11, 14)))
+
+        self.assertEqual(first.competition_name, "Showdown")
+        self.assertLess(consumed, len(chunks) // 2)
+
+
 class TestParseCompetition(unittest.TestCase):
     def test_parses_the_whole_competition(self):
         client = _make_client({_RESULTS_KEY: _load_fixture("results_page.html")})
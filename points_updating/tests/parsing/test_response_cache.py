@@ -0,0 +1,243 @@
+"""Tests for points_updating.lib.parsing.response_cache module."""
+
+import pickle
+import sqlite3
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+
+import requests
+
+from points_updating.lib.parsing.response_cache import ResponseCache
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        self.now += 1  # every call is strictly later, so recency is unambiguous
+        return self.now
+
+
+def _make_response(body: bytes, **headers) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://example.com/results"
+    response.encoding = "utf-8"
+    response._content = body
+    response.headers.update({name.replace("_", "-"): value for name, value in headers.items()})
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for ResponseCache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.path = self.dir / "nested" / "responses.sqlite3"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _make_cache(self, **kwargs) -> ResponseCache:
+        cache = ResponseCache(self.path, clock=_FakeClock(), **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_round_trips_status_body_and_kept_headers(self):
+        cache = self._make_cache()
+        cache.put(
+            "k",
+            _make_response(
+                "Résultats".encode("utf-8"),
+                Content_Type="text/html; charset=utf-8",
+                ETag='"abc"',
+                Set_Cookie="session=secret",
+            ),
+        )
+
+        entry = cache.get("k")
+
+        assert entry is not None
+        cached = entry.response
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.text, "Résultats")
+        self.assertEqual(cached.url, "https://example.com/results")
+        self.assertEqual(cached.headers["etag"], '"abc"')  # still case-insensitive
+        self.assertEqual(cached.headers["Content-Type"], "text/html; charset=utf-8")
+        self.assertNotIn("Set-Cookie", cached.headers)
+
+    def test_miss_returns_none(self):
+        cache = self._make_cache()
+
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.stats().misses, 1)
+
+    def test_persists_across_instances(self):
+        self._make_cache().put("k", _make_response(b"body"))
+
+        cached = self._make_cache().get("k")
+
+        assert cached is not None
+        self.assertEqual(cached.response.content, b"body")
+
+    def test_body_is_stored_compressed(self):
+        cache = self._make_cache()
+        body = b"<tr><td>Alex Zephyr</td></tr>" * 1000
+
+        cache.put("k", _make_response(body))
+
+        self.assertLess(cache.stats().total_bytes, len(body) // 10)
+
+    def test_evicts_least_recently_used_over_size_limit(self):
+        body = bytes(range(256)) * 4  # incompressible enough for a stable size
+        probe = self._make_cache()
+        probe.put("probe", _make_response(body))
+        entry_size = probe.stats().total_bytes
+        probe.clear()
+
+        cache = self._make_cache(max_bytes=entry_size * 2)
+        cache.put("a", _make_response(body))
+        cache.put("b", _make_response(body))
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("c", _make_response(body))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.stats().evictions, 1)
+        self.assertEqual(cache.stats().entries, 2)
+
+    def test_stats_counts_hits_and_misses(self):
+        cache = self._make_cache()
+        cache.put("k", _make_response(b"body"))
+
+        cache.get("k")
+        cache.get("k")
+        cache.get("other")
+
+        stats = cache.stats()
+        self.assertEqual((stats.entries, stats.hits, stats.misses), (1, 2, 1))
+
+    def test_migrates_legacy_pickles(self):
+        legacy = _make_response(b"legacy body")
+        with open(self.dir / "abc123.pickle", "wb") as f:
+            pickle.dump(legacy, f)
+        (self.dir / "broken.pickle").write_bytes(b"not a pickle")
+        cache = self._make_cache()
+
+        migrated = cache.migrate_pickles(self.dir)
+
+        self.assertEqual(migrated, 1)
+        cached = cache.get("abc123")
+        assert cached is not None
+        self.assertEqual(cached.response.content, b"legacy body")
+        self.assertFalse((self.dir / "abc123.pickle").exists())
+        self.assertTrue((self.dir / "broken.pickle").exists())  # left for a human to look at
+
+    def test_entry_without_max_age_stays_fresh(self):
+        cache = self._make_cache()
+        cache.put("k", _make_response(b"body"))
+
+        entry = cache.get("k")
+
+        assert entry is not None
+        self.assertTrue(entry.is_fresh)
+
+    def test_entry_goes_stale_after_its_max_age(self):
+        clock = _FakeClock()
+        cache = ResponseCache(self.path, clock=clock)
+        self.addCleanup(cache.close)
+        cache.put("short", _make_response(b"body"), max_age_seconds=60)
+        cache.put("long", _make_response(b"body"), max_age_seconds=3600)
+
+        clock.now += 120
+        short, long = cache.get("short"), cache.get("long")
+
+        assert short is not None and long is not None
+        self.assertFalse(short.is_fresh)
+        self.assertTrue(long.is_fresh)
+
+    def test_readers_max_age_also_limits_freshness(self):
+        clock = _FakeClock()
+        cache = ResponseCache(self.path, clock=clock)
+        self.addCleanup(cache.close)
+        cache.put("forever", _make_response(b"body"))
+        cache.put("short", _make_response(b"body"), max_age_seconds=60)
+
+        clock.now += 120
+        forever = cache.get("forever", max_age_seconds=3600)
+        stale_forever = cache.get("forever", max_age_seconds=60)
+        short = cache.get("short", max_age_seconds=3600)
+
+        assert forever is not None and stale_forever is not None and short is not None
+        self.assertTrue(forever.is_fresh)
+        self.assertFalse(stale_forever.is_fresh)
+        self.assertFalse(short.is_fresh)
+
+    def test_revalidated_restarts_max_age_and_updates_validators(self):
+        clock = _FakeClock()
+        cache = ResponseCache(self.path, clock=clock)
+        self.addCleanup(cache.close)
+        cache.put("k", _make_response(b"body", ETag='"v1"'), max_age_seconds=60)
+        clock.now += 120
+
+        not_modified = _make_response(b"", ETag='"v2"')
+        not_modified.status_code = 304
+        cache.revalidated("k", not_modified, max_age_seconds=60)
+        entry = cache.get("k")
+
+        assert entry is not None
+        self.assertTrue(entry.is_fresh)
+        self.assertEqual(entry.response.content, b"body")
+        self.assertEqual(entry.conditional_headers(), {"If-None-Match": '"v2"'})
+        self.assertEqual(cache.stats().revalidations, 1)
+
+    def test_conditional_headers_from_validators(self):
+        cache = self._make_cache()
+        cache.put(
+            "both",
+            _make_response(b"body", ETag='"abc"', Last_Modified="Sat, 07 Feb 2026 10:00:00 GMT"),
+        )
+        cache.put("neither", _make_response(b"body"))
+
+        both, neither = cache.get("both"), cache.get("neither")
+
+        assert both is not None and neither is not None
+        self.assertEqual(
+            both.conditional_headers(),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Sat, 07 Feb 2026 10:00:00 GMT"},
+        )
+        self.assertEqual(neither.conditional_headers(), {})
+
+    def test_opens_store_written_before_max_age_existed(self):
+        self.path.parent.mkdir(parents=True)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE responses (cache_key TEXT PRIMARY KEY, url TEXT, "
+                "status_code INTEGER NOT NULL, encoding TEXT, headers TEXT NOT NULL, "
+                "body BLOB NOT NULL, size INTEGER NOT NULL, stored_at REAL NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO responses VALUES ('k', NULL, 200, 'utf-8', '{}', ?, 10, 0, 0)",
+                (zlib.compress(b"old"),),
+            )
+        conn.close()
+
+        entry = self._make_cache().get("k")
+
+        assert entry is not None
+        self.assertTrue(entry.is_fresh)
+        self.assertEqual(entry.response.content, b"old")
+
+    def test_rejects_non_positive_size_limit(self):
+        with self.assertRaises(ValueError):
+            self._make_cache(max_bytes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
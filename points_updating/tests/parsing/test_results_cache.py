@@ -0,0 +1,201 @@
+"""Tests for points_updating.lib.parsing.results_cache module."""
+
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from points_updating.lib.models.result import CompetitionResult, DancerRef
+from points_updating.lib.parsing import ballroom_comp_express, comporganizer, o2cm, results_cache
+from points_updating.lib.parsing.results_cache import (
+    ParsedResultsCache,
+    ResultsKey,
+    parser_version,
+)
+from utils.lib.models.dance import Dance
+
+_DATE = date(2025, 11, 14)
+_KEY = ResultsKey("o2cm", "isc25", "v1", _DATE)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _results() -> list[CompetitionResult]:
+    waltz = Dance("Bronze", "Smooth", "Waltz")
+    tango = Dance("Bronze", "Smooth", "Tango")
+    lead = DancerRef(first="Lead", last="Dancer")
+    return [
+        CompetitionResult(
+            dance=dance,
+            lead=lead,
+            follow=DancerRef(first=follow, last="Dancer"),
+            place=place,
+            num_rounds=3,
+            competition_name="Claremont Showdown",
+            competition_date=_DATE,
+            event_dances=(waltz, tango),
+        )
+        for dance in (waltz, tango)
+        for place, follow in ((1, "Follow"), (2, "Other"))
+    ]
+
+
+class TestParsedResultsCache(unittest.TestCase):
+    """Tests for ParsedResultsCache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "nested" / "parsed_results.sqlite3"
+        self.clock = _FakeClock()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _cache(self, **kwargs) -> ParsedResultsCache:
+        cache = ParsedResultsCache(self.path, clock=self.clock, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_round_trip_survives_reopening(self):
+        self._cache().put(_KEY, _results())
+
+        cache = self._cache()
+        cached = cache.get(_KEY)
+
+        self.assertEqual(cached, _results())
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_decoded_results_share_repeated_objects(self):
+        cache = self._cache()
+        cache.put(_KEY, _results())
+
+        cached = cache.get(_KEY)
+
+        self.assertIs(cached[0].lead, cached[1].lead)
+        self.assertIs(cached[0].dance, cached[0].event_dances[0])
+
+    def test_empty_results_round_trip(self):
+        cache = self._cache()
+        cache.put(_KEY, [])
+
+        self.assertEqual(cache.get(_KEY), [])
+
+    def test_parser_version_change_is_a_miss_and_replaces_entry(self):
+        cache = self._cache()
+        cache.put(_KEY, _results())
+        upgraded = ResultsKey("o2cm", "isc25", "v2", _DATE)
+
+        self.assertIsNone(cache.get(upgraded))
+        cache.put(upgraded, _results()[:1])
+
+        self.assertIsNone(cache.get(_KEY))
+        self.assertEqual(cache.get(upgraded), _results()[:1])
+
+    def test_date_and_name_override_are_part_of_the_key(self):
+        cache = self._cache()
+        cache.put(_KEY, _results())
+
+        self.assertIsNone(cache.get(ResultsKey("o2cm", "isc25", "v1", date(2025, 11, 15))))
+        self.assertIsNone(cache.get(ResultsKey("o2cm", "isc25", "v1", _DATE, "Renamed")))
+        self.assertIsNone(cache.get(ResultsKey("ballroom_comp_express", "isc25", "v1", _DATE)))
+
+    def test_entries_older_than_max_age_are_misses(self):
+        cache = self._cache(max_age_seconds=60)
+        cache.put(_KEY, _results())
+
+        self.clock.now += 59
+        self.assertIsNotNone(cache.get(_KEY))
+        self.clock.now += 1
+        self.assertIsNone(cache.get(_KEY))
+
+    def test_get_or_parse_only_parses_on_miss(self):
+        cache = self._cache()
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return _results()
+
+        first = cache.get_or_parse(_KEY, parse)
+        second = cache.get_or_parse(_KEY, parse)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+
+    def test_negative_max_age_raises(self):
+        with self.assertRaises(ValueError):
+            ParsedResultsCache(self.path, max_age_seconds=-1)
+
+    def test_integer_version_cache_file_is_started_over(self):
+        self.path.parent.mkdir(parents=True)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE parsed_results (source TEXT, competition_id TEXT, "
+                "competition_date TEXT, name_override TEXT, parser_version INTEGER, "
+                "stored_at REAL, payload BLOB)"
+            )
+            conn.execute("INSERT INTO parsed_results VALUES ('o2cm', 'isc25', '', '', 1, 0, x'')")
+        conn.close()
+
+        cache = self._cache()
+        cache.put(_KEY, _results())
+
+        self.assertEqual(cache.get(_KEY), _results())
+
+
+class TestParserVersion(unittest.TestCase):
+    """Tests for parser_version()."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.parser = root / "parser.py"
+        self.shared = root / "dance.py"
+        self.parser.write_text("PARSER = 1\n")
+        self.shared.write_text("ALIASES = {}\n")
+
+    def _version(self):
+        with mock.patch.object(results_cache, "_SHARED_SOURCES", (self.shared,)):
+            return parser_version(str(self.parser))
+
+    def test_stable_for_unchanged_sources(self):
+        self.assertEqual(self._version(), self._version())
+
+    def test_changes_with_parser_source(self):
+        before = self._version()
+        self.parser.write_text("PARSER = 2\n")
+        self.assertNotEqual(self._version(), before)
+
+    def test_changes_with_shared_source(self):
+        before = self._version()
+        self.shared.write_text("ALIASES = {'WT': 'Waltz'}\n")
+        self.assertNotEqual(self._version(), before)
+
+    def test_parsers_cover_shared_modules(self):
+        shared = {path.name for path in results_cache._SHARED_SOURCES}
+        self.assertTrue({"dance.py", "result.py", "multi_dance.py", "routing.py"} <= shared)
+        for module in (o2cm, ballroom_comp_express, comporganizer):
+            self.assertEqual(module.PARSER_VERSION, parser_version(module.__file__))
+        self.assertEqual(
+            len(
+                {
+                    o2cm.PARSER_VERSION,
+                    ballroom_comp_express.PARSER_VERSION,
+                    comporganizer.PARSER_VERSION,
+                }
+            ),
+            3,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 """Tests for points_updating.lib.parsing.routing module."""
 
+import tempfile
+import threading
 import unittest
 from datetime import date
 from pathlib import Path
@@ -7,9 +9,17 @@ from unittest.mock import patch
 
 import requests
 
+from points_updating.lib.models.result import CompetitionResult, DancerRef
 from points_updating.lib.parsing import ballroom_comp_express, comporganizer, o2cm
 from points_updating.lib.parsing.http_client import ThrottledClient
-from points_updating.lib.parsing.routing import parse_results_url
+from points_updating.lib.parsing import routing
+from points_updating.lib.parsing.results_cache import ParsedResultsCache
+from points_updating.lib.parsing.routing import (
+    ResultsParseError,
+    parse_results_url,
+    parse_results_urls,
+)
+from utils.lib.models.dance import Dance
 
 _FIXTURES = Path(__file__).parent / "fixtures" / "routing"
 
@@ -120,6 +130,36 @@ class TestParseResultsUrl(unittest.TestCase):
         mock_fetch_name.assert_not_called()
         mock_parse.assert_called_once_with("isc25", "Overridden Name", date(2025, 11, 14), client)
 
+    @patch.object(o2cm, "fetch_competition_name", return_value="Claremont Showdown")
+    @patch.object(o2cm, "parse_competition")
+    def test_results_cache_hit_skips_fetch_and_parse(self, mock_parse, mock_fetch_name):
+        dance = Dance("Bronze", "Smooth", "Waltz")
+        mock_parse.return_value = [
+            CompetitionResult(
+                dance=dance,
+                lead=DancerRef(first="Lead", last="Dancer"),
+                follow=DancerRef(first="Follow", last="Dancer"),
+                place=1,
+                num_rounds=2,
+                competition_name="Claremont Showdown",
+                competition_date=date(2025, 11, 14),
+                event_dances=(dance,),
+            )
+        ]
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache = ParsedResultsCache(Path(tmp.name) / "parsed_results.sqlite3")
+        self.addCleanup(cache.close)
+        url = "https://results.o2cm.com/event3.asp?event=isc25"
+
+        first = parse_results_url(url, date(2025, 11, 14), _make_client(), results_cache=cache)
+        second = parse_results_url(url, date(2025, 11, 14), _make_client(), results_cache=cache)
+
+        self.assertEqual(second, first)
+        self.assertEqual(mock_parse.call_count, 1)
+        self.assertEqual(mock_fetch_name.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
     def test_unrecognized_host_raises(self):
         # Neither dance.am discovery path matches: no cbid embedded in the
         # page, and /shared/comp.php isn't a real config endpoint here (its
@@ -142,5 +182,76 @@ class TestParseResultsUrl(unittest.TestCase):
             parse_results_url("https://results.o2cm.com/event3.asp", date(2025, 2, 8), client)
 
 
+class TestParseResultsUrls(unittest.TestCase):
+    def test_returns_results_in_input_order(self):
+        def fake_parse(url, competition_date, client, results_cache=None):
+            return [(url, competition_date)]
+
+        competitions = [
+            (f"https://{host}.example.com", date(2026, 1, i + 1)) for i, host in enumerate("abcde")
+        ]
+
+        with patch.object(routing, "parse_results_url", side_effect=fake_parse):
+            results = parse_results_urls(competitions, _make_client(), max_workers=3)
+
+        self.assertEqual(results, [[competition] for competition in competitions])
+
+    def test_fetches_competitions_concurrently(self):
+        # Each fake parse waits until both have started - only possible if
+        # they run at the same time.
+        both_started = threading.Barrier(2, timeout=5)
+
+        def fake_parse(url, competition_date, client, results_cache=None):
+            both_started.wait()
+            return []
+
+        competitions = [
+            ("https://a.example.com", date(2026, 1, 1)),
+            ("https://b.example.com", date(2026, 2, 1)),
+        ]
+
+        with patch.object(routing, "parse_results_url", side_effect=fake_parse):
+            results = parse_results_urls(competitions, _make_client(), max_workers=2)
+
+        self.assertEqual(results, [[], []])
+
+    def test_failure_names_the_failing_url(self):
+        def fake_parse(url, competition_date, client, results_cache=None):
+            if "b." in url:
+                raise ValueError("unsupported event shape")
+            return []
+
+        competitions = [
+            ("https://a.example.com", date(2026, 1, 1)),
+            ("https://b.example.com", date(2026, 2, 1)),
+        ]
+
+        with patch.object(routing, "parse_results_url", side_effect=fake_parse):
+            with self.assertRaises(ResultsParseError) as ctx:
+                parse_results_urls(competitions, _make_client())
+
+        self.assertEqual(ctx.exception.url, "https://b.example.com")
+        self.assertIsInstance(ctx.exception.cause, ValueError)
+        self.assertIn("unsupported event shape", str(ctx.exception))
+
+    def test_on_finished_counts_each_competition(self):
+        def fake_parse(url, competition_date, client, results_cache=None):
+            return []
+
+        competitions = [
+            (f"https://{host}.example.com", date(2026, 1, i + 1)) for i, host in enumerate("abc")
+        ]
+        counts = []
+
+        with patch.object(routing, "parse_results_url", side_effect=fake_parse):
+            parse_results_urls(competitions, _make_client(), on_finished=counts.append)
+
+        self.assertEqual(counts, [1, 2, 3])
+
+    def test_rejects_zero_workers(self):
+        with self.assertRaises(ValueError):
+            parse_results_urls([], _make_client(), max_workers=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@
 
 import unittest
 
+import numpy as np
+
 from points_updating.lib.rules import award_table
 
 
@@ -50,6 +52,20 @@ class TestComputeAward(unittest.TestCase):
         with self.assertRaises(ValueError):
             award_table.compute_award(0, 1)
 
+    def test_compute_awards_matches_compute_award(self):
+        num_rounds = np.array([r for r in (1, 2, 3, 5) for _ in range(10)])
+        places = np.array([p for _ in (1, 2, 3, 5) for p in range(0, 10)])
+
+        awards = award_table.compute_awards(num_rounds, places)
+
+        for rounds, place, award in zip(num_rounds, places, awards):
+            with self.subTest(num_rounds=rounds, place=place):
+                self.assertEqual(tuple(award), award_table.compute_award(rounds, place))
+
+    def test_compute_awards_num_rounds_less_than_one_raises(self):
+        with self.assertRaises(ValueError):
+            award_table.compute_awards(np.array([2, 0]), np.array([1, 1]))
+
 
 if __name__ == "__main__":
     unittest.main()
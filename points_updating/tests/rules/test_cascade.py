@@ -113,6 +113,65 @@ class TestBuildCascadeDelta(unittest.TestCase):
         self.assertTrue(np.array_equal(single_dance_delta.open, multi_dance_delta.open))
         self.assertTrue(np.array_equal(single_dance_delta.syllabus, multi_dance_delta.syllabus))
 
+    def test_repeated_cascade_shares_one_read_only_template(self):
+        award = award_table.compute_award(num_rounds=2, place=1)
+        first = cascade.build_cascade_delta((Dance("Silver", "Latin", "Rumba"),), award)
+        second = cascade.build_cascade_delta((Dance("Silver", "Latin", "Rumba"),), award)
+
+        self.assertIs(first, second)
+        with self.assertRaises(ValueError):
+            first.pts[0] = 1
+
+    def test_scale_matches_scaled_award(self):
+        """Split-Level scaling of the template equals cascading the
+        tripled award directly."""
+        award = award_table.compute_award(num_rounds=3, place=2)
+        dances = (Dance("Gold", "Rhythm", "Cha Cha"), Dance("Gold", "Rhythm", "Rumba"))
+
+        scaled = cascade.build_cascade_delta(dances, award, scale=3)
+        tripled = cascade.build_cascade_delta(dances, tuple(pts * 3 for pts in award))
+
+        self.assertTrue(np.array_equal(scaled.syllabus, tripled.syllabus))
+        self.assertTrue(np.array_equal(scaled.open, tripled.open))
+
+    def test_syllabus_single_dance_delta_stores_only_touched_cells(self):
+        award = award_table.compute_award(num_rounds=3, place=1)
+        delta = cascade.build_cascade_delta((Dance("Gold", "Standard", "Tango"),), award)
+
+        self.assertEqual(len(delta.cells), 4)  # Gold down through Newcomer Tango
+        self.assertEqual(delta.syllabus[3][1], 3)
+        self.assertEqual(int(delta.open.sum()), 0)
+
+
+class TestPointDelta(unittest.TestCase):
+    """Tests for PointDelta's sparse storage and dense views."""
+
+    def test_from_dense_round_trips(self):
+        syllabus = np.zeros((4, 19), dtype=int)
+        syllabus[2][7] = 4
+        open_ = np.zeros((3, 4), dtype=int)
+        open_[1][3] = 6
+
+        delta = cascade.PointDelta.from_dense(syllabus, open_)
+
+        self.assertEqual(delta.cells.tolist(), [2 * 19 + 7, cascade.SYLLABUS_CELLS + 1 * 4 + 3])
+        self.assertTrue(np.array_equal(delta.syllabus, syllabus))
+        self.assertTrue(np.array_equal(delta.open, open_))
+
+    def test_batch_from_dense_matches_from_dense(self):
+        rng = np.random.default_rng(7)
+        syllabus = rng.integers(0, 3, size=(5, 4, 19)) * rng.integers(0, 2, size=(5, 4, 19))
+        syllabus[2] = 0  # an all-zero delta in the middle of the batch
+        open_ = rng.integers(0, 3, size=(5, 3, 4))
+
+        batch = cascade.PointDelta.batch_from_dense(syllabus, open_)
+
+        self.assertEqual(len(batch), 5)
+        for i, delta in enumerate(batch):
+            expected = cascade.PointDelta.from_dense(syllabus[i], open_[i])
+            self.assertEqual(delta.cells.tolist(), expected.cells.tolist())
+            self.assertEqual(delta.pts.tolist(), expected.pts.tolist())
+
 
 if __name__ == "__main__":
     unittest.main()
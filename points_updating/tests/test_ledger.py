@@ -0,0 +1,90 @@
+"""Tests for points_updating.lib.ledger module."""
+
+import unittest
+
+import numpy as np
+
+from points_updating.lib.ledger import PointsLedger
+from points_updating.lib.rules.cascade import PointDelta
+from utils.lib.points import Points
+
+
+def _points(syllabus_value=0, open_value=0) -> Points:
+    return Points(
+        np.full((4, 19), syllabus_value, dtype=int), np.full((3, 4), open_value, dtype=int)
+    )
+
+
+class TestPointsLedger(unittest.TestCase):
+    """Tests for PointsLedger."""
+
+    def test_add_copies_starting_points(self):
+        ledger = PointsLedger()
+        starting = _points(syllabus_value=2)
+
+        view = ledger.add("Alice Smith", starting)
+        ledger.apply(np.array([ledger.row("Alice Smith")]), np.array([0]), np.array([1]))
+
+        self.assertEqual(view.syllabus_data[0][0], 3)
+        self.assertEqual(starting.syllabus_data[0][0], 2)
+
+    def test_add_twice_raises(self):
+        ledger = PointsLedger()
+        ledger.add("Alice Smith", _points())
+
+        with self.assertRaises(ValueError):
+            ledger.add("Alice Smith", _points())
+
+    def test_apply_sums_repeated_rows(self):
+        ledger = PointsLedger()
+        ledger.add("Alice Smith", _points())
+        ledger.add("Bob Jones", _points())
+        cell = 1 * 19 + 5  # Bronze Smooth Waltz
+
+        ledger.apply(np.array([0, 0, 1]), np.array([cell, cell, cell]), np.array([3, 4, 2]))
+
+        self.assertEqual(ledger.points("Alice Smith").syllabus_data[1][5], 7)
+        self.assertEqual(ledger.points("Bob Jones").syllabus_data[1][5], 2)
+
+    def test_apply_leaves_negative_cells_untouched(self):
+        """Same pointed-out marker rule as Points.add()."""
+        ledger = PointsLedger()
+        starting = _points()
+        starting.syllabus_data[1][5] = -1
+        starting.open_data[0][0] = -1
+        ledger.add("Alice Smith", starting)
+
+        delta = PointDelta.from_dense(np.full((4, 19), 7), np.full((3, 4), 7))
+        ledger.apply(np.zeros(len(delta.cells), dtype=int), delta.cells, delta.pts)
+
+        points = ledger.points("Alice Smith")
+        self.assertEqual(points.syllabus_data[1][5], -1)
+        self.assertEqual(points.open_data[0][0], -1)
+        self.assertEqual(points.syllabus_data[0][0], 7)
+
+    def test_apply_invalidates_memoized_proficiency(self):
+        ledger = PointsLedger()
+        view = ledger.add("Alice Smith", _points())
+        before = view.proficiency_table(is_newcomer=False)
+
+        # Standard Waltz to Silver
+        ledger.apply(np.array([0, 0]), np.array([0, 19]), np.array([7, 7]))
+
+        self.assertIsNot(view.proficiency_table(is_newcomer=False), before)
+        self.assertEqual(view.proficiency_table(is_newcomer=False).levels[0], 2)
+
+    def test_views_survive_growth(self):
+        ledger = PointsLedger()
+        first = ledger.add("Dancer 0", _points(syllabus_value=5))
+        for i in range(1, 200):
+            ledger.add(f"Dancer {i}", _points())
+
+        ledger.apply(np.array([0]), np.array([3 * 19 + 18]), np.array([1]))
+
+        self.assertEqual(len(ledger), 200)
+        self.assertIs(ledger.points("Dancer 0"), first)
+        self.assertEqual(first.syllabus_data[3][18], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
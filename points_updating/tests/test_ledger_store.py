@@ -0,0 +1,184 @@
+"""Tests for points_updating.lib.ledger_store module."""
+
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from points_updating.lib.ledger_store import LedgerStore, run_incremental
+from points_updating.lib.models.result import CompetitionResult, DancerRef
+from points_updating.lib.update_engine import UpdateEngine
+from utils.lib.api.client import DancerRecord
+from utils.lib.models.dance import Dance
+
+_LEAD = DancerRef(first="Lead", last="Dancer")
+_FOLLOW = DancerRef(first="Follow", last="Dancer")
+_OTHER = DancerRef(first="Other", last="Dancer")
+
+
+class _CountingLookup:
+    """Fake dancer lookup returning a not-found (new dancer) record for
+    everyone, counting calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, first: str, last: str) -> DancerRecord:
+        self.calls += 1
+        return DancerRecord(
+            cda_id=None,
+            first=first,
+            last=last,
+            first_comp_date=None,
+            created_date="2026-01-01",
+            syllabus_pts=np.zeros((4, 19), dtype=int),
+            open_pts=np.zeros((3, 4), dtype=int),
+        )
+
+
+def _competition(comp_date: date, follow: DancerRef = _FOLLOW) -> list[CompetitionResult]:
+    dance = Dance("Bronze", "Smooth", "Waltz")
+    return [
+        CompetitionResult(
+            dance=dance,
+            lead=_LEAD,
+            follow=follow,
+            place=1,
+            num_rounds=3,
+            competition_name=f"Test Classic {comp_date}",
+            competition_date=comp_date,
+            event_dances=(dance,),
+        )
+    ]
+
+
+_COMPETITIONS = {
+    "oct": _competition(date(2025, 10, 4)),
+    "nov": _competition(date(2025, 11, 15), follow=_OTHER),
+    "dec": _competition(date(2025, 12, 6)),
+}
+
+
+def _ids(*competition_ids: str) -> list[tuple[str, date]]:
+    return [(cid, _COMPETITIONS[cid][0].competition_date) for cid in competition_ids]
+
+
+class TestLedgerStore(unittest.TestCase):
+    """Tests for LedgerStore and run_incremental()."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "nested" / "ledger.sqlite3"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _run(self, *competition_ids: str, lookup=None):
+        store = LedgerStore(self.path)
+        self.addCleanup(store.close)
+        plan = store.plan(_ids(*competition_ids))
+        engine, awards = run_incremental(
+            store, plan, _COMPETITIONS, lookup=lookup or _CountingLookup()
+        )
+        return plan, engine, awards
+
+    def _assert_same_totals(self, engine: UpdateEngine, *competition_ids: str):
+        full = UpdateEngine(lookup=_CountingLookup())
+        full.run_backfill([_COMPETITIONS[cid] for cid in competition_ids])
+        expected = full.final_totals()
+        actual = engine.final_totals()
+        self.assertEqual(set(actual), set(expected))
+        for name, dancer in expected.items():
+            with self.subTest(name=name):
+                self.assertTrue(
+                    np.array_equal(actual[name].points.syllabus_data, dancer.points.syllabus_data)
+                )
+                self.assertTrue(
+                    np.array_equal(actual[name].points.open_data, dancer.points.open_data)
+                )
+
+    def test_new_competition_scores_only_that_competition(self):
+        self._run("oct")
+        lookup = _CountingLookup()
+
+        plan, engine, awards = self._run("oct", "nov", lookup=lookup)
+
+        self.assertEqual(plan.resume_after, "oct")
+        self.assertEqual(plan.replay, [])
+        self.assertEqual([cid for cid, _ in plan.new], ["nov"])
+        self.assertEqual(len(awards), 1)
+        self.assertEqual(lookup.calls, 1)  # only the never-seen "Other Dancer"
+        self._assert_same_totals(engine, "oct", "nov")
+
+    def test_starting_totals_are_as_of_resume_checkpoint(self):
+        self._run("oct")
+
+        _, engine, _ = self._run("dec")
+
+        # Bronze Smooth Waltz 1st of 3 rounds at "oct": (3, 6, 7).
+        self.assertEqual(engine.starting_totals()["Lead Dancer"].syllabus_data[1][5], 3)
+        self.assertEqual(engine.final_totals()["Lead Dancer"].points.syllabus_data[1][5], 6)
+
+    def test_out_of_order_insert_replays_from_its_date(self):
+        self._run("oct", "dec")
+        lookup = _CountingLookup()
+
+        plan, engine, awards = self._run("nov", lookup=lookup)
+
+        self.assertEqual(plan.resume_after, "oct")
+        self.assertEqual([cid for cid, _ in plan.replay], ["dec"])
+        self.assertEqual([cid for cid, _ in plan.to_score()], ["nov", "dec"])
+        self.assertEqual(len(awards), 2)
+        self.assertEqual(lookup.calls, 1)  # stored baselines are reused on replay
+        self._assert_same_totals(engine, "oct", "nov", "dec")
+        self.assertEqual(
+            [cid for cid, _ in LedgerStore(self.path).processed()], ["oct", "nov", "dec"]
+        )
+
+    def test_failed_replay_leaves_checkpoints_unchanged(self):
+        self._run("oct", "dec")
+        before = LedgerStore(self.path).processed()
+
+        def failing_lookup(first: str, last: str) -> DancerRecord:
+            raise ConnectionError("lookup down")
+
+        with self.assertRaises(ConnectionError):
+            self._run("nov", lookup=failing_lookup)
+
+        self.assertEqual(LedgerStore(self.path).processed(), before)
+        plan, engine, _ = self._run("nov")
+        self.assertEqual([cid for cid, _ in plan.replay], ["dec"])
+        self._assert_same_totals(engine, "oct", "nov", "dec")
+
+    def test_insert_before_everything_replays_all(self):
+        self._run("nov", "dec")
+
+        plan, engine, _ = self._run("oct")
+
+        self.assertIsNone(plan.resume_after)
+        self.assertEqual([cid for cid, _ in plan.replay], ["nov", "dec"])
+        self._assert_same_totals(engine, "oct", "nov", "dec")
+
+    def test_nothing_new_scores_nothing(self):
+        self._run("oct", "nov")
+
+        plan, engine, awards = self._run("oct", "nov")
+
+        self.assertEqual(plan.to_score(), [])
+        self.assertEqual(awards, [])
+        self._assert_same_totals(engine, "oct", "nov")
+
+    def test_save_rejects_non_chronological_checkpoint(self):
+        self._run("dec")
+        store = LedgerStore(self.path)
+        self.addCleanup(store.close)
+        snapshot = store.load("dec")
+
+        with self.assertRaises(ValueError):
+            store.save("oct", date(2025, 10, 4), snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
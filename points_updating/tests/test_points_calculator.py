@@ -1,15 +1,19 @@
 """Tests for points_updating.lib.points_calculator module."""
 
+import dataclasses
 import datetime
 import unittest
 from typing import Optional
 
 import numpy as np
 
+from points_updating.lib.ledger import PointsLedger
 from points_updating.lib.models.result import CompetitionResult, DancerRef
 from points_updating.lib.points_calculator import PointsCalculator
 from points_updating.lib.rules import cascade
+from utils.lib import constants
 from utils.lib.api.client import DancerRecord
+from utils.lib.constants import Style
 from utils.lib.models.dance import Dance
 from utils.lib.models.dancer import Dancer
 
@@ -145,5 +149,96 @@ class TestPointsCalculator(unittest.TestCase):
             PointsCalculator.compute(result, lead, follow)
 
 
+class TestPointsCalculatorBatch(unittest.TestCase):
+    """Tests for PointsCalculator.compute_batch(), checked against
+    compute() as the reference."""
+
+    def _ledger_for(self, dancers):
+        ledger = PointsLedger()
+        for dancer in dancers:
+            ledger.add(dancer.name, dancer.points)
+        return ledger
+
+    def test_matches_compute_for_random_competition(self):
+        rng = np.random.default_rng(20260102)
+        dancers = []
+        for i in range(12):
+            # Random point-out depth per column, so proficiencies vary.
+            depth = rng.integers(0, 5, size=19)
+            syllabus = np.where(np.arange(4)[:, None] < depth[None, :], 7, 0)
+            dancers.append(_make_dancer(f"Dancer{i}", "Test", syllabus))
+        ledger = self._ledger_for(dancers)
+        results = []
+        for _ in range(200):
+            lead, follow = rng.choice(len(dancers), size=2, replace=False)
+            style = Style.points_eligible_styles()[rng.integers(4)]
+            level = constants.LEVELS[rng.integers(len(constants.LEVELS))]
+            names = constants.DANCE_NAMES[style]
+            combo = rng.choice(len(names), size=rng.integers(1, 4), replace=False)
+            event_dances = tuple(Dance(level, style, names[c]) for c in combo)
+            result = _make_result(
+                event_dances[0],
+                place=int(rng.integers(1, 9)),
+                num_rounds=int(rng.integers(1, 5)),
+                event_dances=event_dances,
+            )
+            result = dataclasses.replace(
+                result,
+                lead=DancerRef(f"Dancer{lead}", "Test"),
+                follow=DancerRef(f"Dancer{follow}", "Test"),
+            )
+            results.append(result)
+        by_name = {dancer.name: dancer for dancer in dancers}
+
+        batch = PointsCalculator.compute_batch(results, ledger, newcomers=set())
+
+        for result, award in zip(results, batch):
+            expected = PointsCalculator.compute(
+                result, by_name[result.lead.full_name], by_name[result.follow.full_name]
+            )
+            self.assertEqual(award.is_split_level, expected.is_split_level, result)
+            self.assertTrue(np.array_equal(award.delta.syllabus, expected.delta.syllabus), result)
+            self.assertTrue(np.array_equal(award.delta.open, expected.delta.open), result)
+
+    def test_newcomer_floor_applies(self):
+        """A newcomer's zero-point floor is Newcomer, not Bronze - with a
+        Silver partner that's a Split-Level Exception at Bronze."""
+        syllabus = np.zeros((4, 19), dtype=int)
+        syllabus[:2, 5] = 7  # Smooth Waltz to Silver
+        lead = _make_dancer("Lead", "Dancer", syllabus)
+        follow = _make_dancer("Follow", "Dancer")
+        ledger = self._ledger_for([lead, follow])
+        result = _make_result(Dance("Bronze", "Smooth", "Waltz"), place=1, num_rounds=2)
+
+        batch = PointsCalculator.compute_batch([result], ledger, newcomers={"Follow Dancer"})
+        experienced = PointsCalculator.compute_batch([result], ledger, newcomers=set())
+
+        self.assertTrue(batch[0].is_split_level)
+        self.assertFalse(experienced[0].is_split_level)
+
+    def test_repeated_cascade_shares_one_template(self):
+        lead = _make_dancer("Lead", "Dancer")
+        follow = _make_dancer("Follow", "Dancer")
+        ledger = self._ledger_for([lead, follow])
+        result = _make_result(Dance("Bronze", "Smooth", "Waltz"), place=1, num_rounds=2)
+
+        first, second = PointsCalculator.compute_batch([result, result], ledger, set())
+
+        self.assertIs(first.delta, second.delta)
+        self.assertFalse(first.delta.pts.flags.writeable)
+
+    def test_empty_results(self):
+        self.assertEqual(PointsCalculator.compute_batch([], PointsLedger(), set()), [])
+
+    def test_nightclub_dance_raises(self):
+        lead = _make_dancer("Lead", "Dancer")
+        follow = _make_dancer("Follow", "Dancer")
+        ledger = self._ledger_for([lead, follow])
+        result = _make_result(Dance("Beginner", "Nightclub", "Salsa"), place=1, num_rounds=2)
+
+        with self.assertRaises(ValueError):
+            PointsCalculator.compute_batch([result], ledger, set())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 """Tests for points_updating.lib.update_engine module."""
 
+import threading
+import time
 import unittest
 from datetime import date
 
@@ -280,5 +282,113 @@ class TestUpdateEngine(unittest.TestCase):
         self.assertEqual(engine.final_totals(), {})
 
 
+class TestUpdateEnginePrefetch(unittest.TestCase):
+    """Tests for run_backfill()'s up-front, concurrent dancer lookups."""
+
+    def test_each_dancer_looked_up_once_across_competitions(self):
+        lead = DancerRef(first="Lead", last="Dancer")
+        follow = DancerRef(first="Follow", last="Dancer")
+        other = DancerRef(first="Other", last="Dancer")
+        dance = Dance("Bronze", "Smooth", "Waltz")
+        comp1 = [
+            _make_result(dance, lead, follow, place=1, num_rounds=3, comp_date=date(2025, 10, 4)),
+            _make_result(dance, other, follow, place=2, num_rounds=3, comp_date=date(2025, 10, 4)),
+        ]
+        comp2 = [
+            _make_result(dance, lead, other, place=1, num_rounds=3, comp_date=date(2025, 11, 15))
+        ]
+        calls = []
+        fake_lookup = _make_lookup({})
+
+        def lookup(first, last):
+            calls.append((first, last))
+            return fake_lookup(first, last)
+
+        engine = UpdateEngine(lookup=lookup)
+        engine.run_backfill([comp1, comp2])
+
+        self.assertCountEqual(
+            calls, [("Lead", "Dancer"), ("Follow", "Dancer"), ("Other", "Dancer")]
+        )
+
+    def test_filtered_out_dancer_is_never_looked_up(self):
+        lead = DancerRef(first="Lead", last="Dancer")
+        follow = DancerRef(first="Follow", last="Dancer")
+        result = _make_result(
+            Dance("Beginner", "Nightclub", "Salsa"),
+            lead,
+            follow,
+            place=1,
+            num_rounds=3,
+            comp_date=date(2025, 10, 4),
+        )
+        calls = []
+
+        def lookup(first, last):
+            calls.append((first, last))
+            return _make_lookup({})(first, last)
+
+        engine = UpdateEngine(lookup=lookup)
+        engine.run_backfill([[result]])
+
+        self.assertEqual(calls, [])
+
+    def test_new_dancer_first_comp_date_is_their_first_competition(self):
+        """Prefetching must not change which competition a brand-new
+        dancer is first ledgered at - they're still built from the
+        earliest competition they appear in, not whichever was fetched
+        first."""
+        lead = DancerRef(first="Lead", last="Dancer")
+        follow = DancerRef(first="Follow", last="Dancer")
+        dance = Dance("Bronze", "Smooth", "Waltz")
+        earlier = [
+            _make_result(dance, lead, follow, place=1, num_rounds=3, comp_date=date(2025, 10, 4))
+        ]
+        later = [
+            _make_result(dance, lead, follow, place=1, num_rounds=3, comp_date=date(2025, 11, 15))
+        ]
+
+        engine = UpdateEngine(lookup=_make_lookup({}))
+        engine.run_backfill([later, earlier])
+
+        totals = engine.final_totals()
+        self.assertEqual(totals["Lead Dancer"].first_comp_date, date(2025, 10, 4))
+
+    def test_lookups_run_concurrently_up_to_the_worker_limit(self):
+        refs = [DancerRef(first=f"Dancer{i}", last="Test") for i in range(8)]
+        dance = Dance("Bronze", "Smooth", "Waltz")
+        comp = [
+            _make_result(
+                dance, refs[i], refs[i + 1], place=1, num_rounds=3, comp_date=date(2025, 10, 4)
+            )
+            for i in range(0, 8, 2)
+        ]
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        fake_lookup = _make_lookup({})
+
+        def lookup(first, last):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return fake_lookup(first, last)
+
+        engine = UpdateEngine(lookup=lookup, max_lookup_workers=3)
+        engine.run_backfill([comp])
+
+        self.assertGreater(peak, 1)
+        self.assertLessEqual(peak, 3)
+        self.assertEqual(len(engine.final_totals()), 8)
+
+    def test_rejects_non_positive_worker_count(self):
+        with self.assertRaises(ValueError):
+            UpdateEngine(lookup=_make_lookup({}), max_lookup_workers=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,17 +6,33 @@ than going all the way through a real fetch/parse/score pipeline - that
 pipeline is already covered by the parsing and engine test suites.
 """
 
+import json
+import threading
 import unittest
 from unittest import mock
 
 from points_updating.lib.webapp import routes
 from points_updating.lib.webapp.app import create_app
 from points_updating.lib.webapp.update_service import UpdateError, UpdateSuccess
+from utils.lib.jobs import JobManager
+
+_FORM = {"url": ["https://example.com"], "date": ["2026-01-01"], "dry_run": "on"}
 
 
 class TestIndexRoute(unittest.TestCase):
     def setUp(self):
-        self.client = create_app().test_client()
+        self.jobs = JobManager()
+        self.addCleanup(self.jobs.shutdown)
+        self.client = create_app(job_manager=self.jobs).test_client()
+
+    def _post(self, data):
+        """Submits the form, waits for the update job it started, and
+        returns the job's page."""
+        response = self.client.post("/", data=data)
+        self.assertEqual(response.status_code, 303)
+        job_id = response.headers["Location"].rsplit("/", 1)[1]
+        self.jobs.wait(job_id, timeout=5)
+        return self.client.get(response.headers["Location"])
 
     def test_get_index_returns_form(self):
         response = self.client.get("/")
@@ -46,12 +62,17 @@ class TestIndexRoute(unittest.TestCase):
             new_dancer_count=1,
         )
         with mock.patch.object(routes, "run_update", return_value=success) as mock_run:
-            response = self.client.post(
-                "/",
-                data={"url": ["https://example.com"], "date": ["2026-01-01"], "dry_run": "on"},
-            )
+            response = self._post(_FORM)
 
-        mock_run.assert_called_once_with(["https://example.com"], ["2026-01-01"], dry_run=True)
+        mock_run.assert_called_once_with(
+            ["https://example.com"],
+            ["2026-01-01"],
+            lookup=None,
+            dry_run=True,
+            progress=mock.ANY,
+            client=None,
+            results_cache=None,
+        )
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'id="results-panel"', response.data)
         self.assertIn(b"Jamie Adams", response.data)
@@ -62,10 +83,7 @@ class TestIndexRoute(unittest.TestCase):
     def test_new_dancer_count_pluralizes_for_zero_and_multiple(self):
         success = UpdateSuccess(dancer_names=[], all_text="", dancer_text={}, new_dancer_count=3)
         with mock.patch.object(routes, "run_update", return_value=success):
-            response = self.client.post(
-                "/",
-                data={"url": ["https://example.com"], "date": ["2026-01-01"], "dry_run": "on"},
-            )
+            response = self._post(_FORM)
 
         self.assertIn(b"3 new dancers", response.data)
 
@@ -73,10 +91,7 @@ class TestIndexRoute(unittest.TestCase):
         with mock.patch.object(
             routes, "run_update", return_value=UpdateError("Failed to fetch/parse it", 502)
         ):
-            response = self.client.post(
-                "/",
-                data={"url": ["https://example.com"], "date": ["2026-01-01"], "dry_run": "on"},
-            )
+            response = self._post(_FORM)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn(b"Failed to fetch/parse it", response.data)
@@ -90,9 +105,8 @@ class TestIndexRoute(unittest.TestCase):
                 dancer_names=[], all_text="", dancer_text={}, new_dancer_count=0
             ),
         ) as mock_run:
-            self.client.post(
-                "/",
-                data={
+            self._post(
+                {
                     "url": ["https://a.example.com", "https://b.example.com"],
                     "date": ["2026-01-01", "2026-02-01"],
                     "dry_run": "on",
@@ -102,7 +116,11 @@ class TestIndexRoute(unittest.TestCase):
         mock_run.assert_called_once_with(
             ["https://a.example.com", "https://b.example.com"],
             ["2026-01-01", "2026-02-01"],
+            lookup=None,
             dry_run=True,
+            progress=mock.ANY,
+            client=None,
+            results_cache=None,
         )
 
     def test_unchecked_dry_run_is_forwarded_as_false(self):
@@ -111,11 +129,17 @@ class TestIndexRoute(unittest.TestCase):
             "run_update",
             return_value=UpdateError("Live updates aren't supported yet."),
         ) as mock_run:
-            response = self.client.post(
-                "/", data={"url": ["https://example.com"], "date": ["2026-01-01"]}
-            )
+            response = self._post({"url": ["https://example.com"], "date": ["2026-01-01"]})
 
-        mock_run.assert_called_once_with(["https://example.com"], ["2026-01-01"], dry_run=False)
+        mock_run.assert_called_once_with(
+            ["https://example.com"],
+            ["2026-01-01"],
+            lookup=None,
+            dry_run=False,
+            progress=mock.ANY,
+            client=None,
+            results_cache=None,
+        )
         self.assertIn(b"Live updates aren&#39;t supported yet.", response.data)
 
     def test_unchecked_dry_run_preserved_on_error_rerender(self):
@@ -125,5 +149,112 @@ class TestIndexRoute(unittest.TestCase):
         self.assertIn(b'name="dry_run" id="dry-run-checkbox" ', response.data)
 
 
+class TestUpdateJobs(unittest.TestCase):
+    """Tests for running updates as background jobs."""
+
+    def setUp(self):
+        self.jobs = JobManager()
+        self.addCleanup(self.jobs.shutdown)
+        self.client = create_app(job_manager=self.jobs).test_client()
+        self.success = UpdateSuccess(
+            dancer_names=["Jamie Adams"],
+            all_text="=== Jamie Adams ===\n...",
+            dancer_text={"Jamie Adams": "=== Jamie Adams ===\n..."},
+            new_dancer_count=0,
+        )
+
+    def _submit(self):
+        response = self.client.post("/", data=_FORM)
+        self.assertEqual(response.status_code, 303)
+        return response.headers["Location"]
+
+    def test_post_returns_job_page_immediately(self):
+        release = threading.Event()
+
+        def slow_update(urls, dates, dry_run, progress, **kwargs):
+            progress("fetch", "0/1 competitions")
+            release.wait(5)
+            return self.success
+
+        with mock.patch.object(routes, "run_update", side_effect=slow_update):
+            job_url = self._submit()
+            page = self.client.get(job_url)
+            release.set()
+            self.jobs.wait(job_url.rsplit("/", 1)[1], timeout=5)
+
+        self.assertEqual(page.status_code, 200)
+        self.assertIn(b'id="job-progress"', page.data)
+        # The form still posts back to "/", not to the job's page.
+        self.assertIn(b'action="/"', page.data)
+        self.assertNotIn(b'id="results-panel"', page.data)
+        self.assertIn(b'id="results-panel"', self.client.get(job_url).data)
+
+    def test_events_stream_phases_until_done(self):
+        def update(urls, dates, dry_run, progress, **kwargs):
+            for phase in ("fetch", "lookup", "score", "render"):
+                progress(phase)
+            return self.success
+
+        with mock.patch.object(routes, "run_update", side_effect=update):
+            job_url = self._submit()
+            response = self.client.get(job_url + "/events")
+
+        self.assertEqual(response.mimetype, "text/event-stream")
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in response.get_data(as_text=True).splitlines()
+            if line.startswith("data: ")
+        ]
+        self.assertEqual(events[-1]["status"], "done")
+        for event in events:
+            self.assertIn(event["phase"], (None, "fetch", "lookup", "score", "render"))
+
+    def test_same_inputs_reuse_finished_report(self):
+        with mock.patch.object(routes, "run_update", return_value=self.success) as mock_run:
+            first = self._submit()
+            self.jobs.wait(first.rsplit("/", 1)[1], timeout=5)
+            second = self._submit()
+
+        self.assertEqual(first, second)
+        mock_run.assert_called_once()
+
+    def test_failed_update_reruns_on_resubmit(self):
+        with mock.patch.object(
+            routes, "run_update", return_value=UpdateError("Failed to fetch/parse it", 502)
+        ) as mock_run:
+            first = self._submit()
+            self.jobs.wait(first.rsplit("/", 1)[1], timeout=5)
+            second = self._submit()
+            self.jobs.wait(second.rsplit("/", 1)[1], timeout=5)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_unknown_job_is_404(self):
+        self.assertEqual(self.client.get("/jobs/missing").status_code, 404)
+
+    def test_every_job_shares_the_apps_client_cache_and_lookup(self):
+        results_client, dancer_lookup, results_cache = mock.Mock(), mock.Mock(), mock.Mock()
+        client = create_app(
+            job_manager=self.jobs,
+            results_client=results_client,
+            dancer_lookup=dancer_lookup,
+            results_cache=results_cache,
+        ).test_client()
+        dates = iter(["2026-01-01", "2026-02-01"])
+
+        with mock.patch.object(routes, "run_update", return_value=self.success) as mock_run:
+            for _ in range(2):
+                response = client.post("/", data=dict(_FORM, date=[next(dates)]))
+                self.jobs.wait(response.headers["Location"].rsplit("/", 1)[1], timeout=5)
+
+        self.assertEqual(mock_run.call_count, 2)
+        for call in mock_run.call_args_list:
+            self.assertIs(call.kwargs["client"], results_client)
+            self.assertIs(call.kwargs["lookup"], dancer_lookup)
+            self.assertIs(call.kwargs["results_cache"], results_cache)
+        self.assertEqual(self.client.get("/jobs/missing/events").status_code, 404)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ from unittest import mock
 import numpy as np
 
 from points_updating.lib.models.result import CompetitionResult, DancerRef
+from points_updating.lib.parsing import routing
 from points_updating.lib.webapp import update_service
 from points_updating.lib.webapp.update_service import UpdateError, UpdateSuccess, run_update
 from utils.lib.api.client import DancerRecord
@@ -59,7 +60,7 @@ class TestRunUpdate(unittest.TestCase):
         """There is no DB write step yet, so a real (non-dry-run) update
         request must be rejected clearly rather than silently behaving like
         a dry run - checked before any parsing/fetching happens."""
-        with mock.patch.object(update_service, "parse_results_url") as mock_parse:
+        with mock.patch.object(routing, "parse_results_url") as mock_parse:
             result = run_update(["https://example.com"], ["2026-01-01"], dry_run=False)
 
         self.assertIsInstance(result, UpdateError)
@@ -70,9 +71,7 @@ class TestRunUpdate(unittest.TestCase):
         """The default (no dry_run argument at all) must behave as a dry
         run - every existing caller that doesn't know about this parameter
         should keep working exactly as before."""
-        with mock.patch.object(
-            update_service, "parse_results_url", return_value=[_make_result(place=1)]
-        ):
+        with mock.patch.object(routing, "parse_results_url", return_value=[_make_result(place=1)]):
             result = run_update(["https://example.com"], ["2026-01-01"], lookup=_new_dancer_lookup)
 
         self.assertIsInstance(result, UpdateSuccess)
@@ -90,9 +89,7 @@ class TestRunUpdate(unittest.TestCase):
         self.assertIn("not-a-date", result.message)
 
     def test_parse_failure_returns_error_with_502(self):
-        with mock.patch.object(
-            update_service, "parse_results_url", side_effect=ValueError("bad url")
-        ):
+        with mock.patch.object(routing, "parse_results_url", side_effect=ValueError("bad url")):
             result = run_update(["https://example.com"], ["2026-01-01"])
 
         self.assertIsInstance(result, UpdateError)
@@ -100,9 +97,7 @@ class TestRunUpdate(unittest.TestCase):
         self.assertIn("bad url", result.message)
 
     def test_successful_run_produces_all_and_per_dancer_text(self):
-        with mock.patch.object(
-            update_service, "parse_results_url", return_value=[_make_result(place=1)]
-        ):
+        with mock.patch.object(routing, "parse_results_url", return_value=[_make_result(place=1)]):
             result = run_update(["https://example.com"], ["2026-01-01"], lookup=_new_dancer_lookup)
 
         self.assertIsInstance(result, UpdateSuccess)
@@ -113,10 +108,64 @@ class TestRunUpdate(unittest.TestCase):
         self.assertNotIn("Jamie Adams", result.dancer_text["Alex Zephyr"])
         self.assertEqual(result.new_dancer_count, 2)  # both dancers are new, per _new_dancer_lookup
 
+    def test_progress_reports_each_phase_in_order(self):
+        calls = []
+        with mock.patch.object(routing, "parse_results_url", return_value=[_make_result(place=1)]):
+            run_update(
+                ["https://example.com"],
+                ["2026-01-01"],
+                lookup=_new_dancer_lookup,
+                progress=lambda phase, detail="": calls.append((phase, detail)),
+            )
+
+        self.assertEqual(
+            calls,
+            [
+                ("fetch", "0/1 competitions"),
+                ("fetch", "1/1 competitions"),
+                ("lookup", "1 results"),
+                ("score", ""),
+                ("render", "2 dancers"),
+            ],
+        )
+
+    def test_given_client_is_used_and_left_open(self):
+        client = mock.Mock()
+        with mock.patch.object(routing, "parse_results_url", return_value=[_make_result(1)]) as p:
+            run_update(
+                ["https://example.com"], ["2026-01-01"], lookup=_new_dancer_lookup, client=client
+            )
+
+        self.assertIs(p.call_args.args[2], client)
+        client.close.assert_not_called()
+
+    def test_given_results_cache_is_used_and_left_open(self):
+        results_cache = mock.Mock()
+        with mock.patch.object(routing, "parse_results_url", return_value=[_make_result(1)]) as p:
+            run_update(
+                ["https://example.com"],
+                ["2026-01-01"],
+                lookup=_new_dancer_lookup,
+                client=mock.Mock(),
+                results_cache=results_cache,
+            )
+
+        self.assertIs(p.call_args.kwargs["results_cache"], results_cache)
+        results_cache.close.assert_not_called()
+
+    def test_own_client_closed_even_on_failure(self):
+        client = mock.Mock()
+        with mock.patch.object(update_service, "build_results_client", return_value=client):
+            with mock.patch.object(routing, "parse_results_url", side_effect=ValueError("bad")):
+                result = run_update(
+                    ["https://example.com"], ["2026-01-01"], lookup=_new_dancer_lookup
+                )
+
+        self.assertIsInstance(result, UpdateError)
+        client.close.assert_called_once()
+
     def test_new_dancer_count_excludes_dancers_already_in_the_db(self):
-        with mock.patch.object(
-            update_service, "parse_results_url", return_value=[_make_result(place=1)]
-        ):
+        with mock.patch.object(routing, "parse_results_url", return_value=[_make_result(place=1)]):
             result = run_update(
                 ["https://example.com"], ["2026-01-01"], lookup=_existing_dancer_lookup
             )
@@ -132,9 +181,7 @@ class TestRunUpdate(unittest.TestCase):
                 return _new_dancer_lookup(first, last)
             return _existing_dancer_lookup(first, last)
 
-        with mock.patch.object(
-            update_service, "parse_results_url", return_value=[_make_result(place=1)]
-        ):
+        with mock.patch.object(routing, "parse_results_url", return_value=[_make_result(place=1)]):
             result = run_update(["https://example.com"], ["2026-01-01"], lookup=_mixed_lookup)
 
         self.assertEqual(result.new_dancer_count, 1)
@@ -142,18 +189,20 @@ class TestRunUpdate(unittest.TestCase):
     def test_multiple_urls_paired_with_dates_in_order(self):
         calls = []
 
-        def _fake_parse(url, comp_date, client):
+        def _fake_parse(url, comp_date, client, results_cache=None):
             calls.append((url, comp_date))
             return [_make_result(place=1)]
 
-        with mock.patch.object(update_service, "parse_results_url", side_effect=_fake_parse):
+        with mock.patch.object(routing, "parse_results_url", side_effect=_fake_parse):
             run_update(
                 ["https://a.example.com", "https://b.example.com"],
                 ["2026-01-01", "2026-02-01"],
                 lookup=_new_dancer_lookup,
             )
 
-        self.assertEqual(
+        # Competitions are fetched concurrently, so only the pairing is
+        # guaranteed, not the order the calls happen in.
+        self.assertCountEqual(
             calls,
             [
                 ("https://a.example.com", date(2026, 1, 1)),
@@ -162,5 +211,25 @@ class TestRunUpdate(unittest.TestCase):
         )
 
 
+class TestBuildResultsClient(unittest.TestCase):
+    def test_paces_each_host_by_rate_and_burst(self):
+        client = update_service.build_results_client(requests_per_second=4, burst=6)
+        self.addCleanup(client.close)
+
+        self.assertEqual(client.min_delay_seconds, 0.25)
+        self.assertEqual(client.burst, 6)
+
+    def test_defaults_allow_a_burst_above_one_request_per_second(self):
+        client = update_service.build_results_client()
+        self.addCleanup(client.close)
+
+        self.assertLess(client.min_delay_seconds, 1.0)
+        self.assertGreater(client.burst, 1)
+
+    def test_non_positive_rate_raises(self):
+        with self.assertRaises(ValueError):
+            update_service.build_results_client(requests_per_second=0)
+
+
 if __name__ == "__main__":
     unittest.main()
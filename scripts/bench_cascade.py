@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark cascade-delta templates against building every delta afresh.
+
+Scores a synthetic competition's worth of (event dances, award) pairs
+with cascade._compute_cascade_delta() (two fresh arrays and a Python
+cascade loop per result, as before templates) and with
+cascade.build_cascade_delta() (an interned-template lookup, plus a scalar
+multiply for Split-Level results, as PointsCalculator.compute_batch()
+cascades every award), checks they agree, and prints each one's best-of-N
+per-result cost.
+
+Usage:
+    python scripts/bench_cascade.py [--results N] [--repeat N] [--seed N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+
+from points_updating.lib.rules import award_table, cascade  # noqa: E402
+from utils.lib import constants  # noqa: E402
+from utils.lib.constants import Style  # noqa: E402
+from utils.lib.models.dance import Dance  # noqa: E402
+
+_Case = tuple[tuple[Dance, ...], tuple[int, int, int], int]
+
+
+def _synthetic_results(count: int, seed: int) -> list[_Case]:
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        style = rng.choice(Style.points_eligible_styles())
+        level = rng.choice(constants.LEVELS)
+        names = rng.sample(constants.DANCE_NAMES[style], rng.randint(1, 3))
+        dances = tuple(Dance(level, style, name) for name in names)
+        award = award_table.compute_award(rng.randint(1, 4), rng.randint(1, 8))
+        scale = 3 if rng.random() < 0.1 else 1
+        cases.append((dances, award, scale))
+    return cases
+
+
+def _fresh(cases: list[_Case]) -> list:
+    deltas = []
+    for dances, award, scale in cases:
+        first, second, third = award
+        scaled = (first * scale, second * scale, third * scale)
+        names = tuple(dance.dance for dance in dances)
+        deltas.append(
+            cascade._compute_cascade_delta(dances[0].level, dances[0].style, names, scaled)
+        )
+    return deltas
+
+
+def _templated(cases: list[_Case]) -> list:
+    return [cascade.build_cascade_delta(dances, award, scale) for dances, award, scale in cases]
+
+
+def _measure(build: Callable[[list[_Case]], list], cases: list[_Case], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(cases)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cases = _synthetic_results(args.results, args.seed)
+    for fresh, templated in zip(_fresh(cases), _templated(cases)):
+        if not (
+            np.array_equal(fresh.syllabus, templated.syllabus)
+            and np.array_equal(fresh.open, templated.open)
+        ):
+            print("MISMATCH: templates disagree with a fresh cascade", file=sys.stderr)
+            return 1
+
+    print(f"{args.results} results, {cascade._cascade_template.cache_info().currsize} templates")
+    for name, build in (("fresh", _fresh), ("templated", _templated)):
+        seconds = _measure(build, cases, args.repeat)
+        print(f"{name:>10}: {seconds / args.results * 1e6:8.2f} us/result best of {args.repeat}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark memoized style/dance/level conversion against unmemoized lookups.
+
+Converts a synthetic stream of raw spellings the way the results parsers
+do - every word (and word pair) of a heat name tried as a level, most of
+them misses, then its dance name - once through the memoized resolvers
+behind convert_*() and once through the same alias-table lookups without
+the memo, checks both agree, and prints each one's best-of-N per-call
+cost.
+
+Usage:
+    python scripts/bench_conversion.py [--heats N] [--repeat N] [--seed N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.lib import constants  # noqa: E402
+from utils.lib.constants import Style  # noqa: E402
+from utils.lib.models import dance  # noqa: E402
+
+_DIVISIONS = ["Amateur", "Adult", "Collegiate", "Rookie Followers", "Pro-Am"]
+_STYLE_WORDS = {
+    Style.STANDARD: "Intl.",
+    Style.LATIN: "Intl.",
+    Style.SMOOTH: "Am.",
+    Style.RHYTHM: "Am.",
+}
+# A few dance spellings outside the alias tables, as organizers write them.
+_DANCE_SPELLINGS = ["ChaCha", "V. Waltz", "Paso", "Swing", "Foxtrott"]
+
+# (kind, style, spelling) - style is None for a level
+_Call = tuple[str, Optional[Style], str]
+
+
+def _synthetic_calls(heats: int, seed: int) -> list[_Call]:
+    """Every conversion an O2CM-style heat name leads to: each adjacent word
+    pair and word tried as a level (see o2cm._extract_level()), then its
+    dance name."""
+    rng = random.Random(seed)
+    calls: list[_Call] = []
+    for _ in range(heats):
+        style = rng.choice(Style.points_eligible_styles())
+        name = rng.choice(constants.DANCE_NAMES[style] + _DANCE_SPELLINGS)
+        level = rng.choice(constants.LEVELS)
+        tokens = f"{rng.choice(_DIVISIONS)} {level} {_STYLE_WORDS[style]} {name}".split()
+        windows = [" ".join(pair) for pair in zip(tokens, tokens[1:])]
+        calls.extend(("level", None, candidate) for candidate in windows + tokens)
+        calls.append(("dance", style, name))
+    return calls
+
+
+def _run(calls: list[_Call], resolve_level: Callable, resolve_dance: Callable) -> list:
+    return [
+        resolve_level(name) if kind == "level" else resolve_dance(style, name)
+        for kind, style, name in calls
+    ]
+
+
+def _memoized(calls: list[_Call]) -> list:
+    return _run(calls, dance._resolve_level, dance._resolve_dance)
+
+
+def _unmemoized(calls: list[_Call]) -> list:
+    return _run(calls, dance._resolve_level.__wrapped__, dance._resolve_dance.__wrapped__)
+
+
+def _measure(convert: Callable[[list[_Call]], list], calls: list[_Call], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(calls)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--heats", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    calls = _synthetic_calls(args.heats, args.seed)
+    if _memoized(calls) != _unmemoized(calls):
+        print("MISMATCH: memoized conversion disagrees with direct lookups", file=sys.stderr)
+        return 1
+
+    print(f"{len(calls)} conversions over {args.heats} heats")
+    for name, convert in (("unmemoized", _unmemoized), ("memoized", _memoized)):
+        seconds = _measure(convert, calls, args.repeat)
+        print(f"{name:>10}: {seconds / len(calls) * 1e6:8.2f} us/call best of {args.repeat}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
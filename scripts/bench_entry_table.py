@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark columnar entry-table preprocessing against per-row parsing.
+
+Preprocesses a synthetic entry spreadsheet with the per-row loop
+EntryChecker.check() used before entry tables (DataFrame.iterrows(),
+is_tba_row() and resolve_dance_names() per row) and with
+entry_table.build_entry_table(), checks both yield the same entries, and
+prints each one's best-of-N per-row cost.
+
+Usage:
+    python scripts/bench_entry_table.py [--rows N] [--repeat N] [--seed N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from entry_checking.lib.parsing.entry_table import build_entry_table  # noqa: E402
+from entry_checking.lib.parsing.multi_dance_resolver import resolve_dance_names  # noqa: E402
+from entry_checking.lib.parsing.row_parser import is_tba_row  # noqa: E402
+from utils.lib import constants  # noqa: E402
+from utils.lib.constants import Style  # noqa: E402
+from utils.lib.models.dance import Dance  # noqa: E402
+
+_DANCERS = 1500
+_TBA_RATE = 0.03
+
+
+def _synthetic_entries(count: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    people = [(f"First{i}", f"Last{i}") for i in range(_DANCERS)]
+    columns: dict[str, list] = {
+        "Style": [],
+        "Dance": [],
+        "Skill": [],
+        "Lead First": [],
+        "Lead Last": [],
+        "Follow First": [],
+        "Follow Last": [],
+        "Heat": [],
+    }
+    for heat in range(count):
+        style = rng.choice(Style.points_eligible_styles())
+        if rng.random() < 0.2:
+            dances = "".join(rng.sample(sorted(constants.ABBREVIATION_MAPS[style]), 2))
+        else:
+            dances = rng.choice(constants.DANCE_NAMES[style])
+        # A TBA follow's name cells are NaN, as pandas reads blank cells.
+        follow: tuple[object, object]
+        lead, follow = rng.sample(people, 2)
+        if rng.random() < _TBA_RATE:
+            follow = (np.nan, np.nan)
+        columns["Style"].append(style)
+        columns["Dance"].append(dances)
+        columns["Skill"].append(rng.choice(constants.LEVELS))
+        columns["Lead First"].append(lead[0])
+        columns["Lead Last"].append(lead[1])
+        columns["Follow First"].append(follow[0])
+        columns["Follow Last"].append(follow[1])
+        columns["Heat"].append(str(heat))
+    return pd.DataFrame(columns)
+
+
+def _per_row(raw_data: pd.DataFrame) -> list:
+    entries = []
+    for _, row in raw_data.iterrows():
+        if is_tba_row(row):
+            continue
+        level, style = row["Skill"], row["Style"]
+        dance_names = resolve_dance_names(row["Dance"], style)
+        entries.append(
+            (
+                row["Lead First"],
+                row["Lead Last"],
+                row["Follow First"],
+                row["Follow Last"],
+                row["Heat"],
+                tuple(Dance(level, style, name) for name in dance_names),
+            )
+        )
+    return entries
+
+
+def _columnar(raw_data: pd.DataFrame) -> list:
+    table = build_entry_table(raw_data)
+    return [
+        (
+            table.lead_first[i],
+            table.lead_last[i],
+            table.follow_first[i],
+            table.follow_last[i],
+            table.heats[i],
+            table.events[table.event_codes[i]],
+        )
+        for i in range(len(table))
+    ]
+
+
+def _measure(build: Callable[[pd.DataFrame], list], raw_data: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(raw_data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    raw_data = _synthetic_entries(args.rows, args.seed)
+    if _per_row(raw_data) != _columnar(raw_data):
+        print("MISMATCH: the entry table disagrees with per-row parsing", file=sys.stderr)
+        return 1
+
+    print(f"{args.rows} rows, {len(build_entry_table(raw_data).events)} distinct events")
+    for name, build in (("per-row", _per_row), ("columnar", _columnar)):
+        seconds = _measure(build, raw_data, args.repeat)
+        print(f"{name:>9}: {seconds / args.rows * 1e6:8.2f} us/row best of {args.repeat}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
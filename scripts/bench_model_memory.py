@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark the memory held by a parsed competition's result objects.
+
+Builds a synthetic competition's worth of CompetitionResults twice - once
+with replicas of the previous model classes (a per-instance-__dict__
+Dance built afresh for every result, and plain dataclass DancerRef/
+CompetitionResult), once with the current interned Dance and slotted
+records - checks both describe the same results, and prints the bytes
+each keeps allocated (via tracemalloc) in total and per result.
+
+Usage:
+    python scripts/bench_model_memory.py [--results N] [--seed N]
+"""
+
+import argparse
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from points_updating.lib.models.result import CompetitionResult, DancerRef  # noqa: E402
+from utils.lib import constants  # noqa: E402
+from utils.lib.constants import Style  # noqa: E402
+from utils.lib.models.dance import (  # noqa: E402
+    Dance,
+    convert_dance,
+    convert_level,
+    convert_style,
+)
+
+_COMPETITION_DATE = date(2025, 11, 14)
+_DANCERS = 2000
+
+
+class _DictDance:
+    """Dance as it was before interning: converted and allocated per call."""
+
+    def __init__(self, level: str, style: str, dance: str):
+        self.level = convert_level(level)
+        self.style = convert_style(style)
+        self.dance = convert_dance(self.style, dance)
+
+
+@dataclass(frozen=True)
+class _DictDancerRef:
+    first: str
+    last: str
+
+
+@dataclass
+class _DictCompetitionResult:
+    dance: _DictDance
+    lead: _DictDancerRef
+    follow: _DictDancerRef
+    place: int
+    num_rounds: int
+    competition_name: str
+    competition_date: date
+    event_dances: tuple[_DictDance, ...]
+
+
+# (level, style, dance names, lead (first, last), follow (first, last), place, rounds)
+_Row = tuple[str, Style, list[str], tuple[str, str], tuple[str, str], int, int]
+
+
+def _synthetic_rows(count: int, seed: int) -> list[_Row]:
+    rng = random.Random(seed)
+    people = [(f"First{i}", f"Last{i}") for i in range(_DANCERS)]
+    rows = []
+    for _ in range(count):
+        style = rng.choice(Style.points_eligible_styles())
+        level = rng.choice(constants.LEVELS)
+        names = rng.sample(constants.DANCE_NAMES[style], rng.randint(1, 3))
+        lead, follow = rng.sample(people, 2)
+        rows.append((level, style, names, lead, follow, rng.randint(1, 8), rng.randint(1, 4)))
+    return rows
+
+
+# Both builds copy each name ("".join) so every result holds its own
+# strings, as a parser slicing them out of HTML would.
+def _build_before(rows: list[_Row]) -> list:
+    results = []
+    for level, style, names, lead, follow, place, rounds in rows:
+        event_dances = tuple(_DictDance(level, style, name) for name in names)
+        results.append(
+            _DictCompetitionResult(
+                dance=_DictDance(level, style, names[0]),
+                lead=_DictDancerRef("".join(lead[0]), "".join(lead[1])),
+                follow=_DictDancerRef("".join(follow[0]), "".join(follow[1])),
+                place=place,
+                num_rounds=rounds,
+                competition_name="Synthetic Classic",
+                competition_date=_COMPETITION_DATE,
+                event_dances=event_dances,
+            )
+        )
+    return results
+
+
+def _build_after(rows: list[_Row]) -> list:
+    results = []
+    for level, style, names, lead, follow, place, rounds in rows:
+        event_dances = tuple(Dance(level, style, name) for name in names)
+        results.append(
+            CompetitionResult(
+                dance=Dance(level, style, names[0]),
+                lead=DancerRef("".join(lead[0]), "".join(lead[1])),
+                follow=DancerRef("".join(follow[0]), "".join(follow[1])),
+                place=place,
+                num_rounds=rounds,
+                competition_name="Synthetic Classic",
+                competition_date=_COMPETITION_DATE,
+                event_dances=event_dances,
+            )
+        )
+    return results
+
+
+def _measure(build: Callable[[list[_Row]], list], rows: list[_Row]) -> tuple[list, int]:
+    tracemalloc.start()
+    try:
+        results = build(rows)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return results, retained
+
+
+def _describe(result) -> tuple:
+    return (
+        tuple((d.level, d.style, d.dance) for d in result.event_dances),
+        result.lead.first,
+        result.follow.last,
+        result.place,
+        result.num_rounds,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rows = _synthetic_rows(args.results, args.seed)
+    # Warm the interning tables first, so the comparison is of a parse once
+    # the process has seen each dance - as every competition after the
+    # first is.
+    _build_after(rows[:1000])
+
+    before, before_bytes = _measure(_build_before, rows)
+    after, after_bytes = _measure(_build_after, rows)
+    if [_describe(r) for r in before] != [_describe(r) for r in after]:
+        print("MISMATCH: the two builds describe different results", file=sys.stderr)
+        return 1
+
+    print(f"{args.results} results, {len(Dance._interned)} interned Dances")
+    for name, retained in (("before", before_bytes), ("after", after_bytes)):
+        print(
+            f"{name:>7}: {retained / 1e6:7.2f} MB retained, "
+            f"{retained / args.results:6.0f} B/result"
+        )
+    print(f"reduction: {1 - after_bytes / before_bytes:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark O2CM's streaming results-page parser against the whole-tree one.
+
+Parses a consolidated event3.asp results page with both
+o2cm._parse_results_page() (a full BeautifulSoup tree) and
+o2cm.iter_results_page() (lxml rows streamed and discarded as they're
+read), checks they agree, and prints each one's best-of-N time and peak
+Python heap use. Peak memory is from tracemalloc, so it counts Python
+objects (e.g. BeautifulSoup's tree) but not libxml2's own C buffers.
+
+Usage:
+    python scripts/bench_o2cm_parser.py [--page PATH] [--scale N] [--repeat N]
+
+--page defaults to the captured test fixture; --scale repeats that page's
+content N times over to approximate a bigger competition's page.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from points_updating.lib.parsing import o2cm  # noqa: E402
+
+_DEFAULT_PAGE = (
+    Path(__file__).resolve().parent.parent
+    / "points_updating/tests/parsing/fixtures/o2cm/results_page.html"
+)
+_COMPETITION_DATE = date(2025, 11, 14)
+
+
+def _whole_tree(html: str) -> list:
+    return o2cm._parse_results_page(html, "Benchmark", _COMPETITION_DATE)
+
+
+def _streaming(html: str) -> list:
+    return list(o2cm.iter_results_page(o2cm._chunked(html), "Benchmark", _COMPETITION_DATE))
+
+
+def _measure(parse: Callable[[str], list], html: str, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", type=Path, default=_DEFAULT_PAGE)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = args.page.read_text(encoding="utf-8") * args.scale
+    whole_tree_results = _whole_tree(html)
+    if _streaming(html) != whole_tree_results:
+        print("MISMATCH: the two parsers disagree on this page", file=sys.stderr)
+        return 1
+
+    print(f"{args.page.name} x{args.scale}: {len(html) / 1e6:.2f} MB of HTML, ", end="")
+    print(f"{len(whole_tree_results)} results")
+    for name, parse in (("whole-tree", _whole_tree), ("streaming", _streaming)):
+        seconds, peak = _measure(parse, html, args.repeat)
+        print(f"{name:>10}: {seconds * 1000:8.1f} ms best of {args.repeat}, ", end="")
+        print(f"{peak / 1e6:7.1f} MB peak Python heap")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Persistent on-disk cache of CDA points database lookups.
+
+Wraps a dancer lookup function (lookup_dancer() by default) with a local
+SQLite store, so repeated runs against the same dancers - a second dry run
+minutes after the first, or re-checking an entry sheet after fixing one row
+- don't re-fetch every dancer from the CDA points database.
+"""
+
+import datetime
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from utils.lib.api.client import DancerRecord, lookup_dancer
+
+# One day - long enough to cover repeated runs during one working session,
+# short enough that a dancer whose points the CDA has since updated isn't
+# served stale for long.
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dancer_records (
+    first_key TEXT NOT NULL,
+    last_key TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (first_key, last_key)
+)
+"""
+
+
+class DancerRecordCache:
+    """A drop-in replacement for lookup_dancer() that serves recently
+    fetched DancerRecords from a local SQLite file instead of the network.
+
+    Entries are keyed by normalized first/last name (see _normalize_name())
+    and expire ttl_seconds after they were fetched. Instances are callable
+    with the same (first, last) signature as lookup_dancer(), so they can
+    be passed anywhere a lookup function is accepted (UpdateEngine,
+    EntryChecker), and are safe to call from several threads at once.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        lookup: Callable[[str, str], DancerRecord] = lookup_dancer,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create a DancerRecordCache.
+
+        Args:
+            path: The SQLite file to store records in - created (along with
+                its parent directory) if it doesn't exist yet.
+            lookup: Fetches a DancerRecord on a cache miss. Defaults to the
+                real CDA API; tests inject a fake instead.
+            ttl_seconds: How long a fetched record stays valid. 0 means
+                every lookup is a miss.
+            refresh: If True, every lookup bypasses the cached value and
+                re-fetches (still writing the fresh record back), for a run
+                that must see the database's current state.
+            clock: Injectable wall clock - tests supply a fake so expiry is
+                deterministic. Wall-clock rather than monotonic, since
+                entries outlive the process that wrote them.
+        """
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must be >= 0, got {ttl_seconds}")
+        self._lookup = lookup
+        self.ttl_seconds = ttl_seconds
+        self.refresh = refresh
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def __call__(self, first: str, last: str) -> DancerRecord:
+        """Returns the DancerRecord for first/last, from the cache if a
+        fresh-enough entry exists, otherwise via the wrapped lookup.
+
+        Raises:
+            DancerLookupError: on a miss, if the wrapped lookup fails -
+                nothing is cached in that case.
+        """
+        key = (_normalize_name(first), _normalize_name(last))
+        if not self.refresh:
+            cached = self._read(key)
+            if cached is not None:
+                with self._lock:
+                    self.hits += 1
+                return cached
+
+        # Deliberately outside the lock, so concurrent misses (e.g.
+        # UpdateEngine.prefetch_dancers()) still fetch in parallel.
+        record = self._lookup(first, last)
+        self._write(key, record)
+        with self._lock:
+            self.misses += 1
+        return record
+
+    def invalidate(self, first: str, last: str) -> None:
+        """Drops one dancer's cached record, so their next lookup re-fetches."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM dancer_records WHERE first_key = ? AND last_key = ?",
+                (_normalize_name(first), _normalize_name(last)),
+            )
+
+    def clear(self) -> None:
+        """Drops every cached record."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM dancer_records")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _read(self, key: tuple[str, str]) -> Optional[DancerRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, record FROM dancer_records "
+                "WHERE first_key = ? AND last_key = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, payload = row
+        if self._clock() - fetched_at >= self.ttl_seconds:
+            return None
+        return record_from_json(payload)
+
+    def _write(self, key: tuple[str, str], record: DancerRecord) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dancer_records VALUES (?, ?, ?, ?)",
+                (*key, self._clock(), record_to_json(record)),
+            )
+
+
+def _normalize_name(name: str) -> str:
+    """Case- and whitespace-insensitive form of a name, so e.g. "Mary Ann"
+    and " mary  ann" share one cache entry."""
+    return " ".join(name.split()).casefold()
+
+
+def record_to_json(record: DancerRecord) -> str:
+    """Serializes a DancerRecord for storage - also used by
+    points_updating's LedgerStore for its dancers' baseline records."""
+    return json.dumps(
+        {
+            "cda_id": record.cda_id,
+            "first": record.first,
+            "last": record.last,
+            "first_comp_date": (
+                record.first_comp_date.isoformat() if record.first_comp_date else None
+            ),
+            "created_date": record.created_date,
+            "syllabus_pts": np.asarray(record.syllabus_pts).tolist(),
+            "open_pts": np.asarray(record.open_pts).tolist(),
+        }
+    )
+
+
+def record_from_json(payload: str) -> DancerRecord:
+    """Inverse of record_to_json()."""
+    data = json.loads(payload)
+    first_comp_date = data["first_comp_date"]
+    return DancerRecord(
+        cda_id=data["cda_id"],
+        first=data["first"],
+        last=data["last"],
+        first_comp_date=(datetime.date.fromisoformat(first_comp_date) if first_comp_date else None),
+        created_date=data["created_date"],
+        syllabus_pts=np.array(data["syllabus_pts"], dtype=int),
+        open_pts=np.array(data["open_pts"], dtype=int),
+    )
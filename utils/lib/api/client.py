@@ -1,23 +1,34 @@
 """CDA points database API client.
 
 Provides typed data structures and functions for fetching dancer information
-from the CDA points database.
+from the CDA points database: lookup_dancer() for a one-off lookup, and
+DancerLookupClient for many lookups over one pooled, retrying session.
 """
 
 import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 import numpy as np
 import pytz
 import requests
+from requests.adapters import HTTPAdapter
 
 from utils.lib.api import config
 
+_NAMEMATCH_URL = "https://collegiatedancesport.org/db/namematch.php"
+
 # JSON field names from the CDA API response for indexing into fairlevelPoints
 SYLLABUS_KEYS = ["newcomer_points", "bronze_points", "silver_points", "gold_points"]
 OPEN_KEYS = ["novice_points", "prechamp_points", "champ_points"]
 
+# Responses worth retrying - throttling plus transient server-side failures.
+# Anything else (e.g. a 401 for a bad API key) fails immediately, since
+# retrying it would only delay the same error.
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 class DancerLookupError(Exception):
     """Raised when the CDA points database can't be reached, times out, or
@@ -84,9 +95,7 @@ def lookup_dancer(first: str, last: str) -> DancerRecord:
     parameters = {"firstName": first, "lastName": last}
 
     try:
-        response = requests.get(
-            "https://collegiatedancesport.org/db/namematch.php", headers=HEADER, params=parameters
-        )
+        response = requests.get(_NAMEMATCH_URL, headers=HEADER, params=parameters)
         response.raise_for_status()
         result = response.json()
     except (requests.exceptions.RequestException, ValueError) as e:
@@ -94,6 +103,15 @@ def lookup_dancer(first: str, last: str) -> DancerRecord:
             f"Failed to look up '{first} {last}' in the CDA points database: {e}"
         ) from e
 
+    return _record_from_result(first, last, result)
+
+
+def _record_from_result(first: str, last: str, result) -> DancerRecord:
+    """Builds a DancerRecord from a decoded namematch.php response.
+
+    Raises:
+        DancerLookupError: if the response doesn't match the expected shape.
+    """
     try:
         if not result["success"]:
             return _build_empty_record(first, last)
@@ -119,3 +137,117 @@ def lookup_dancer(first: str, last: str) -> DancerRecord:
         raise DancerLookupError(
             f"Unexpected response shape looking up '{first} {last}' in the CDA points database: {e}"
         ) from e
+
+
+class DancerLookupClient:
+    """Looks up dancers over one pooled `requests.Session`, retrying
+    transient failures with exponential backoff (the same policy
+    ThrottledClient applies to results sources).
+
+    Unlike lookup_dancer(), which opens a fresh connection (a full TCP+TLS
+    handshake) for every call, every lookup here reuses the session's
+    connection pool. Instances are callable with lookup_dancer()'s own
+    (first, last) signature, so one can be passed anywhere a lookup
+    function is accepted (UpdateEngine, EntryChecker, DancerRecordCache).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        max_retries: int = 3,
+        backoff_base_seconds: float = 1.0,
+        timeout_seconds: float = 10.0,
+        session: Optional[requests.Session] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Create a DancerLookupClient.
+
+        Args:
+            max_connections: Size of the session's connection pool, and the
+                most lookups lookup_many() runs at once.
+            max_retries: How many additional attempts to make after a
+                connection error, timeout, or retryable status (429/5xx)
+                before giving up.
+            backoff_base_seconds: Delay before the first retry; doubles on
+                each subsequent attempt.
+            timeout_seconds: Per-request timeout, so one stalled lookup
+                can't hang a whole run.
+            session: Injectable session - defaults to a new pooled
+                `requests.Session`; tests supply a fake.
+            sleep: Injectable sleep function - tests supply a fake so
+                backoff tests don't actually wait.
+        """
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {max_connections}")
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {max_retries}")
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.timeout_seconds = timeout_seconds
+        self._sleep = sleep
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+            session.mount("https://", adapter)
+        self._session = session
+
+    def __call__(self, first: str, last: str) -> DancerRecord:
+        return self.lookup(first, last)
+
+    def lookup(self, first: str, last: str) -> DancerRecord:
+        """Fetches one dancer - see lookup_dancer() for the returned record.
+
+        Raises:
+            DancerLookupError: if every attempt fails, or the response
+                doesn't match the expected shape.
+        """
+        parameters = {"firstName": first, "lastName": last}
+        for attempt in range(self.max_retries + 1):
+            is_last_attempt = attempt == self.max_retries
+            try:
+                response = self._session.get(
+                    _NAMEMATCH_URL,
+                    headers={"x-api-key": config.API_KEY},
+                    params=parameters,
+                    timeout=self.timeout_seconds,
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if is_last_attempt:
+                    raise DancerLookupError(
+                        f"Failed to look up '{first} {last}' in the CDA points database: {e}"
+                    ) from e
+            else:
+                if response.status_code not in _RETRY_STATUS_CODES or is_last_attempt:
+                    break
+            self._sleep(self.backoff_base_seconds * (2**attempt))
+
+        try:
+            response.raise_for_status()
+            result = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise DancerLookupError(
+                f"Failed to look up '{first} {last}' in the CDA points database: {e}"
+            ) from e
+
+        return _record_from_result(first, last, result)
+
+    def lookup_many(self, names: Iterable[tuple[str, str]]) -> dict[tuple[str, str], DancerRecord]:
+        """Fetches every (first, last) in names, up to max_connections at
+        a time. Duplicate names are only fetched once.
+
+        Returns:
+            Each distinct (first, last) pair mapped to its DancerRecord.
+        Raises:
+            DancerLookupError: if any lookup fails.
+        """
+        unique = list(dict.fromkeys(names))
+        if not unique:
+            return {}
+        workers = min(self.max_connections, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            records = executor.map(lambda name: self.lookup(*name), unique)
+            return dict(zip(unique, records))
+
+    def close(self) -> None:
+        self._session.close()
@@ -0,0 +1,3 @@
+# Copy to config.py and set your API key — see README's "API Layer" section for setup.
+# config.py is gitignored to keep secrets out of version control.
+API_KEY = "your-api-key-here"
@@ -137,6 +137,15 @@ ALL_LEVELS: list[str] = (
 
 ROUNDS: list[str] = list(Round)
 
+# --- Integer indexes into the lists above ---
+# Points are stored in arrays laid out in these lists' orders; hot paths
+# look a name's position up here rather than with list.index().
+
+STYLE_INDEX: dict[str, int] = {style: idx for idx, style in enumerate(STYLES)}
+LEVEL_INDEX: dict[str, int] = {level: idx for idx, level in enumerate(LEVELS)}
+SYLLABUS_LEVEL_INDEX: dict[str, int] = {level: idx for idx, level in enumerate(SYLLABUS_LEVELS)}
+OPEN_LEVEL_INDEX: dict[str, int] = {level: idx for idx, level in enumerate(OPEN_LEVELS)}
+
 
 # --- Dance names per style ---
 
@@ -192,6 +201,19 @@ SYLLABUS_COLUMN_OFFSETS: dict[Style, int] = dict(
         itertools.accumulate((len(DANCE_NAMES[s]) for s in _SYLLABUS_COLUMN_STYLES), initial=0),
     )
 )
+# (style, dance name) -> the dance's position in DANCE_NAMES[style].
+DANCE_INDEX: dict[tuple[str, str], int] = {
+    (style, dance_name): idx
+    for style, dance_names in DANCE_NAMES.items()
+    for idx, dance_name in enumerate(dance_names)
+}
+# (style, dance name) -> the dance's syllabus points column, for every
+# points-eligible dance.
+SYLLABUS_COLUMNS: dict[tuple[str, str], int] = {
+    (style, dance_name): offset + DANCE_INDEX[style, dance_name]
+    for style, offset in SYLLABUS_COLUMN_OFFSETS.items()
+    for dance_name in DANCE_NAMES[style]
+}
 
 
 # --- Abbreviation maps (letter → full name for multi-dance events) ---
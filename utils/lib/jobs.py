@@ -0,0 +1,264 @@
+"""Background jobs for the web UIs.
+
+A JobManager runs long tasks (a points update, an entry check) on a small
+thread pool instead of inside the request that asked for them, and keeps a
+table of every job's status, current phase, and result, so a request can
+return a job id at once and later requests can follow the job's progress
+and fetch its result.
+
+Jobs are keyed by an input fingerprint as well as their id: submitting the
+same inputs again while an earlier job for them is still running, or has
+finished successfully within result_ttl_seconds, returns that job rather
+than redoing the work. job_events() turns a job's progress into a
+Server-Sent Events stream for a browser to follow.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from utils.lib.api.cache import DEFAULT_TTL_SECONDS
+
+_logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Reports a job's current phase, and optionally a short detail about its
+# progress within that phase (e.g. "2/3 competitions").
+ProgressCallback = Callable[..., None]
+
+
+class JobFailed(Exception):
+    """Raised by a job's task to fail the job with a user-facing message
+    (the exception's str()), rather than as an unexpected error."""
+
+
+@dataclass
+class Job:
+    """One job's entry in a JobManager's table.
+
+    JobManager hands out copies, so a Job never changes after the caller
+    receives it - ask the manager again for newer state.
+    """
+
+    id: str
+    fingerprint: str
+    params: dict[str, Any]  # whatever the submitter wants kept with the job
+    created_at: float
+    status: str = QUEUED
+    phase: Optional[str] = None
+    detail: str = ""
+    result: Any = None  # the task's return value, once DONE
+    error: Optional[str] = None  # the failure message, once FAILED
+    finished_at: Optional[float] = None
+    # Bumped on every change, so a follower can tell whether anything
+    # happened since it last looked (see JobManager.wait_for_change()).
+    version: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+def fingerprint(inputs: Any) -> str:
+    """A stable digest of a job's JSON-serializable inputs, for
+    JobManager.submit()."""
+    encoded = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class JobManager:
+    """Runs submitted tasks in the background and tracks them in a
+    thread-safe, in-memory job table."""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        result_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_finished_jobs: int = 100,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create a JobManager.
+
+        Args:
+            max_workers: The most jobs run at once; later ones queue.
+            result_ttl_seconds: How long a successful job's result is
+                reused for a resubmission of the same inputs. Defaults to
+                the dancer cache's TTL, since a report older than that may
+                no longer match the CDA database anyway.
+            max_finished_jobs: How many finished jobs the table keeps; the
+                oldest are dropped first, so a long-running server's table
+                stays bounded.
+            clock: Injectable wall clock - tests supply a fake so expiry
+                is deterministic.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_finished_jobs < 1:
+            raise ValueError(f"max_finished_jobs must be >= 1, got {max_finished_jobs}")
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_finished_jobs = max_finished_jobs
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._changed = threading.Condition()
+        self._jobs: dict[str, Job] = {}
+        self._by_fingerprint: dict[str, str] = {}
+
+    def submit(
+        self,
+        job_fingerprint: str,
+        task: Callable[[ProgressCallback], Any],
+        params: Optional[dict[str, Any]] = None,
+    ) -> Job:
+        """Starts task in the background, unless a job for the same inputs
+        can be reused.
+
+        Args:
+            job_fingerprint: Identifies task's inputs (see fingerprint()).
+            task: Called with a progress callback - task(progress) - on a
+                worker thread. Its return value becomes the job's result;
+                raising JobFailed fails the job with that message.
+            params: Kept on the job as-is (e.g. the inputs, to redisplay
+                alongside its result).
+        Returns:
+            The new job, or the reused one.
+        """
+        with self._changed:
+            existing = self._reusable(job_fingerprint)
+            if existing is not None:
+                return dataclasses.replace(existing)
+            job = Job(
+                id=uuid.uuid4().hex,
+                fingerprint=job_fingerprint,
+                params=dict(params or {}),
+                created_at=self._clock(),
+            )
+            self._jobs[job.id] = job
+            self._by_fingerprint[job_fingerprint] = job.id
+            snapshot = dataclasses.replace(job)
+        self._executor.submit(self._run, job.id, task)
+        return snapshot
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Returns job_id's current state, or None for an unknown (or
+        already dropped) job."""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            return None if job is None else dataclasses.replace(job)
+
+    def wait_for_change(
+        self, job_id: str, seen_version: int, timeout: Optional[float] = None
+    ) -> Optional[Job]:
+        """Blocks until job_id's version passes seen_version, or timeout
+        seconds pass.
+
+        Returns:
+            The job's state at that point - unchanged from seen_version on a
+            timeout - or None for an unknown job.
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: job_id not in self._jobs or self._jobs[job_id].version > seen_version,
+                timeout=timeout,
+            )
+            job = self._jobs.get(job_id)
+            return None if job is None else dataclasses.replace(job)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Blocks until job_id finishes, or timeout seconds pass, and
+        returns its state then (None for an unknown job)."""
+        with self._changed:
+            self._changed.wait_for(
+                lambda: job_id not in self._jobs or self._jobs[job_id].finished,
+                timeout=timeout,
+            )
+            job = self._jobs.get(job_id)
+            return None if job is None else dataclasses.replace(job)
+
+    def shutdown(self) -> None:
+        """Waits for running jobs to finish and stops accepting new ones."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _reusable(self, job_fingerprint: str) -> Optional[Job]:
+        job_id = self._by_fingerprint.get(job_fingerprint)
+        job = None if job_id is None else self._jobs.get(job_id)
+        if job is None or job.status == FAILED:
+            return None
+        if job.status == DONE and self._clock() - job.created_at >= self.result_ttl_seconds:
+            return None
+        return job
+
+    def _run(self, job_id: str, task: Callable[[ProgressCallback], Any]) -> None:
+        def progress(phase: str, detail: str = "") -> None:
+            self._update(job_id, phase=phase, detail=detail)
+
+        self._update(job_id, status=RUNNING)
+        try:
+            result = task(progress)
+        except JobFailed as e:
+            self._update(job_id, status=FAILED, error=str(e), finished_at=self._clock())
+        except Exception as e:  # a bug, not a user error - keep the server up
+            _logger.exception("Job %s failed", job_id)
+            self._update(
+                job_id, status=FAILED, error=f"Unexpected error: {e}", finished_at=self._clock()
+            )
+        else:
+            self._update(job_id, status=DONE, result=result, finished_at=self._clock())
+        with self._changed:
+            self._evict_finished()
+
+    def _update(self, job_id: str, **changes: Any) -> None:
+        with self._changed:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+            self._changed.notify_all()
+
+    def _evict_finished(self) -> None:
+        finished = [job for job in self._jobs.values() if job.finished]
+        for job in sorted(finished, key=lambda j: j.created_at)[: -self.max_finished_jobs]:
+            del self._jobs[job.id]
+            if self._by_fingerprint.get(job.fingerprint) == job.id:
+                del self._by_fingerprint[job.fingerprint]
+        self._changed.notify_all()
+
+
+def job_events(
+    manager: JobManager,
+    job_id: str,
+    describe: Callable[[Job], dict[str, Any]],
+    heartbeat_seconds: float = 15.0,
+) -> Iterator[str]:
+    """Follows a job as a Server-Sent Events stream.
+
+    Yields one "data:" event - describe(job) as JSON - for the job's state
+    now and after every change, ending once it has reported the job
+    finished (or the job is dropped). A comment line is yielded whenever
+    heartbeat_seconds pass without a change, so proxies don't close an
+    idle-looking connection during a long phase.
+    """
+    seen_version = -1
+    while True:
+        job = manager.wait_for_change(job_id, seen_version, timeout=heartbeat_seconds)
+        if job is None:
+            return
+        if job.version == seen_version:
+            yield ": keep-alive\n\n"
+            continue
+        seen_version = job.version
+        yield f"data: {json.dumps(describe(job))}\n\n"
+        if job.finished:
+            return
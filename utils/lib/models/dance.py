@@ -1,10 +1,16 @@
 """Dance representation and name/level conversion utilities.
 
 Converts dance names and levels from spreadsheet input into the standard
-naming conventions defined in utils.lib.constants.
+naming conventions defined in utils.lib.constants. Entry spreadsheets and
+every results parser convert through the same convert_*() functions, which
+look a spelling up in precompiled alias tables before falling back to
+substring/fuzzy matching, and remember each raw spelling's outcome.
 """
 
 import difflib
+import functools
+import threading
+from dataclasses import dataclass
 from typing import Optional
 
 from utils.lib import constants
@@ -16,6 +22,106 @@ from utils.lib.constants import DanceName, NightclubLevel, OpenLevel, RookieVetL
 # unrelated-but-similarly-shaped names (e.g. "Waltz" vs "Viennese Waltz").
 _FUZZY_MATCH_CUTOFF = 0.82
 
+# How many distinct raw spellings each convert_*() function remembers. Far
+# more than a season of spreadsheets and results pages use, but bounded,
+# since the results parsers also feed these arbitrary heat-name tokens.
+_CONVERSION_CACHE_SIZE = 4096
+
+# --- Precompiled alias tables ---
+# Every known spelling, mapped straight to its standard name. A canonical
+# name maps to itself; entries later in a table's construction win, so a
+# canonical name is never shadowed by an alias.
+
+_STYLE_ALIASES: dict[str, Style] = {
+    "Ballroom": Style.STANDARD,
+    **{style: Style(style) for style in constants.STYLES},
+}
+
+# Recognized in any style.
+_DANCE_ALIASES: dict[str, str] = {
+    "WCS": DanceName.WEST_COAST_SWING,
+    "Night Club 2-Step": DanceName.NIGHTCLUB_TWO_STEP,
+    "Nightclub 2-Step": DanceName.NIGHTCLUB_TWO_STEP,
+    "NC2S": DanceName.NIGHTCLUB_TWO_STEP,
+    "NC Two Step": DanceName.NIGHTCLUB_TWO_STEP,
+    "Arg. Tango": DanceName.ARGENTINE_TANGO,
+    "Vie. Waltz": DanceName.VIENNESE_WALTZ,
+    "V. Waltz": DanceName.VIENNESE_WALTZ,
+    **{
+        name: name
+        for name in (
+            DanceName.WEST_COAST_SWING,
+            DanceName.NIGHTCLUB_TWO_STEP,
+            DanceName.ARGENTINE_TANGO,
+            DanceName.VIENNESE_WALTZ,
+        )
+    },
+}
+
+# Recognized only in one style, after _DANCE_ALIASES. "Swing" is a common
+# organizer shorthand for Rhythm's East Coast Swing, but too generic a word
+# to safely alias for every style (e.g. Nightclub also has "West Coast
+# Swing" and "Country Swing").
+_STYLE_DANCE_ALIASES: dict[Style, dict[str, str]] = {
+    style: {name: name for name in constants.DANCE_NAMES[style]} for style in Style
+}
+_STYLE_DANCE_ALIASES[Style.RHYTHM].update(
+    {"Swing": DanceName.EAST_COAST_SWING, "EC Swing": DanceName.EAST_COAST_SWING}
+)
+
+# Longer names first, so a more specific name (e.g. "Viennese Waltz") is
+# matched as a substring before a shorter one it contains (e.g. "Waltz").
+_DANCES_LONGEST_FIRST: dict[Style, list[str]] = {
+    style: sorted(constants.DANCE_NAMES[style], key=len, reverse=True) for style in Style
+}
+
+_LEVEL_ALIASES: dict[str, str] = {
+    # Nightclub levels
+    "Intermediate/Advanced": NightclubLevel.INT_ADV,
+    "Advanced": NightclubLevel.INT_ADV,
+    "Intermediate/Adv.": NightclubLevel.INT_ADV,
+    "Int/Adv": NightclubLevel.INT_ADV,
+    # Rookie-Vet levels
+    "Rookie Leader": RookieVetLevel.ROOKIE_LEAD,
+    "Rookie Leaders": RookieVetLevel.ROOKIE_LEAD,
+    "RV Rookie Lead": RookieVetLevel.ROOKIE_LEAD,
+    "R/V Rookie Lead": RookieVetLevel.ROOKIE_LEAD,
+    "Rookie Follower": RookieVetLevel.ROOKIE_FOLLOW,
+    "Rookie Followers": RookieVetLevel.ROOKIE_FOLLOW,
+    "RV Rookie Follow": RookieVetLevel.ROOKIE_FOLLOW,
+    "R/V Rookie Follow": RookieVetLevel.ROOKIE_FOLLOW,
+    # Open levels
+    "Pre-Champ": OpenLevel.PRECHAMP,
+    "PreChamp": OpenLevel.PRECHAMP,
+    "Pre-Championship": OpenLevel.PRECHAMP,
+    "Championship": OpenLevel.CHAMP,
+    # A "Closed " prefix (e.g. "Closed Bronze") some organizers use for
+    # syllabus levels.
+    **{f"Closed {level}": level for level in constants.ALL_LEVELS},
+    **{level: level for level in constants.ALL_LEVELS},
+}
+
+
+@dataclass
+class ConversionStats:
+    """A snapshot of one convert_*() function's use in this process."""
+
+    hits: int  # calls answered from the memo
+    misses: int  # distinct spellings resolved afresh, recognized or not
+    fuzzy_matches: int  # of those, spellings only fuzzy matching recognized
+
+
+# Per converter, how many spellings only fuzzy matching recognized - each
+# one a candidate for an explicit alias above. Locked, since the results
+# parsers and dancer prefetches convert from several threads at once.
+_fuzzy_matches: dict[str, int] = {"style": 0, "dance": 0, "level": 0}
+_fuzzy_matches_lock = threading.Lock()
+
+
+def _count_fuzzy_match(kind: str) -> None:
+    with _fuzzy_matches_lock:
+        _fuzzy_matches[kind] += 1
+
 
 def _fuzzy_match(input_name: str, candidates: list[str]) -> Optional[str]:
     """Finds the closest candidate to input_name, if any is close enough.
@@ -36,6 +142,75 @@ def _fuzzy_match(input_name: str, candidates: list[str]) -> Optional[str]:
     return normalized_to_candidate[matches[0]] if matches else None
 
 
+# The _resolve_*() functions below hold each convert_*()'s lookup logic,
+# memoized per raw spelling. They return None for an unrecognized spelling
+# rather than raising, so a miss is remembered too - the results parsers
+# find a heat name's level/dance by trying each of its words in turn, most
+# of which aren't one.
+
+
+@functools.lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _resolve_style(input_name: str) -> Optional[Style]:
+    input_name = input_name.strip()
+
+    style = _STYLE_ALIASES.get(input_name)
+    if style is not None:
+        return style
+
+    match = _fuzzy_match(input_name, constants.STYLES)
+    if match is not None:
+        _count_fuzzy_match("style")
+        return Style(match)
+    return None
+
+
+@functools.lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _resolve_dance(style: Style, input_name: str) -> Optional[str]:
+    input_name = input_name.strip()
+
+    dance = _DANCE_ALIASES.get(input_name) or _STYLE_DANCE_ALIASES[style].get(input_name)
+    if dance is not None:
+        return dance
+
+    for dance_name in _DANCES_LONGEST_FIRST[style]:
+        if dance_name in input_name:
+            return dance_name
+
+    # An all-caps name is a multi-dance code (see convert_dance()), which
+    # fuzzy matching could only mistake for some single dance.
+    if input_name.isupper():
+        return None
+
+    # Catch near-miss spellings/formatting not covered by an explicit alias
+    # or substring match above (e.g. "ChaCha" for "Cha Cha").
+    match = _fuzzy_match(input_name, constants.DANCE_NAMES[style])
+    if match is not None:
+        _count_fuzzy_match("dance")
+    return match
+
+
+@functools.lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _resolve_level(input_name: str) -> Optional[str]:
+    input_name = input_name.strip()
+
+    level = _LEVEL_ALIASES.get(input_name)
+    if level is not None:
+        return level
+
+    # A "Closed " prefix with irregular spacing after it.
+    if input_name.startswith("Closed "):
+        stripped = input_name.removeprefix("Closed ").strip()
+        if stripped in constants.ALL_LEVELS:
+            return stripped
+
+    # Catch near-miss spellings/formatting not covered by an explicit alias
+    # above (e.g. differing case or punctuation).
+    match = _fuzzy_match(input_name, constants.ALL_LEVELS)
+    if match is not None:
+        _count_fuzzy_match("level")
+    return match
+
+
 def convert_style(input_name: str) -> Style:
     """Converts input style from entry spreadsheet into standard naming convention,
     returning a Style.
@@ -48,22 +223,11 @@ def convert_style(input_name: str) -> Style:
     Raises:
         ValueError: if input_name is not a recognized style.
     """
-    standard_style_aliases = (Style.STANDARD, "Ballroom")
-
-    input_name = input_name.strip()
-
-    if input_name in constants.STYLES:
-        return Style(input_name)
-
-    if input_name in standard_style_aliases:
-        return Style.STANDARD
-
-    match = _fuzzy_match(input_name, constants.STYLES)
-    if match is not None:
-        return Style(match)
-
-    raise ValueError(f"""Unrecognized style.
-                     Please add support for '{input_name}' to convert_style in dance.py.""")
+    style = _resolve_style(input_name)
+    if style is None:
+        raise ValueError(f"""Unrecognized style.
+                     Please add support for '{input_name.strip()}' to convert_style in dance.py.""")
+    return style
 
 
 def convert_dance(style: Style, input_name: str) -> str:
@@ -81,63 +245,19 @@ def convert_dance(style: Style, input_name: str) -> str:
         ValueError: if input_name is all caps, indicating a multi-dance (e.g. "WTF").
         ValueError: if input_name is not a recognized dance.
     """
-    west_coast_swing_aliases = (DanceName.WEST_COAST_SWING, "WCS")
-    nightclub_two_step_aliases = (
-        DanceName.NIGHTCLUB_TWO_STEP,
-        "Night Club 2-Step",
-        "Nightclub 2-Step",
-        "NC2S",
-        "NC Two Step",
-    )
-    argentine_tango_aliases = (DanceName.ARGENTINE_TANGO, "Arg. Tango")
-    viennese_waltz_aliases = (DanceName.VIENNESE_WALTZ, "Vie. Waltz", "V. Waltz")
-    # "Swing" is a common organizer shorthand for Rhythm's East Coast Swing -
-    # checked below with a style == RHYTHM guard, since "Swing" alone is too
-    # generic a word to safely alias for every style (e.g. Nightclub also
-    # has "West Coast Swing" and "Country Swing").
-    rhythm_east_coast_swing_aliases = (DanceName.EAST_COAST_SWING, "Swing", "EC Swing")
-
     if style not in constants.STYLES:
         raise ValueError(f"""Unrecognized style.
                          Please add support for '{style}' to convert_dance in dance.py""")
 
-    input_name = input_name.strip()
-
-    if input_name in west_coast_swing_aliases:
-        return DanceName.WEST_COAST_SWING
-
-    if input_name in nightclub_two_step_aliases:
-        return DanceName.NIGHTCLUB_TWO_STEP
-
-    if input_name in argentine_tango_aliases:
-        return DanceName.ARGENTINE_TANGO
-
-    if input_name in viennese_waltz_aliases:
-        return DanceName.VIENNESE_WALTZ
-
-    if style == Style.RHYTHM and input_name in rhythm_east_coast_swing_aliases:
-        return DanceName.EAST_COAST_SWING
-
-    if input_name in constants.DANCE_NAMES[style]:
-        return input_name
-
-    # Longer names are checked first so a more specific name (e.g. "Viennese
-    # Waltz") is matched before a shorter one that happens to be its
-    # substring (e.g. "Waltz").
-    for dance_name in sorted(constants.DANCE_NAMES[style], key=len, reverse=True):
-        if dance_name in input_name:
-            return dance_name
+    dance = _resolve_dance(style, input_name)
+    if dance is not None:
+        return dance
 
+    input_name = input_name.strip()
     if input_name.isupper():
         raise ValueError("""Attempted to construct a Dance from a multi-dance event.
                             Please handle multi-dance events in the entry checker.""")
 
-    # Catch near-miss spellings/formatting not covered by an explicit alias
-    # or substring match above (e.g. "ChaCha" for "Cha Cha").
-    match = _fuzzy_match(input_name, constants.DANCE_NAMES[style])
-    if match is not None:
-        return match
-
     raise ValueError(f"""Unrecognized dance.
                      Please add support for '{style} {input_name}' to convert_dance in dance.py.""")
 
@@ -153,78 +273,110 @@ def convert_level(input_name: str) -> str:
     Raises:
         ValueError: if input_name is not a recognized level.
     """
-    int_adv_level_aliases = (
-        NightclubLevel.INT_ADV,
-        "Intermediate/Advanced",
-        "Advanced",
-        "Intermediate/Adv.",
-        "Int/Adv",
-    )
-    rookie_lead_aliases = (
-        RookieVetLevel.ROOKIE_LEAD,
-        "Rookie Leader",
-        "Rookie Leaders",
-        "RV Rookie Lead",
-        "R/V Rookie Lead",
-    )
-    rookie_follow_aliases = (
-        RookieVetLevel.ROOKIE_FOLLOW,
-        "Rookie Follower",
-        "Rookie Followers",
-        "RV Rookie Follow",
-        "R/V Rookie Follow",
-    )
-    prechamp_aliases = (OpenLevel.PRECHAMP, "Pre-Champ", "PreChamp", "Pre-Championship")
-    champ_aliases = (OpenLevel.CHAMP, "Championship")
-
-    input_name = input_name.strip()
-
-    # Level already matches naming convention; nothing to do here.
-    if input_name in constants.ALL_LEVELS:
-        return input_name
-
-    # Strip a "Closed " prefix (e.g. "Closed Bronze") some organizers use for
-    # syllabus levels.
-    if input_name.startswith("Closed "):
-        stripped = input_name.removeprefix("Closed ").strip()
-        if stripped in constants.ALL_LEVELS:
-            return stripped
-
-    # Nightclub Levels
-    if input_name in int_adv_level_aliases:
-        return NightclubLevel.INT_ADV
-
-    # Rookie-Vet Levels
-    if input_name in rookie_lead_aliases:
-        return RookieVetLevel.ROOKIE_LEAD
+    level = _resolve_level(input_name)
+    if level is None:
+        raise ValueError(f"""Unrecognized level name.
+                     Please add support for '{input_name.strip()}' to convert_level in dance.py.""")
+    return level
 
-    if input_name in rookie_follow_aliases:
-        return RookieVetLevel.ROOKIE_FOLLOW
 
-    # Open Levels
-    if input_name in prechamp_aliases:
-        return OpenLevel.PRECHAMP
-
-    if input_name in champ_aliases:
-        return OpenLevel.CHAMP
+def conversion_stats() -> dict[str, ConversionStats]:
+    """Reports how convert_style()/convert_dance()/convert_level() (keyed
+    "style"/"dance"/"level") have been used so far in this process.
+    """
+    resolvers = {"style": _resolve_style, "dance": _resolve_dance, "level": _resolve_level}
+    with _fuzzy_matches_lock:
+        fuzzy_matches = dict(_fuzzy_matches)
+    stats = {}
+    for kind, resolver in resolvers.items():
+        info = resolver.cache_info()
+        stats[kind] = ConversionStats(info.hits, info.misses, fuzzy_matches[kind])
+    return stats
 
-    # Catch near-miss spellings/formatting not covered by an explicit alias
-    # above (e.g. differing case or punctuation).
-    match = _fuzzy_match(input_name, constants.ALL_LEVELS)
-    if match is not None:
-        return match
 
-    raise ValueError(f"""Unrecognized level name.
-                     Please add support for '{input_name}' to convert_level in dance.py.""")
+@functools.lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
+def _dance_key(level: str, style: str, dance: str) -> tuple[str, Style, str]:
+    """The normalized (level, style, dance) a raw spelling converts to,
+    memoized so a repeated spelling skips the convert_*() calls entirely."""
+    converted_style = convert_style(style)
+    return (convert_level(level), converted_style, convert_dance(converted_style, dance))
 
 
 class Dance:
-    """Represents a dance style at a certain level."""
+    """Represents a dance style at a certain level.
+
+    Dances are interned: constructing one returns the single shared
+    instance for its (level, style, dance), so a competition's thousands of
+    results share a handful of Dance objects and equal dances compare by
+    identity. Instances are therefore immutable.
+
+    Besides its names, a Dance carries its integer coordinates in the
+    points arrays:
+        level_idx: index into constants.LEVELS, or None for a level that
+            isn't points-eligible (Nightclub, Rookie-Vet).
+        style_idx: index into constants.STYLES - for a points-eligible
+            style, also its open points column.
+        dance_idx: index into constants.DANCE_NAMES[style].
+        column: syllabus points column (see constants.SYLLABUS_COLUMNS),
+            or None for a style that isn't points-eligible.
+    """
+
+    __slots__ = (
+        "level",
+        "style",
+        "dance",
+        "level_idx",
+        "style_idx",
+        "dance_idx",
+        "column",
+        "_hash",
+    )
 
-    def __init__(self, level: str, style: str, dance: str):
-        self.level: str = convert_level(level)
-        self.style: Style = convert_style(style)
-        self.dance: str = convert_dance(self.style, dance)
+    # Every Dance ever constructed, by its normalized key - bounded by the
+    # number of valid (level, style, dance) combinations, however many raw
+    # spellings map onto them (those are remembered by the bounded
+    # _dance_key() memo instead). New entries are added under the lock, so
+    # threads constructing the same new Dance at once all get one instance.
+    _interned: dict[tuple[str, Style, str], "Dance"] = {}
+    _intern_lock = threading.Lock()
+
+    level: str
+    style: Style
+    dance: str
+    level_idx: Optional[int]
+    style_idx: int
+    dance_idx: int
+    column: Optional[int]
+
+    def __new__(cls, level: str, style: str, dance: str) -> "Dance":
+        key = _dance_key(level, style, dance)
+        instance = cls._interned.get(key)
+        if instance is not None:
+            return instance
+
+        with cls._intern_lock:
+            instance = cls._interned.get(key)
+            if instance is not None:
+                return instance
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "level", key[0])
+            object.__setattr__(instance, "style", key[1])
+            object.__setattr__(instance, "dance", key[2])
+            object.__setattr__(instance, "level_idx", constants.LEVEL_INDEX.get(key[0]))
+            object.__setattr__(instance, "style_idx", constants.STYLE_INDEX[key[1]])
+            object.__setattr__(instance, "dance_idx", constants.DANCE_INDEX[key[1], key[2]])
+            object.__setattr__(instance, "column", constants.SYLLABUS_COLUMNS.get(key[1:]))
+            object.__setattr__(instance, "_hash", hash(key))
+            cls._interned[key] = instance
+        return instance
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Dance is immutable (tried to set {name!r})")
+
+    def __reduce__(self):
+        # Unpickling/copying goes back through __new__, so the copy is the
+        # interned instance rather than a duplicate.
+        return (Dance, (self.level, self.style, self.dance))
 
     def __repr__(self) -> str:
         designation = ""
@@ -239,9 +391,11 @@ class Dance:
         return (self.level, self.style, self.dance)
 
     def __hash__(self):
-        return hash(self.__key())
+        return self._hash
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Dance):
             return self.__key() == other.__key()
         return False
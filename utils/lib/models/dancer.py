@@ -30,6 +30,15 @@ class Dancer:
         self.cda_id: Optional[int] = dancer_record.cda_id
         self.points: Points = Points(dancer_record.syllabus_pts, dancer_record.open_pts)
         self.entries: set["Entry"] = set()
+        # Indexes over entries, kept in step by add()/drop() so the rule
+        # queries below never scan every entry:
+        # (style, level name) -> number of entries at that level.
+        self._level_counts: dict[tuple[str, str], int] = {}
+        # style -> bitmask of the constants.LEVELS indices entered in it.
+        self._style_level_mask: dict[str, int] = {}
+        # (style, dance) -> {constants.LEVELS index: entry}. An entry's
+        # Dance identifies it, so there's at most one per level.
+        self._dance_entries: dict[tuple[str, str], dict[int, "Entry"]] = {}
 
         self.first_comp_date: datetime.date
         # New Dancers (not yet in database)
@@ -80,10 +89,7 @@ class Dancer:
         """Returns True if the dancer is registered for an event at a
         specific level in the given style; otherwise, False.
         """
-        for e in self.entries:
-            if e.dance_data.style == curr_style and e.dance_data.level == level:
-                return True
-        return False
+        return (curr_style, level) in self._level_counts
 
     def is_registered_newcomer(self, curr_style: Style) -> bool:
         return self._is_registered_at_level(curr_style, SyllabusLevel.NEWCOMER)
@@ -99,11 +105,42 @@ class Dancer:
 
     def add(self, comp_entry: "Entry"):
         """Adds a competition entry for a dancer. Should only be called from a partnership."""
+        if comp_entry in self.entries:
+            return  # an entry for the same dance is already registered
         self.entries.add(comp_entry)
+        dance = comp_entry.dance_data
+        level_key = (dance.style, dance.level)
+        self._level_counts[level_key] = self._level_counts.get(level_key, 0) + 1
+        if dance.level_idx is not None:
+            mask = self._style_level_mask.get(dance.style, 0)
+            self._style_level_mask[dance.style] = mask | (1 << dance.level_idx)
+            by_level = self._dance_entries.setdefault((dance.style, dance.dance), {})
+            by_level[dance.level_idx] = comp_entry
 
     def drop(self, comp_entry: "Entry"):
         """Drops a competition entry for a couple. Should only be called from a partnership"""
         self.entries.remove(comp_entry)
+        dance = comp_entry.dance_data
+        level_key = (dance.style, dance.level)
+        self._level_counts[level_key] -= 1
+        if not self._level_counts[level_key]:
+            del self._level_counts[level_key]
+            if dance.level_idx is not None:
+                self._style_level_mask[dance.style] &= ~(1 << dance.level_idx)
+        if dance.level_idx is not None:
+            by_level = self._dance_entries[dance.style, dance.dance]
+            del by_level[dance.level_idx]
+            if not by_level:
+                del self._dance_entries[dance.style, dance.dance]
+
+    def entered_levels(self, style: Style, dance: Optional[str] = None) -> list[int]:
+        """Returns the constants.LEVELS indices the dancer has entries at in
+        a style - or, given dance, for just that dance - in ascending order.
+        """
+        if dance is not None:
+            return sorted(self._dance_entries.get((style, dance), {}))
+        mask = self._style_level_mask.get(style, 0)
+        return [idx for idx in range(len(constants.LEVELS)) if mask >> idx & 1]
 
     def _has_entry_in_level_range(
         self, style: Style, min_level_idx: int = 0, max_level_idx: Optional[int] = None
@@ -111,17 +148,13 @@ class Dancer:
         """Returns True if the dancer has an entry in a style whose level
         index (see constants.LEVELS) falls within [min_level_idx,
         max_level_idx] inclusive; max_level_idx of None means no upper bound.
+        Entries at a level outside constants.LEVELS (e.g. Rookie-Vet) never
+        count.
         """
-        for comp_entry in self.entries:
-            if comp_entry.dance_data.style != style:
-                continue
-            level_idx = constants.LEVELS.index(comp_entry.dance_data.level)
-            if level_idx < min_level_idx:
-                continue
-            if max_level_idx is not None and level_idx > max_level_idx:
-                continue
-            return True
-        return False
+        mask = self._style_level_mask.get(style, 0) >> min_level_idx
+        if max_level_idx is not None:
+            mask &= (1 << max(max_level_idx - min_level_idx + 1, 0)) - 1
+        return mask != 0
 
     def has_vet_entries(self, style: Style) -> bool:
         """Returns True if the dancer has entries of Silver and above in a
@@ -160,16 +193,8 @@ class Dancer:
         Returns:
             True if a matching entry exists at or above level_idx.
         """
-        for e in self.entries:
-            entry = e.dance_data
-            if (
-                entry.style == style
-                and entry.dance == dance
-                and entry.level in constants.LEVELS
-                and constants.LEVELS.index(entry.level) >= level_idx
-            ):
-                return True
-        return False
+        by_level = self._dance_entries.get((style, dance), {})
+        return any(entry_level >= level_idx for entry_level in by_level)
 
     def has_entry_with_partnership(
         self, style: Style, dance: str, partnership_obj: "Partnership"
@@ -184,16 +209,8 @@ class Dancer:
         Returns:
             True if a matching entry exists with that partnership.
         """
-        for e in self.entries:
-            entry = e.dance_data
-            if (
-                entry.style == style
-                and entry.dance == dance
-                and entry.level in constants.LEVELS
-                and e.partnership is partnership_obj
-            ):
-                return True
-        return False
+        by_level = self._dance_entries.get((style, dance), {})
+        return any(e.partnership is partnership_obj for e in by_level.values())
 
     def get_points(self, target_dance: Dance) -> int:
         """Retrieves the points earned for a given dance at a given level,
@@ -207,19 +224,16 @@ class Dancer:
             ValueError: if target_dance is not eligible for points
                         (e.g. nightclub dances).
         """
-        if target_dance.style not in Style.points_eligible_styles():
+        if target_dance.column is None:
             raise ValueError(f"""'{target_dance}' is not eligible for points
                                  (e.g. nightclub dances).""")
 
-        if target_dance.level in constants.SYLLABUS_LEVELS:
-            row_idx = constants.SYLLABUS_LEVELS.index(target_dance.level)
-            style_offset = constants.SYLLABUS_COLUMN_OFFSETS[target_dance.style]
-            dance_idx = constants.DANCE_NAMES[target_dance.style].index(target_dance.dance)
-            return self.points.syllabus_data[row_idx][style_offset + dance_idx]
-        elif target_dance.level in constants.OPEN_LEVELS:
-            row_idx = constants.OPEN_LEVELS.index(target_dance.level)
-            col_idx = constants.STYLES.index(target_dance.style)
-            return self.points.open_data[row_idx][col_idx]
+        level_idx = target_dance.level_idx
+        num_syllabus = len(constants.SYLLABUS_LEVELS)
+        if level_idx is not None and level_idx < num_syllabus:
+            return self.points.syllabus_data[level_idx][target_dance.column]
+        elif level_idx is not None:
+            return self.points.open_data[level_idx - num_syllabus][target_dance.style_idx]
 
         raise ValueError(
             f"'{target_dance}' has an unrecognized level and is not eligible for points."
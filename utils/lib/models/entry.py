@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 class Entry:
     """Representation of a competition entry."""
 
+    __slots__ = ("dance_data", "event_name", "partnership", "heat")
+
     def __init__(
         self, dance_obj: Dance, partnership_obj: "Partnership", heat: Optional[str] = None
     ):
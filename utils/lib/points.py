@@ -8,6 +8,7 @@ import numpy as np
 
 from utils.lib import constants
 from utils.lib.constants import Style
+from utils.lib.proficiency_table import ProficiencyTable, compute_proficiency_table
 
 
 class Points:
@@ -22,6 +23,10 @@ class Points:
         """
         self.syllabus_data: np.ndarray = syllabus_pts
         self.open_data: np.ndarray = open_pts
+        # Bumped by every add(); memoized proficiency tables remember the
+        # version they were computed at and are recomputed once it moves on.
+        self.version: int = 0
+        self._proficiency_tables: dict[bool, tuple[int, ProficiencyTable]] = {}
 
     def add(self, syllabus_delta: np.ndarray, open_delta: np.ndarray) -> None:
         """Adds per-cell deltas (same shape as syllabus_data/open_data) to
@@ -42,6 +47,30 @@ class Points:
             self.syllabus_data < 0, self.syllabus_data, self.syllabus_data + syllabus_delta
         )
         self.open_data = np.where(self.open_data < 0, self.open_data, self.open_data + open_delta)
+        self.version += 1
+
+    def mark_changed(self) -> None:
+        """Bumps version after syllabus_data/open_data were modified in
+        place by their owner (e.g. PointsLedger.apply()), so memoized
+        proficiency tables are recomputed."""
+        self.version += 1
+
+    def proficiency_table(self, is_newcomer: bool) -> ProficiencyTable:
+        """Returns the proficiency table for these points (see
+        ProficiencyCalculator.compute_proficiency_table()), memoized until
+        the next add().
+
+        Args:
+            is_newcomer: Whether the owning dancer is a newcomer (see
+                Dancer.is_newcomer()). Cached separately since it changes
+                the table's floor.
+        """
+        cached = self._proficiency_tables.get(is_newcomer)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        table = compute_proficiency_table(self.syllabus_data, self.open_data, is_newcomer)
+        self._proficiency_tables[is_newcomer] = (self.version, table)
+        return table
 
     def _syllabus_columns(self, style: Style) -> np.ndarray:
         """Returns this style's syllabus point columns, using the same
@@ -54,7 +83,7 @@ class Points:
 
     def _open_column(self, style: Style) -> np.ndarray:
         """Returns this style's single open-points column."""
-        idx = constants.STYLES.index(style)
+        idx = constants.STYLE_INDEX[style]
         return self.open_data[:, idx : idx + 1]
 
     def __repr__(self) -> str:
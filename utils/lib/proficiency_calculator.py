@@ -3,6 +3,12 @@
 Provides a stateless calculator for determining a dancer's proficiency
 level for a given dance, following CDA's rules including point-out
 detection, within-style, and cross-style proficiency.
+
+compute_proficiency_level() applies those rules one dance at a time and is
+the reference statement of them; compute_proficiency_table() applies the
+same rules to every dance at once with NumPy, for callers that need a
+dancer's proficiency in several dances (every dance of a multi-dance
+event, every dance of a style, or every result of a competition).
 """
 
 from typing import Optional
@@ -11,6 +17,7 @@ from utils.lib import constants
 from utils.lib.constants import Style
 from utils.lib.models.dance import Dance
 from utils.lib.models.dancer import Dancer
+from utils.lib.proficiency_table import ProficiencyTable
 
 
 class ProficiencyCalculator:
@@ -126,6 +133,25 @@ class ProficiencyCalculator:
 
         return max(newcomer_level, point_out_level, within_style_level, cross_style_level)
 
+    @staticmethod
+    def compute_proficiency_table(dancer: Dancer) -> ProficiencyTable:
+        """Returns a dancer's proficiency level in every points-eligible
+        dance at once - for each dance, exactly what
+        compute_proficiency_level() returns, computed from the points
+        arrays in one vectorized pass instead of dance by dance (see
+        utils.lib.proficiency_table).
+
+        Memoized on the dancer's Points until their next Points.add(), so
+        scoring every result a dancer appears in at one competition
+        computes the table once.
+
+        Args:
+            dancer: A Dancer object.
+        Returns:
+            A ProficiencyTable covering every points-eligible dance.
+        """
+        return dancer.points.proficiency_table(dancer.is_newcomer())
+
     @staticmethod
     def compute_split_level_combined_level(lead_level: int, follow_level: int) -> Optional[int]:
         """Returns the Split-Level Exception's combined level index if a
@@ -0,0 +1,134 @@
+"""Vectorized proficiency levels for every points-eligible dance at once.
+
+Applies ProficiencyCalculator.compute_proficiency_level()'s rules - point-out
+depth, within-style, paired cross-style, any-other-style and newcomer
+floors - to all 19 (style, dance) columns of a dancer's points in one pass.
+Kept free of the Dancer model so Points can memoize the result itself (see
+Points.proficiency_table()).
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from utils.lib import constants
+from utils.lib.constants import Style
+
+# The table's layout is the syllabus points' column layout: one column per
+# points-eligible (style, dance), Standard -> Smooth -> Latin -> Rhythm.
+_TABLE_STYLES: list[Style] = Style.points_eligible_styles()
+_TABLE_COLUMNS: list[tuple[Style, str]] = [
+    (style, dance_name) for style in _TABLE_STYLES for dance_name in constants.DANCE_NAMES[style]
+]
+_COLUMN_INDEX: dict[tuple[str, str], int] = constants.SYLLABUS_COLUMNS
+# Each column's style, as an index into _TABLE_STYLES - also its column in
+# the open points array, which lays styles out in the same order.
+_COLUMN_STYLE = np.array([constants.STYLE_INDEX[style] for style, _ in _TABLE_COLUMNS])
+# [c, c2]: c2 is a different dance in the same style as c (within-style rule).
+_SAME_STYLE_OTHER_DANCE = (_COLUMN_STYLE[:, None] == _COLUMN_STYLE[None, :]) & ~np.eye(
+    len(_TABLE_COLUMNS), dtype=bool
+)
+# [c]: the column of c's paired dance in the counterpart style, or -1 if it
+# has none (cross-style paired-dance rule).
+_PAIRED_COLUMN = np.array(
+    [
+        _COLUMN_INDEX.get(
+            (constants.CROSS_STYLE[style], constants.CROSS_STYLE_DANCE_PAIRS.get(dance_name, "")),
+            -1,
+        )
+        for style, dance_name in _TABLE_COLUMNS
+    ]
+)
+# [c, s]: style s isn't c's own style (any-other-style rule).
+_OTHER_STYLE = _COLUMN_STYLE[:, None] != np.arange(len(_TABLE_STYLES))[None, :]
+
+
+class ProficiencyTable:
+    """A dancer's proficiency level in every points-eligible dance, as
+    computed by ProficiencyCalculator.compute_proficiency_table().
+
+    Attributes:
+        levels: Read-only int array of proficiency level indices (see
+            constants.LEVELS), one per syllabus points column - i.e. laid
+            out like one row of Points.syllabus_data.
+    """
+
+    def __init__(self, levels: np.ndarray):
+        levels.flags.writeable = False
+        self.levels = levels
+
+    def level(self, style: Style, dance_name: str) -> int:
+        """Returns the dancer's proficiency level index for one dance -
+        the same value compute_proficiency_level() returns for it.
+
+        Raises:
+            ValueError: if style is not eligible for points.
+        """
+        column = _COLUMN_INDEX.get((style, dance_name))
+        if column is None:
+            if style not in _TABLE_STYLES:
+                raise ValueError(f"'{style}' is not eligible for points (e.g. nightclub dances).")
+            raise ValueError(f"'{dance_name}' is not a {style} dance.")
+        return int(self.levels[column])
+
+    def max_level(self, style: Style, dance_names: Iterable[str]) -> int:
+        """Returns the highest proficiency level index across several dances
+        of one style - a multi-dance event's combo-wide proficiency."""
+        return max(self.level(style, dance_name) for dance_name in dance_names)
+
+
+def compute_proficiency_table(
+    syllabus_pts: np.ndarray, open_pts: np.ndarray, is_newcomer: bool
+) -> ProficiencyTable:
+    """Returns the proficiency level in every points-eligible dance for a
+    dancer with these points - see
+    ProficiencyCalculator.compute_proficiency_table().
+
+    Args:
+        syllabus_pts: 4x19 syllabus points (see Points.syllabus_data).
+        open_pts: 3x4 open points (see Points.open_data).
+        is_newcomer: Whether the dancer is a newcomer (see
+            Dancer.is_newcomer()), which lowers the floor to Newcomer.
+    """
+    return ProficiencyTable(
+        compute_proficiency_levels(syllabus_pts, open_pts, np.asarray(is_newcomer))
+    )
+
+
+def compute_proficiency_levels(
+    syllabus_pts: np.ndarray, open_pts: np.ndarray, is_newcomer: np.ndarray
+) -> np.ndarray:
+    """compute_proficiency_table()'s levels for many dancers at once.
+
+    Args:
+        syllabus_pts: ...x4x19 syllabus points, any leading batch shape.
+        open_pts: ...x3x4 open points, same leading shape.
+        is_newcomer: Bool array of that leading shape.
+    Returns:
+        An ...x19 int array of proficiency level indices.
+    """
+    open_by_column = open_pts[..., _COLUMN_STYLE]
+    # [..., level, column]: pointed out of that dance at that level - same
+    # rule as has_pointed_out().
+    points = np.concatenate([syllabus_pts, open_by_column], axis=-2)
+    pointed_out = (points < 0) | (points >= 7)
+    # Consecutive levels pointed out of, from the bottom - the
+    # compute_point_out_level() of every column.
+    point_out = np.cumprod(pointed_out, axis=-2).sum(axis=-2)
+
+    within_style = np.where(_SAME_STYLE_OTHER_DANCE, point_out[..., None, :], 0).max(axis=-1) - 2
+    paired = np.where(_PAIRED_COLUMN >= 0, point_out[..., _PAIRED_COLUMN] - 2, 0)
+    style_max = np.stack(
+        [
+            point_out[..., _COLUMN_STYLE == style_idx].max(axis=-1)
+            for style_idx in range(len(_TABLE_STYLES))
+        ],
+        axis=-1,
+    )
+    any_other_style = np.where(_OTHER_STYLE, style_max[..., None, :], 0).max(axis=-1) - 4
+
+    newcomer_level = np.where(is_newcomer, 0, 1)[..., None]
+    levels = point_out
+    for floor in (within_style, paired, any_other_style, newcomer_level):
+        levels = np.maximum(levels, floor)
+    return levels
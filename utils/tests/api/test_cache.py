@@ -0,0 +1,159 @@
+"""Tests for utils.lib.api.cache module."""
+
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from utils.lib.api.cache import DancerRecordCache
+from utils.lib.api.client import DancerLookupError, DancerRecord
+
+
+class _FakeLookup:
+    """Counts calls and returns a record with a recognizable point value."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, first: str, last: str) -> DancerRecord:
+        self.calls.append((first, last))
+        syllabus_pts = np.zeros((4, 19), dtype=int)
+        syllabus_pts[1][5] = len(self.calls)
+        return DancerRecord(
+            cda_id=42,
+            first=first,
+            last=last,
+            first_comp_date=datetime.date(2020, 1, 15),
+            created_date="2020-01-15T00:00:00-08:00",
+            syllabus_pts=syllabus_pts,
+            open_pts=np.ones((3, 4), dtype=int),
+        )
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDancerRecordCache(unittest.TestCase):
+    """Tests for DancerRecordCache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "nested" / "dancers.sqlite3"
+        self.lookup = _FakeLookup()
+        self.clock = _FakeClock()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _make_cache(self, **kwargs) -> DancerRecordCache:
+        cache = DancerRecordCache(self.path, lookup=self.lookup, clock=self.clock, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_second_lookup_is_a_hit(self):
+        cache = self._make_cache()
+
+        first = cache("Priya", "Patel")
+        second = cache("Priya", "Patel")
+
+        self.assertEqual(len(self.lookup.calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second.cda_id, first.cda_id)
+        self.assertEqual(second.first_comp_date, datetime.date(2020, 1, 15))
+        self.assertTrue(np.array_equal(second.syllabus_pts, first.syllabus_pts))
+        self.assertTrue(np.array_equal(second.open_pts, first.open_pts))
+
+    def test_persists_across_instances(self):
+        self._make_cache()("Priya", "Patel")
+
+        cache = self._make_cache()
+        cache("Priya", "Patel")
+
+        self.assertEqual(len(self.lookup.calls), 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_key_is_case_and_whitespace_insensitive(self):
+        cache = self._make_cache()
+
+        cache("Mary Ann", "Smith")
+        cache(" mary  ann", "SMITH ")
+
+        self.assertEqual(len(self.lookup.calls), 1)
+
+    def test_expired_entry_is_refetched(self):
+        cache = self._make_cache(ttl_seconds=60)
+        cache("Priya", "Patel")
+
+        self.clock.now += 61
+        record = cache("Priya", "Patel")
+
+        self.assertEqual(len(self.lookup.calls), 2)
+        self.assertEqual(record.syllabus_pts[1][5], 2)  # the fresh record, not the stale one
+
+    def test_refresh_bypasses_cache_but_still_writes(self):
+        self._make_cache()("Priya", "Patel")
+
+        self._make_cache(refresh=True)("Priya", "Patel")
+        record = self._make_cache()("Priya", "Patel")
+
+        self.assertEqual(len(self.lookup.calls), 2)
+        self.assertEqual(record.syllabus_pts[1][5], 2)
+
+    def test_invalidate_drops_one_dancer(self):
+        cache = self._make_cache()
+        cache("Priya", "Patel")
+        cache("Alex", "Rivera")
+
+        cache.invalidate("Priya", "Patel")
+        cache("Priya", "Patel")
+        cache("Alex", "Rivera")
+
+        self.assertEqual(self.lookup.calls.count(("Priya", "Patel")), 2)
+        self.assertEqual(self.lookup.calls.count(("Alex", "Rivera")), 1)
+
+    def test_not_found_record_round_trips(self):
+        def not_found(first, last):
+            return DancerRecord(
+                cda_id=None,
+                first=first,
+                last=last,
+                first_comp_date=None,
+                created_date="2026-01-01T00:00:00-08:00",
+                syllabus_pts=np.zeros((4, 19), dtype=int),
+                open_pts=np.zeros((3, 4), dtype=int),
+            )
+
+        cache = DancerRecordCache(self.path, lookup=not_found, clock=self.clock)
+        self.addCleanup(cache.close)
+        cache("New", "Comer")
+        record = cache("New", "Comer")
+
+        self.assertEqual(cache.hits, 1)
+        self.assertIsNone(record.cda_id)
+        self.assertIsNone(record.first_comp_date)
+
+    def test_failed_lookup_is_not_cached(self):
+        def failing(first, last):
+            raise DancerLookupError("boom")
+
+        cache = DancerRecordCache(self.path, lookup=failing, clock=self.clock)
+        self.addCleanup(cache.close)
+
+        with self.assertRaises(DancerLookupError):
+            cache("Alex", "Rivera")
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_rejects_negative_ttl(self):
+        with self.assertRaises(ValueError):
+            self._make_cache(ttl_seconds=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
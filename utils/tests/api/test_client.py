@@ -4,13 +4,14 @@ import unittest
 from unittest.mock import patch, MagicMock
 import requests
 
-from utils.lib.api.client import lookup_dancer, DancerLookupError
+from utils.lib.api.client import DancerLookupClient, lookup_dancer, DancerLookupError
 
 
-def _mock_response(json_data, status_ok=True):
+def _mock_response(json_data, status_ok=True, status_code=None):
     """Build a MagicMock standing in for a requests.Response."""
     response = MagicMock()
     response.json.return_value = json_data
+    response.status_code = status_code if status_code is not None else (200 if status_ok else 500)
     if status_ok:
         response.raise_for_status.return_value = None
     else:
@@ -18,6 +19,40 @@ def _mock_response(json_data, status_ok=True):
     return response
 
 
+def _found_json(first, last):
+    return {
+        "success": True,
+        "competitor": {
+            "cdaId": 42,
+            "firstName": first,
+            "lastName": last,
+            "firstCompetitionDate": "2020-01-15",
+            "dateCreated": "2020-01-15T00:00:00-08:00",
+            "fairlevelPoints": False,
+        },
+    }
+
+
+class _FakeSession:
+    """Records every get() call, returning (or raising) canned outcomes in
+    order - or, with no canned outcomes, a found record for whoever was
+    asked for."""
+
+    def __init__(self, outcomes=None):
+        self._outcomes = list(outcomes) if outcomes is not None else None
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs["params"])
+        if self._outcomes is None:
+            params = kwargs["params"]
+            return _mock_response(_found_json(params["firstName"], params["lastName"]))
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
 class TestLookupDancer(unittest.TestCase):
     """Tests for lookup_dancer()."""
 
@@ -85,5 +120,81 @@ class TestLookupDancer(unittest.TestCase):
             lookup_dancer("Alex", "Rivera")
 
 
+class TestDancerLookupClient(unittest.TestCase):
+    """Tests for DancerLookupClient."""
+
+    def setUp(self):
+        self.sleeps = []
+
+    def _make_client(self, session, **kwargs):
+        return DancerLookupClient(session=session, sleep=self.sleeps.append, **kwargs)
+
+    def test_lookup_parses_record_and_is_callable(self):
+        client = self._make_client(_FakeSession())
+
+        record = client("Priya", "Patel")
+
+        self.assertEqual(record.cda_id, 42)
+        self.assertEqual(record.first, "Priya")
+
+    def test_retries_retryable_status_with_backoff(self):
+        session = _FakeSession(
+            [
+                _mock_response({}, status_ok=False, status_code=503),
+                _mock_response({}, status_ok=False, status_code=429),
+                _mock_response(_found_json("Priya", "Patel")),
+            ]
+        )
+        client = self._make_client(session, backoff_base_seconds=1.0)
+
+        record = client.lookup("Priya", "Patel")
+
+        self.assertEqual(record.cda_id, 42)
+        self.assertEqual(self.sleeps, [1.0, 2.0])
+
+    def test_retries_connection_errors(self):
+        session = _FakeSession(
+            [
+                requests.exceptions.ConnectionError("reset"),
+                _mock_response(_found_json("Priya", "Patel")),
+            ]
+        )
+        client = self._make_client(session)
+
+        self.assertEqual(client.lookup("Priya", "Patel").cda_id, 42)
+        self.assertEqual(len(session.calls), 2)
+
+    def test_gives_up_after_max_retries(self):
+        session = _FakeSession([requests.exceptions.Timeout("slow")] * 3)
+        client = self._make_client(session, max_retries=2)
+
+        with self.assertRaises(DancerLookupError):
+            client.lookup("Alex", "Rivera")
+        self.assertEqual(len(session.calls), 3)
+
+    def test_non_retryable_status_fails_immediately(self):
+        session = _FakeSession([_mock_response({}, status_ok=False, status_code=401)])
+        client = self._make_client(session)
+
+        with self.assertRaises(DancerLookupError):
+            client.lookup("Alex", "Rivera")
+        self.assertEqual(self.sleeps, [])
+
+    def test_lookup_many_dedupes_and_returns_every_name(self):
+        session = _FakeSession()
+        client = self._make_client(session, max_connections=2)
+
+        records = client.lookup_many(
+            [("Priya", "Patel"), ("Alex", "Rivera"), ("Priya", "Patel"), ("Sam", "Lee")]
+        )
+
+        self.assertEqual(set(records), {("Priya", "Patel"), ("Alex", "Rivera"), ("Sam", "Lee")})
+        self.assertEqual(records[("Alex", "Rivera")].last, "Rivera")
+        self.assertEqual(len(session.calls), 3)
+
+    def test_lookup_many_empty(self):
+        self.assertEqual(self._make_client(_FakeSession()).lookup_many([]), {})
+
+
 if __name__ == "__main__":
     unittest.main()
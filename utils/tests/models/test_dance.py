@@ -1,7 +1,19 @@
 """Dance tests are in test_constants.py (Dance class tested via conversion functions)."""
 
+import copy
+import pickle
+import threading
 import unittest
-from utils.lib.models.dance import Dance, convert_dance, convert_level, convert_style
+from concurrent.futures import ThreadPoolExecutor
+from utils.lib import constants
+from utils.lib.models import dance
+from utils.lib.models.dance import (
+    Dance,
+    conversion_stats,
+    convert_dance,
+    convert_level,
+    convert_style,
+)
 
 
 class TestDance(unittest.TestCase):
@@ -48,6 +60,61 @@ class TestDance(unittest.TestCase):
         d2 = Dance("Bronze", "Smooth", "Waltz")
         self.assertEqual(hash(d1), hash(d2))
 
+    def test_equal_dances_are_one_interned_instance(self):
+        d1 = Dance("Pre-Champ", "Ballroom", "Vie. Waltz")
+        d2 = Dance("Prechamp", "Standard", "Viennese Waltz")
+        self.assertIs(d1, d2)
+        self.assertIs(copy.deepcopy(d1), d1)
+        self.assertIs(pickle.loads(pickle.dumps(d1)), d1)
+
+    def test_concurrent_construction_interns_one_instance(self):
+        # A Dance nothing has constructed yet, so every thread races to
+        # create it.
+        key = next(
+            (level, style, name)
+            for style in constants.Style
+            for name in constants.DANCE_NAMES[style]
+            for level in constants.ALL_LEVELS
+            if (level, style, name) not in Dance._interned
+        )
+        start = threading.Barrier(8, timeout=5)
+
+        def construct(_):
+            start.wait()
+            return Dance(*key)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(construct, range(8)))
+
+        self.assertTrue(all(instance is Dance._interned[key] for instance in instances))
+
+    def test_raw_spelling_memo_is_bounded(self):
+        for padding in range(dance._CONVERSION_CACHE_SIZE + 10):
+            Dance("Bronze" + " " * padding, "Smooth", "Waltz")
+        info = dance._dance_key.cache_info()
+        self.assertEqual(info.maxsize, dance._CONVERSION_CACHE_SIZE)
+        self.assertLessEqual(info.currsize, dance._CONVERSION_CACHE_SIZE)
+
+    def test_is_immutable_and_slotted(self):
+        d = Dance("Bronze", "Smooth", "Waltz")
+        with self.assertRaises(AttributeError):
+            d.level = "Silver"
+        self.assertFalse(hasattr(d, "__dict__"))
+
+    def test_integer_coordinates(self):
+        d = Dance("Novice", "Latin", "Rumba")
+        self.assertEqual(d.level_idx, 4)
+        self.assertEqual(d.style_idx, 2)
+        self.assertEqual(d.dance_idx, 2)
+        self.assertEqual(d.column, 11)
+
+    def test_integer_coordinates_outside_points_layout(self):
+        d = Dance("Beginner", "Nightclub", "Salsa")
+        self.assertIsNone(d.level_idx)
+        self.assertIsNone(d.column)
+        self.assertEqual(d.style_idx, 4)
+        self.assertEqual(d.dance_idx, 5)
+
     def test_convert_level_newcomer(self):
         self.assertEqual(convert_level("Newcomer"), "Newcomer")
 
@@ -159,5 +226,53 @@ class TestDance(unittest.TestCase):
             convert_dance("Latin", "Paso")
 
 
+class TestConversionMemo(unittest.TestCase):
+    """Tests for the convert_*() functions' memo and fuzzy-match counters."""
+
+    def test_alias_tables_never_shadow_a_canonical_name(self):
+        for level in constants.ALL_LEVELS:
+            self.assertEqual(convert_level(level), level)
+        for style in constants.STYLES:
+            for name in constants.DANCE_NAMES[style]:
+                self.assertEqual(convert_dance(style, name), name)
+
+    def test_repeated_spelling_is_a_memo_hit(self):
+        convert_level("Pre-Championship")
+        before = conversion_stats()["level"]
+        convert_level("Pre-Championship")
+        after = conversion_stats()["level"]
+        self.assertEqual(after.hits, before.hits + 1)
+        self.assertEqual(after.misses, before.misses)
+
+    def test_unrecognized_spelling_is_remembered_and_still_raises(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                convert_level("Heat 12 Waltz")
+        self.assertIsNone(dance._resolve_level("Heat 12 Waltz"))
+
+    def test_multi_dance_code_still_raises_after_memoizing(self):
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, "multi-dance"):
+                convert_dance("Standard", "WTF")
+
+    def test_fuzzy_match_counts_are_exact_across_threads(self):
+        before = conversion_stats()["level"].fuzzy_matches
+
+        def count(_):
+            for _ in range(1000):
+                dance._count_fuzzy_match("level")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(count, range(8)))
+
+        self.assertEqual(conversion_stats()["level"].fuzzy_matches, before + 8000)
+
+    def test_fuzzy_matches_counted_once_per_spelling(self):
+        before = conversion_stats()["dance"].fuzzy_matches
+        self.assertEqual(convert_dance("Latin", "Chacha Cha"), "Cha Cha")
+        self.assertEqual(convert_dance("Latin", "Chacha Cha"), "Cha Cha")
+        self.assertEqual(conversion_stats()["dance"].fuzzy_matches, before + 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -100,5 +100,72 @@ class TestDancerEntryChecks(unittest.TestCase):
         )
 
 
+class TestDancerEntryIndexes(unittest.TestCase):
+    """Tests that add()/drop() keep the entry-query indexes in step with
+    entries."""
+
+    _make_dancer = TestDancerEntryChecks._make_dancer
+
+    def setUp(self):
+        self.dancer = self._make_dancer("Test", "Dancer")
+        self.partnership = Partnership(self.dancer, self._make_dancer("Other", "Partner"))
+
+    def test_drop_clears_every_query(self):
+        entry = Entry(Dance("Silver", "Smooth", "Waltz"), self.partnership)
+
+        self.partnership.drop(entry)
+
+        self.assertEqual(self.dancer.entries, set())
+        self.assertFalse(self.dancer.has_entry_above("Smooth", "Waltz", 0))
+        self.assertFalse(
+            self.dancer.has_entry_with_partnership("Smooth", "Waltz", self.partnership)
+        )
+        self.assertFalse(self.dancer.has_vet_entries("Smooth"))
+        self.assertFalse(self.dancer._is_registered_at_level("Smooth", "Silver"))
+
+    def test_style_level_kept_while_another_dance_remains(self):
+        waltz = Entry(Dance("Bronze", "Smooth", "Waltz"), self.partnership)
+        Entry(Dance("Bronze", "Smooth", "Tango"), self.partnership)
+
+        self.partnership.drop(waltz)
+
+        self.assertTrue(self.dancer.is_registered_bronze("Smooth"))
+        self.assertTrue(self.dancer.has_rookie_entries("Smooth"))
+        self.assertFalse(self.dancer.has_entry_above("Smooth", "Waltz", 0))
+
+    def test_duplicate_dance_keeps_first_partnership(self):
+        dance = Dance("Bronze", "Smooth", "Waltz")
+        Entry(dance, self.partnership)
+        second = Partnership(self.dancer, self._make_dancer("Third", "Partner"))
+        Entry(dance, second)
+
+        self.assertEqual(len(self.dancer.entries), 1)
+        self.assertTrue(self.dancer.has_entry_with_partnership("Smooth", "Waltz", self.partnership))
+        self.assertFalse(self.dancer.has_entry_with_partnership("Smooth", "Waltz", second))
+
+    def test_level_range_queries(self):
+        Entry(Dance("Newcomer", "Latin", "Rumba"), self.partnership)
+        Entry(Dance("Novice", "Latin", "Jive"), self.partnership)
+        Entry(Dance("Rookie Lead", "Rhythm", "Rumba"), self.partnership)
+
+        self.assertTrue(self.dancer.has_vet_entries("Latin"))
+        self.assertTrue(self.dancer.has_rookie_entries("Latin"))
+        self.assertFalse(self.dancer._has_entry_in_level_range("Latin", 1, 3))
+        self.assertTrue(self.dancer.is_registered_newcomer("Latin"))
+        self.assertFalse(self.dancer.has_rookie_entries("Rhythm"))
+        self.assertTrue(self.dancer._is_registered_at_level("Rhythm", "Rookie Lead"))
+
+    def test_entered_levels(self):
+        Entry(Dance("Gold", "Latin", "Rumba"), self.partnership)
+        Entry(Dance("Newcomer", "Latin", "Rumba"), self.partnership)
+        Entry(Dance("Silver", "Latin", "Jive"), self.partnership)
+        Entry(Dance("Beginner", "Nightclub", "Salsa"), self.partnership)
+
+        self.assertEqual(self.dancer.entered_levels("Latin"), [0, 2, 3])
+        self.assertEqual(self.dancer.entered_levels("Latin", "Rumba"), [0, 3])
+        self.assertEqual(self.dancer.entered_levels("Latin", "Cha Cha"), [])
+        self.assertEqual(self.dancer.entered_levels("Nightclub"), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -17,6 +17,13 @@ from utils.lib.constants import (
     ALL_LEVELS,
     DANCE_NAMES,
     ABBREVIATION_MAPS,
+    STYLE_INDEX,
+    LEVEL_INDEX,
+    SYLLABUS_LEVEL_INDEX,
+    OPEN_LEVEL_INDEX,
+    DANCE_INDEX,
+    SYLLABUS_COLUMN_OFFSETS,
+    SYLLABUS_COLUMNS,
 )
 
 
@@ -164,6 +171,33 @@ class TestDanceNames(unittest.TestCase):
             self.assertIn(style, DANCE_NAMES)
 
 
+class TestIndexes(unittest.TestCase):
+    """Tests for the precomputed integer indexes."""
+
+    def test_indexes_match_list_positions(self):
+        for index, names in (
+            (STYLE_INDEX, STYLES),
+            (LEVEL_INDEX, LEVELS),
+            (SYLLABUS_LEVEL_INDEX, SYLLABUS_LEVELS),
+            (OPEN_LEVEL_INDEX, OPEN_LEVELS),
+        ):
+            self.assertEqual(index, {name: names.index(name) for name in names})
+
+    def test_dance_index(self):
+        for style, dance_names in DANCE_NAMES.items():
+            for dance_name in dance_names:
+                self.assertEqual(DANCE_INDEX[style, dance_name], dance_names.index(dance_name))
+
+    def test_syllabus_columns_cover_all_19_columns_in_order(self):
+        self.assertEqual(sorted(SYLLABUS_COLUMNS.values()), list(range(19)))
+        self.assertEqual(SYLLABUS_COLUMNS["Standard", "Waltz"], 0)
+        self.assertEqual(
+            SYLLABUS_COLUMNS["Smooth", "Foxtrot"], SYLLABUS_COLUMN_OFFSETS["Smooth"] + 2
+        )
+        self.assertEqual(SYLLABUS_COLUMNS["Rhythm", "Mambo"], 18)
+        self.assertNotIn(("Nightclub", "Salsa"), SYLLABUS_COLUMNS)
+
+
 class TestAbbreviationMaps(unittest.TestCase):
     """Tests for the ABBREVIATION_MAPS dictionary."""
 
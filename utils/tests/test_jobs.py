@@ -0,0 +1,172 @@
+"""Tests for utils.lib.jobs module."""
+
+import json
+import threading
+import unittest
+
+from utils.lib.jobs import (
+    DONE,
+    FAILED,
+    RUNNING,
+    JobFailed,
+    JobManager,
+    fingerprint,
+    job_events,
+)
+
+_TIMEOUT = 5
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestJobManager(unittest.TestCase):
+    """Tests for JobManager."""
+
+    def setUp(self):
+        self.clock = _FakeClock()
+        self.manager = JobManager(result_ttl_seconds=60, clock=self.clock)
+        self.addCleanup(self.manager.shutdown)
+
+    def test_job_runs_in_background_and_reports_progress(self):
+        release = threading.Event()
+
+        def task(progress):
+            progress("fetch", "1/2")
+            release.wait(_TIMEOUT)
+            return "report"
+
+        job = self.manager.submit("fp", task, params={"name": "Test"})
+        running = self.manager.wait_for_change(job.id, job.version, timeout=_TIMEOUT)
+        while running.phase != "fetch":
+            running = self.manager.wait_for_change(job.id, running.version, timeout=_TIMEOUT)
+        self.assertEqual(running.status, RUNNING)
+        self.assertEqual(running.detail, "1/2")
+
+        release.set()
+        finished = self.manager.wait(job.id, timeout=_TIMEOUT)
+        self.assertEqual(finished.status, DONE)
+        self.assertEqual(finished.result, "report")
+        self.assertEqual(finished.params, {"name": "Test"})
+
+    def test_job_failed_keeps_message(self):
+        def task(progress):
+            raise JobFailed("Bad link")
+
+        job = self.manager.submit("fp", task)
+        finished = self.manager.wait(job.id, timeout=_TIMEOUT)
+        self.assertEqual(finished.status, FAILED)
+        self.assertEqual(finished.error, "Bad link")
+
+    def test_unexpected_error_fails_job(self):
+        def task(progress):
+            raise KeyError("boom")
+
+        job = self.manager.submit("fp", task)
+        finished = self.manager.wait(job.id, timeout=_TIMEOUT)
+        self.assertEqual(finished.status, FAILED)
+        self.assertIn("boom", finished.error)
+
+    def test_same_fingerprint_reuses_finished_job_until_ttl(self):
+        calls = []
+
+        def task(progress):
+            calls.append(1)
+            return len(calls)
+
+        first = self.manager.submit("fp", task)
+        self.manager.wait(first.id, timeout=_TIMEOUT)
+        self.assertEqual(self.manager.submit("fp", task).id, first.id)
+
+        self.clock.now += 60
+        second = self.manager.submit("fp", task)
+        self.assertNotEqual(second.id, first.id)
+        self.assertEqual(self.manager.wait(second.id, timeout=_TIMEOUT).result, 2)
+
+    def test_failed_job_not_reused(self):
+        def task(progress):
+            raise JobFailed("Try again")
+
+        first = self.manager.submit("fp", task)
+        self.manager.wait(first.id, timeout=_TIMEOUT)
+        self.assertNotEqual(self.manager.submit("fp", task).id, first.id)
+
+    def test_oldest_finished_jobs_dropped(self):
+        manager = JobManager(max_finished_jobs=2, clock=self.clock)
+        self.addCleanup(manager.shutdown)
+        ids = []
+        for i in range(3):
+            self.clock.now += 1
+            job = manager.submit(f"fp{i}", lambda progress: None)
+            manager.wait(job.id, timeout=_TIMEOUT)
+            ids.append(job.id)
+
+        self.assertIsNone(manager.get(ids[0]))
+        self.assertIsNotNone(manager.get(ids[2]))
+
+    def test_unknown_job(self):
+        self.assertIsNone(self.manager.get("missing"))
+        self.assertIsNone(self.manager.wait("missing", timeout=0))
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            JobManager(max_workers=0)
+        with self.assertRaises(ValueError):
+            JobManager(max_finished_jobs=0)
+
+
+class TestFingerprint(unittest.TestCase):
+    """Tests for fingerprint()."""
+
+    def test_stable_across_key_order(self):
+        self.assertEqual(fingerprint({"a": 1, "b": [2]}), fingerprint({"b": [2], "a": 1}))
+
+    def test_differs_by_value(self):
+        self.assertNotEqual(fingerprint({"a": 1}), fingerprint({"a": 2}))
+
+
+class TestJobEvents(unittest.TestCase):
+    """Tests for job_events()."""
+
+    def test_streams_until_finished(self):
+        manager = JobManager()
+        self.addCleanup(manager.shutdown)
+
+        def task(progress):
+            progress("fetch")
+            progress("render")
+            return None
+
+        job = manager.submit("fp", task)
+        events = list(job_events(manager, job.id, lambda j: {"status": j.status}))
+
+        for event in events:
+            self.assertTrue(event.startswith("data: ") and event.endswith("\n\n"))
+        statuses = [json.loads(event[len("data: ") :])["status"] for event in events]
+        self.assertEqual(statuses[-1], DONE)
+
+    def test_heartbeat_while_idle(self):
+        manager = JobManager()
+        self.addCleanup(manager.shutdown)
+        release = threading.Event()
+        job = manager.submit("fp", lambda progress: release.wait(_TIMEOUT))
+        manager.wait_for_change(job.id, 0, timeout=_TIMEOUT)  # running
+
+        stream = job_events(manager, job.id, lambda j: {}, heartbeat_seconds=0.01)
+        self.assertTrue(next(stream).startswith("data: "))
+        self.assertEqual(next(stream), ": keep-alive\n\n")
+        release.set()
+
+    def test_unknown_job_ends_immediately(self):
+        manager = JobManager()
+        self.addCleanup(manager.shutdown)
+        self.assertEqual(list(job_events(manager, "missing", lambda j: {})), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
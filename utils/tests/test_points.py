@@ -161,6 +161,18 @@ class TestPoints(unittest.TestCase):
         self.assertTrue(np.array_equal(syllabus_delta, syllabus_delta_snapshot))
         self.assertTrue(np.array_equal(open_delta, open_delta_snapshot))
 
+    def test_add_bumps_version(self):
+        self.assertEqual(self.points.version, 0)
+        self.points.add(np.zeros((4, 19), dtype=int), np.zeros((3, 4), dtype=int))
+        self.assertEqual(self.points.version, 1)
+
+    def test_proficiency_table_cached_per_newcomer_flag(self):
+        table = self.points.proficiency_table(is_newcomer=False)
+
+        self.assertIs(self.points.proficiency_table(is_newcomer=False), table)
+        self.assertEqual(self.points.proficiency_table(is_newcomer=True).levels[0], 0)
+        self.assertEqual(table.levels[0], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
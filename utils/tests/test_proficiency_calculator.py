@@ -242,5 +242,122 @@ class TestProficiencyCalculator(unittest.TestCase):
         self.assertEqual(ProficiencyCalculator.compute_split_level_combined_level(6, 0), 5)
 
 
+def _random_dancer(rng: np.random.Generator) -> Dancer:
+    """A dancer with random points shaped like real ones: each syllabus
+    column (and each style's open column) is pointed out - 7+, or the
+    database's negative marker - up to a random depth, with 0-6 points
+    above that, so every point-out depth (and every rule's floor) turns up
+    regularly rather than almost never."""
+    syllabus_depth = rng.integers(0, 5, size=19)
+    syllabus_pts = np.where(
+        np.arange(4)[:, None] < syllabus_depth[None, :],
+        rng.choice([7, 8, 15, -1], size=(4, 19)),
+        rng.integers(0, 7, size=(4, 19)),
+    )
+    open_depth = rng.integers(0, 4, size=4)
+    open_pts = np.where(
+        np.arange(3)[:, None] < open_depth[None, :],
+        rng.choice([7, 11, -1], size=(3, 4)),
+        rng.integers(0, 7, size=(3, 4)),
+    )
+    first_comp_date = datetime.date(2025, 6, 1) if rng.random() < 0.3 else datetime.date(2020, 1, 1)
+    record = DancerRecord(
+        cda_id=1,
+        first="Random",
+        last="Dancer",
+        first_comp_date=first_comp_date,
+        created_date="2020-01-01",
+        syllabus_pts=syllabus_pts,
+        open_pts=open_pts,
+    )
+    return Dancer.from_data(datetime.date(2026, 1, 1), record)
+
+
+class TestProficiencyTable(unittest.TestCase):
+    """Tests for ProficiencyCalculator.compute_proficiency_table(), checked
+    against compute_proficiency_level() as the reference."""
+
+    def _make_dancer(self, syllabus_pts=None):
+        if syllabus_pts is None:
+            syllabus_pts = np.zeros((4, 19), dtype=int)
+        record = DancerRecord(
+            cda_id=1,
+            first="Test",
+            last="Dancer",
+            first_comp_date=datetime.date(2020, 1, 1),
+            created_date="2020-01-01",
+            syllabus_pts=syllabus_pts,
+            open_pts=np.zeros((3, 4), dtype=int),
+        )
+        return Dancer.from_data(datetime.date(2026, 1, 1), record)
+
+    def test_matches_scalar_rules_for_random_dancers(self):
+        rng = np.random.default_rng(20260101)
+        for trial in range(100):
+            dancer = _random_dancer(rng)
+            table = ProficiencyCalculator.compute_proficiency_table(dancer)
+            for style in Style.points_eligible_styles():
+                for dance_name in constants.DANCE_NAMES[style]:
+                    expected = ProficiencyCalculator.compute_proficiency_level(
+                        dancer, style, dance_name
+                    )
+                    if table.level(style, dance_name) != expected:
+                        self.fail(
+                            f"trial {trial}: {style} {dance_name} table gave "
+                            f"{table.level(style, dance_name)}, scalar gave {expected}\n"
+                            f"{dancer.points.syllabus_data}\n{dancer.points.open_data}"
+                        )
+
+    def test_levels_laid_out_like_syllabus_columns(self):
+        syllabus = np.zeros((4, 19), dtype=int)
+        syllabus[:3, constants.SYLLABUS_COLUMN_OFFSETS[Style.LATIN] + 1] = 7  # Samba to Gold
+        dancer = self._make_dancer(syllabus)
+
+        table = ProficiencyCalculator.compute_proficiency_table(dancer)
+
+        self.assertEqual(table.levels.shape, (19,))
+        self.assertEqual(table.level(Style.LATIN, "Samba"), 3)
+        self.assertEqual(table.levels[constants.SYLLABUS_COLUMN_OFFSETS[Style.LATIN] + 1], 3)
+        self.assertEqual(table.level(Style.LATIN, "Jive"), 1)  # within-style floor: 3 - 2
+
+    def test_max_level_across_event_dances(self):
+        syllabus = np.zeros((4, 19), dtype=int)
+        syllabus[:2, constants.SYLLABUS_COLUMN_OFFSETS[Style.SMOOTH] + 2] = 7  # Foxtrot to Silver
+        dancer = self._make_dancer(syllabus)
+
+        table = ProficiencyCalculator.compute_proficiency_table(dancer)
+
+        self.assertEqual(table.max_level(Style.SMOOTH, ["Waltz", "Foxtrot"]), 2)
+        self.assertEqual(table.max_level(Style.SMOOTH, ["Waltz", "Tango"]), 1)
+
+    def test_nightclub_raises(self):
+        dancer = self._make_dancer()
+        table = ProficiencyCalculator.compute_proficiency_table(dancer)
+
+        with self.assertRaises(ValueError):
+            table.level(Style.NIGHTCLUB, "Salsa")
+
+    def test_levels_are_read_only(self):
+        dancer = self._make_dancer()
+        table = ProficiencyCalculator.compute_proficiency_table(dancer)
+
+        with self.assertRaises(ValueError):
+            table.levels[0] = 5
+
+    def test_table_memoized_until_points_add(self):
+        dancer = self._make_dancer()
+        table = ProficiencyCalculator.compute_proficiency_table(dancer)
+
+        self.assertIs(ProficiencyCalculator.compute_proficiency_table(dancer), table)
+
+        syllabus_delta = np.zeros((4, 19), dtype=int)
+        syllabus_delta[:2, constants.SYLLABUS_COLUMN_OFFSETS[Style.SMOOTH] + 2] = 7
+        dancer.points.add(syllabus_delta, np.zeros((3, 4), dtype=int))
+        updated = ProficiencyCalculator.compute_proficiency_table(dancer)
+
+        self.assertIsNot(updated, table)
+        self.assertEqual(updated.level(Style.SMOOTH, "Foxtrot"), 2)
+
+
 if __name__ == "__main__":
     unittest.main()